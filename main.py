@@ -7,8 +7,7 @@ import os
 from src.clean.clean_raw_data import (
     filter_and_process_raw_json_file,
     create_csv,
-    remove_game_name_duplicate_keep_min_nan_optimized,
-    remove_id_duplicate_keep_min_nan_optimized,
+    remove_duplicates_keep_min_nan,
 )
 
 from src.data_loader import load_processed_file
@@ -25,13 +24,18 @@ def clean_and_convert_raw_data():
         min_price_ps5=1.0,  # Que des jeux payants
         min_price_ps4=-1.0,  # On ne cible que la console ps5 (on veut prédire sur des jeux récents)
         min_price_dlc=-1.0,  # On ne cible que des jeux complet, pas d'extensions
+        streaming=True,  # Lecture jeu par jeu, le fichier brut n'est pas chargé en entier
+        workers=os.cpu_count() or 1,  # Extraction des jeux répartie sur tous les coeurs
+        # Seuls les jeux nouveaux ou modifiés depuis le dernier run sont ré-extraits
+        incremental_store_path=os.path.join(
+            Path.cwd(), "data/processed/games_data_incremental.pkl"
+        ),
     )
 
-    # Remove duplicate id_store
-    df = remove_id_duplicate_keep_min_nan_optimized(df)
-
-    # Remove duplicate game_name
-    df = remove_game_name_duplicate_keep_min_nan_optimized(df)
+    # Remove duplicate id_store puis game_name (ligne la plus complète gardée)
+    df, removed_counts = remove_duplicates_keep_min_nan(df, ["id_store", "game_name"])
+    for key, count in removed_counts.items():
+        print(f"Doublons {key} supprimés: {count}")
 
     print(f"DataFrame créé avec {len(df)} lignes et {len(df.columns)} colonnes")
     # Afficher un aperçu
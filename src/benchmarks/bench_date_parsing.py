@@ -0,0 +1,67 @@
+import argparse
+import time
+
+from src.benchmarks.synthetic_catalogue import iter_raw_catalogue
+from src.clean import clean_raw_data_helper
+from src.clean.clean_raw_data_helper import (
+    days_until_first_discount,
+    days_until_first_sales_record,
+    get_base_price,
+    get_release_date,
+    get_sales_history,
+)
+
+# Microbenchmark du parsing des dates "x" des historiques :
+# nombre de parsings par jeu et temps gagné par le cache des numéros de jour
+# Lancer : python -m src.benchmarks.bench_date_parsing
+
+
+def process_histories(games):
+    # Même enchaînement que l'extraction : fusion, premier record, 4 seuils
+    for data in games:
+        release_date = get_release_date(data)
+        base_price = get_base_price(data)
+        sales_history = get_sales_history(data)
+        if release_date is None:
+            continue
+        days_until_first_sales_record(sales_history, release_date)
+        for threshold in [10, 25, 50, 75]:
+            days_until_first_discount(
+                sales_history, base_price, release_date, threshold
+            )
+
+
+def timed(games):
+    start = time.perf_counter()
+    process_histories(games)
+    return time.perf_counter() - start
+
+
+def run(n_games):
+    games = [data for game in iter_raw_catalogue(n_games) for data in game.values()]
+    cached_parser = clean_raw_data_helper.parse_day_number_cached
+
+    # Sans cache : chaque demande de parsing appelle strptime
+    clean_raw_data_helper.parse_day_number_cached = cached_parser.__wrapped__
+    try:
+        time_uncached = timed(games)
+    finally:
+        clean_raw_data_helper.parse_day_number_cached = cached_parser
+
+    cached_parser.cache_clear()
+    time_cached = timed(games)
+    info = cached_parser.cache_info()
+    requests = info.hits + info.misses
+
+    print(f"{n_games} jeux")
+    print(f"demandes de parsing par jeu : {requests / n_games:8.1f}")
+    print(f"strptime par jeu avec cache : {info.misses / n_games:8.2f}")
+    print(f"sans cache : {time_uncached:7.3f}s")
+    print(f"avec cache : {time_cached:7.3f}s ({time_uncached / time_cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.games)
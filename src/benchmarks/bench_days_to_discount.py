@@ -0,0 +1,80 @@
+from datetime import datetime
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from src.benchmarks.synthetic_catalogue import write_raw_catalogue
+from src.clean.clean_raw_data import filter_and_process_raw_json_file
+from src.clean.clean_raw_data_helper import (
+    add_days_to_discount_columns,
+    days_until_first_discount,
+)
+
+# Benchmark days_to_X_percent_discount : df.apply par seuil vs moteur vectorisé
+# Lancer : python -m src.benchmarks.bench_days_to_discount
+
+PROMOS = [10, 25, 33, 50, 75]
+
+
+def days_to_discount_apply(df: pd.DataFrame):
+    # Chemin du notebook 2 : json.loads puis un df.apply(axis=1) par seuil
+    df_result = df.copy()
+    histories = df_result["price_history"].apply(
+        lambda x: json.loads(x) if isinstance(x, str) else []
+    )
+    for promo in PROMOS:
+        df_result[f"days_to_{promo}_percent_discount"] = pd.array(
+            [
+                days_until_first_discount(history, base_price, release_date, promo)
+                for history, base_price, release_date in zip(
+                    histories, df_result["base_price"], df_result["release_date"]
+                )
+            ],
+            dtype="Int64",
+        )
+    return df_result
+
+
+def run(n_games):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "catalogue.json")
+        write_raw_catalogue(file_path, n_games)
+        with contextlib.redirect_stdout(io.StringIO()):
+            df = filter_and_process_raw_json_file(
+                file_path,
+                released_date_filter=datetime(2020, 11, 10),
+                min_price_ps5=1.0,
+                min_price_ps4=-1.0,
+                min_price_dlc=-1.0,
+            )
+    # Mêmes entrées que le notebook : dates lues depuis le CSV
+    df["release_date"] = df["release_date"].dt.strftime("%Y-%m-%d")
+
+    start = time.perf_counter()
+    df_apply = days_to_discount_apply(df)
+    time_apply = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df_batch = add_days_to_discount_columns(df, PROMOS)
+    time_batch = time.perf_counter() - start
+
+    cols = [f"days_to_{promo}_percent_discount" for promo in PROMOS]
+    identical = df_apply[cols].equals(df_batch[cols])
+
+    print(f"{len(df)} jeux, seuils {PROMOS}")
+    print(f"apply par seuil : {time_apply:7.3f}s")
+    print(f"vectorisé       : {time_batch:7.3f}s ({time_apply / time_batch:.1f}x)")
+    print(f"résultats identiques : {identical}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.games)
@@ -0,0 +1,70 @@
+import argparse
+import random
+import time
+
+from src.clean.clean_raw_data_helper import FIELD_EXTRACTORS, FIELD_SOURCES
+from src.clean.field_registry import MISSING
+
+# Benchmark du registre de champs : chaînes try/except vs extracteurs dict.get
+# sur des jeux où la plupart des sources sont absentes
+# Lancer : python -m src.benchmarks.bench_field_extraction
+
+
+def reference_extract(data, spec):
+    # Version précédente : data[source][clé] dans un try/except par source
+    coerce = spec.get("coerce")
+    for source_key, field_key in spec["sources"]:
+        try:
+            value = data[source_key][field_key]
+        except Exception:
+            continue
+        if coerce is not None:
+            value = coerce(value)
+            if value is MISSING:
+                continue
+        return value
+    return spec.get("default")
+
+
+def make_sparse_game(rng, present_ratio):
+    # Chaque champ n'est renseigné que dans une fraction des sources
+    data = {"PSStore": {}, "GGDeals": {}, "PlatPrices": {}}
+    for spec in FIELD_SOURCES.values():
+        for source_key, field_key in spec["sources"]:
+            if rng.random() < present_ratio:
+                data[source_key][field_key] = "1"
+    # Sources entièrement absentes, fréquentes dans le brut
+    for source_key in ["GGDeals", "PlatPrices"]:
+        if rng.random() < 0.5:
+            del data[source_key]
+    return data
+
+
+def run(n_games, present_ratio):
+    rng = random.Random(0)
+    games = [make_sparse_game(rng, present_ratio) for _ in range(n_games)]
+    specs = list(FIELD_SOURCES.items())
+
+    start = time.perf_counter()
+    reference_rows = [
+        [reference_extract(data, spec) for _, spec in specs] for data in games
+    ]
+    time_reference = time.perf_counter() - start
+
+    extractors = [FIELD_EXTRACTORS[name] for name, _ in specs]
+    start = time.perf_counter()
+    rows = [[extract(data) for extract in extractors] for data in games]
+    time_registry = time.perf_counter() - start
+
+    print(f"{n_games} jeux, {len(specs)} champs, {present_ratio:.0%} des sources")
+    print(f"try/except : {time_reference:7.3f}s")
+    print(f"dict.get   : {time_registry:7.3f}s ({time_reference / time_registry:.1f}x)")
+    print(f"résultats identiques : {rows == reference_rows}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--present-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+    run(args.games, args.present_ratio)
@@ -0,0 +1,109 @@
+from datetime import datetime
+import argparse
+import contextlib
+import io
+import time
+
+from src.benchmarks.synthetic_catalogue import iter_raw_catalogue
+from src.clean import clean_raw_data
+from src.clean.clean_raw_data_helper import (
+    RawGameContext,
+    get_base_price,
+    get_min_price_from_sales_history,
+    get_rating_pegi_esrb,
+    get_release_date,
+    get_sales_history,
+)
+
+# Extraction en deux phases (filtres puis extracteurs coûteux) vs extraction
+# complète avant filtrage, sur un catalogue majoritairement filtré (PS4 et DLC)
+# Lancer : python -m src.benchmarks.bench_filter_first --games 20000
+
+# 10% de jeux PS5, le reste est rejeté par les filtres PS4 / DLC
+FILTERED_REQUESTS = ["games_ps5"] + ["games_ps4"] * 5 + ["dlcs_ps5"] * 4
+
+# Cible PS5 uniquement, comme run_clean_and_convert_raw_data
+EXTRACT_PARAMS = {
+    "released_date_filter": datetime(2020, 11, 10),
+    "min_price_ps5": 1.0,
+    "min_price_ps4": 1000,
+    "min_price_dlc": 1000,
+}
+
+
+def process_raw_game_extract_first(
+    game_key,
+    data,
+    released_date_filter,
+    min_price_ps5,
+    min_price_ps4,
+    min_price_dlc,
+):
+    # Ordre d'avant : toutes les features sont extraites, puis les filtres appliqués
+    context = RawGameContext(data)
+    request = data["Request"]
+    sales_history = get_sales_history(data, context)
+    pegi_rating, esrb_rating, rating_desc = get_rating_pegi_esrb(data)
+    fields = {
+        "is_ps5_li": request == "games_ps5",
+        "is_ps4_li": request == "games_ps4",
+        "is_dlc_li": request == "dlcs_ps5",
+        "release_date": get_release_date(data),
+        "base_price": get_base_price(data, context),
+        "pegi_rating": pegi_rating,
+        "esrb_rating": esrb_rating,
+        "rating_desc": rating_desc,
+        "sales_history": sales_history,
+        "lowest_price": get_min_price_from_sales_history(sales_history),
+    }
+    row_data = clean_raw_data.extract_game_row(game_key, data, context, fields)
+
+    filtered = clean_raw_data.filter_raw_game(
+        data,
+        context,
+        released_date_filter,
+        min_price_ps5,
+        min_price_ps4,
+        min_price_dlc,
+    )
+    if filtered is None:
+        return None
+    # Prix corrigés par les filtres (vérification GGDeals, prix négatifs)
+    row_data["base_price"] = filtered["base_price"]
+    row_data["lowest_price"] = filtered["lowest_price"]
+    return row_data
+
+
+def extract_rows(games):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        rows = list(clean_raw_data.iter_extracted_rows(games, **EXTRACT_PARAMS))
+        return rows, time.perf_counter() - start
+
+
+def run(n_games):
+    games = list(iter_raw_catalogue(n_games, options={"requests": FILTERED_REQUESTS}))
+
+    process_raw_game = clean_raw_data.process_raw_game
+    clean_raw_data.process_raw_game = process_raw_game_extract_first
+    try:
+        rows_eager, time_eager = extract_rows(games)
+    finally:
+        clean_raw_data.process_raw_game = process_raw_game
+
+    rows_lazy, time_lazy = extract_rows(games)
+
+    print(f"{n_games} jeux, {len(rows_lazy)} gardés après filtres")
+    print(f"extraction puis filtres : {time_eager:7.3f}s")
+    print(
+        f"filtres puis extraction : {time_lazy:7.3f}s"
+        f" ({time_eager / time_lazy:.2f}x)"
+    )
+    print(f"sortie identique : {rows_eager == rows_lazy}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.games)
@@ -0,0 +1,61 @@
+from datetime import datetime
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from src.benchmarks.synthetic_catalogue import write_raw_catalogue
+from src.clean.clean_raw_data import filter_and_process_raw_json_file
+
+# Benchmark de l'extraction parallèle (ProcessPoolExecutor) : 1/2/4/8 workers
+# Lancer : python -m src.benchmarks.bench_parallel_extraction
+
+
+def clean_file(file_path, workers):
+    # Les statistiques publishers sont affichées à chaque run : on les masque
+    with contextlib.redirect_stdout(io.StringIO()):
+        return filter_and_process_raw_json_file(
+            file_path,
+            released_date_filter=datetime(2020, 11, 10),
+            min_price_ps5=1.0,
+            min_price_ps4=-1.0,
+            min_price_dlc=-1.0,
+            streaming=True,
+            workers=workers,
+        )
+
+
+def run(n_games, workers_list):
+    print(f"{n_games} jeux, {os.cpu_count()} coeurs disponibles")
+    print(f"{'workers':>8} | {'durée':>8} | {'speedup':>8} | sortie identique")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "catalogue.json")
+        write_raw_catalogue(file_path, n_games)
+
+        reference_csv = None
+        reference_time = None
+        for workers in workers_list:
+            start = time.perf_counter()
+            df = clean_file(file_path, workers)
+            elapsed = time.perf_counter() - start
+
+            csv_bytes = df.to_csv(index=False).encode("utf-8")
+            if reference_csv is None:
+                reference_csv = csv_bytes
+                reference_time = elapsed
+
+            print(
+                f"{workers:>8} | {elapsed:7.2f}s | {reference_time / elapsed:7.2f}x"
+                f" | {csv_bytes == reference_csv}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+    run(args.games, args.workers)
@@ -0,0 +1,80 @@
+from datetime import datetime
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from src.benchmarks.synthetic_catalogue import write_raw_catalogue
+from src.clean.clean_raw_data import filter_and_process_raw_json_file
+from src.clean.price_panel import write_price_panel
+from src.constants.constants import DISCOUNT_HELPER, PROMOS
+from src.features.feature_transforms import (
+    compute_discount_targets,
+    compute_discount_targets_from_panel,
+)
+
+# Benchmark des targets de réduction : historiques à plat (compute_discount_targets)
+# vs panel dense des prix journaliers en mmap (compute_discount_targets_from_panel)
+# Lancer : python -m src.benchmarks.bench_price_panel --games 20000
+
+# Fenêtres supplémentaires : le panel est construit une fois pour toutes
+EXTRA_DISCOUNTS = [
+    {"days_from_release": days, "percent_discount": percent}
+    for days in [7, 14, 90, 180, 365]
+    for percent in [5, 10, 25]
+]
+
+
+def run(n_games):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "catalogue.json")
+        write_raw_catalogue(file_path, n_games)
+        with contextlib.redirect_stdout(io.StringIO()):
+            df = filter_and_process_raw_json_file(
+                file_path,
+                released_date_filter=datetime(2020, 11, 10),
+                min_price_ps5=1.0,
+                min_price_ps4=-1.0,
+                min_price_dlc=-1.0,
+            )
+
+        start = time.perf_counter()
+        panel = write_price_panel(df, os.path.join(tmp_dir, "panel.npy"))
+        time_build = time.perf_counter() - start
+
+        for label, early_discounts in [
+            ("targets du notebook", DISCOUNT_HELPER),
+            ("targets + 15 fenêtres", DISCOUNT_HELPER + EXTRA_DISCOUNTS),
+        ]:
+            start = time.perf_counter()
+            df_flat = compute_discount_targets(df, PROMOS, early_discounts)
+            time_flat = time.perf_counter() - start
+
+            start = time.perf_counter()
+            df_panel = compute_discount_targets_from_panel(
+                df, panel, PROMOS, early_discounts
+            )
+            time_panel = time.perf_counter() - start
+
+            print(f"\n{label} ({len(df_flat.columns)} colonnes)")
+            print(f"historiques à plat : {time_flat:7.3f}s")
+            print(
+                f"panel (requêtes)   : {time_panel:7.3f}s"
+                f" ({time_flat / time_panel:.1f}x)"
+            )
+            print(f"résultats identiques : {df_flat.equals(df_panel)}")
+
+        print(
+            f"\n{len(df)} jeux, panel {panel.shape[0]} x {panel.shape[1]} jours"
+            f" ({panel.nbytes / 1e6:.0f} Mo), construit en {time_build:.3f}s"
+        )
+        del panel
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.games)
@@ -0,0 +1,105 @@
+import argparse
+import contextlib
+import io
+import random
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.clean.clean_raw_data_helper import (
+    CORPORATE_SUFFIXES,
+    clean_and_merge_publishers,
+    clean_publisher_name,
+    clean_publisher_name_cached,
+)
+
+# Benchmark du nettoyage des publishers sur une colonne synthétique
+# (1M lignes, 5k publishers distincts par défaut)
+# Lancer : python -m src.benchmarks.bench_publisher_cleaning
+
+SUFFIXES_SAMPLES = [
+    "",
+    " Inc.",
+    " Ltd",
+    " Co., Ltd.",
+    " GmbH",
+    " S.A.",
+    " SAS",
+    " Sp. z o.o.",
+    " LLC",
+    " Europe",
+    " Japan Co.,",
+    " Games (EU)",
+]
+
+
+def reference_clean_publisher_name(name):
+    # Version précédente : motifs reconstruits et appliqués ligne par ligne
+    if pd.isna(name):
+        return name
+    name = str(name).strip()
+    name = re.sub(r"^[^\w]+|[^\w]+$", "", name, flags=re.UNICODE)
+    for _ in range(3):
+        original = name
+        for suffix_pattern in CORPORATE_SUFFIXES:
+            name = re.sub(suffix_pattern + r"$", "", name, flags=re.IGNORECASE).strip()
+        if name == original:
+            break
+    name = name.rstrip(",").strip()
+    name = re.sub(r"\s+", " ", name)
+    name = re.sub(r"\s*\([^)]*\)\s*$", "", name).strip()
+    name = name.rstrip(",").strip()
+    name = name.lower()
+    return name.strip().rstrip(",").strip()
+
+
+def make_publishers_column(n_rows, n_distinct, seed=0):
+    rng = random.Random(seed)
+    distinct = [
+        f"Studio {index}{rng.choice(SUFFIXES_SAMPLES)}" for index in range(n_distinct)
+    ]
+    values = np.array(distinct, dtype=object)[
+        np.random.default_rng(seed).integers(0, n_distinct, n_rows)
+    ]
+    # Quelques valeurs manquantes comme dans le dataset
+    values[::97] = None
+    return pd.DataFrame({"publisher": values}), distinct
+
+
+def run(n_rows, n_distinct, reference_rows):
+    df, distinct = make_publishers_column(n_rows, n_distinct)
+
+    # Résultats identiques à la version précédente sur tous les publishers
+    identical = all(
+        reference_clean_publisher_name(name) == clean_publisher_name(name)
+        for name in distinct
+    )
+
+    sample = df["publisher"].iloc[:reference_rows]
+    start = time.perf_counter()
+    sample.apply(reference_clean_publisher_name)
+    time_reference = (time.perf_counter() - start) * n_rows / len(sample)
+
+    clean_publisher_name_cached.cache_clear()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        clean_and_merge_publishers(df, "publisher")
+    time_new = time.perf_counter() - start
+
+    print(f"{n_rows} lignes, {n_distinct} publishers distincts")
+    print(f"apply ligne par ligne : {time_reference:8.2f}s (extrapolé)")
+    print(
+        f"valeurs distinctes    : {time_new:8.2f}s ({time_reference / time_new:.0f}x)"
+    )
+    print(f"nettoyage identique   : {identical}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=5000)
+    parser.add_argument("--reference-rows", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.rows, args.distinct, args.reference_rows)
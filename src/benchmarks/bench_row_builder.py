@@ -0,0 +1,92 @@
+import argparse
+import contextlib
+import io
+
+import pandas as pd
+
+from src.benchmarks.bench_stages import EXTRACT_PARAMS
+from src.benchmarks.bench_streaming_ingestion import measure_peak
+from src.benchmarks.synthetic_catalogue import iter_raw_catalogue
+from src.clean.clean_raw_data import iter_extracted_rows
+from src.clean.column_builder import GameColumnBuilder
+from src.games_schema import UINT64_COLUMNS, apply_games_schema
+
+# Construction du DataFrame du nettoyage : liste de dicts -> pd.DataFrame -> casts
+# (chemin d'avant) vs GameColumnBuilder (buffers typés par colonne)
+# Lancer : python -m src.benchmarks.bench_row_builder --games 100000
+
+# Colonnes converties une à une par l'ancien build_games_dataframe
+COL_TO_INT_NULLABLE = [
+    "trophies_count",
+    "local_multiplayer_max_players",
+    "online_multiplayer_max_players",
+    "difficulty",
+    "download_size",
+    "hours_main_story",
+    "hours_completionist",
+    "metacritic_critic_score",
+    "metacritic_critic_userscore",
+    "pegi_rating",
+]
+
+
+def build_from_dicts(rows):
+    data_list = []
+    for row_data in rows:
+        data_list.append(row_data)
+
+    df = pd.DataFrame(data_list)
+    for col in COL_TO_INT_NULLABLE:
+        df[col] = df[col].astype("Int64")
+    for col in UINT64_COLUMNS:
+        df[col] = df[col].astype("uint64")
+    return df
+
+
+def build_from_columns(rows):
+    builder = GameColumnBuilder()
+    for row_data in rows:
+        builder.append(row_data)
+    return builder.to_dataframe()
+
+
+def run(n_games, repeat):
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = list(iter_extracted_rows(iter_raw_catalogue(n_games), **EXTRACT_PARAMS))
+    # Les lignes sont dupliquées pour atteindre la taille voulue sans ré-extraire
+    rows = rows * repeat
+    print(f"{len(rows)} lignes de {len(rows[0])} colonnes")
+
+    outputs = {}
+    results = {}
+    for name, func in [
+        ("liste de dicts", build_from_dicts),
+        ("colonnes typées", build_from_columns),
+    ]:
+        # Chaque ligne est un nouveau dict, comme à la sortie de l'extraction
+        results[name] = measure_peak(
+            lambda: outputs.__setitem__(name, func(dict(row) for row in rows))
+        )
+
+    print(f"{'':16s} | {'durée':>8} | {'pic mémoire':>11} | {'DataFrame':>9}")
+    reference_time = results["liste de dicts"][0]
+    for name, (elapsed, peak_mb) in results.items():
+        frame_mb = outputs[name].memory_usage(deep=True).sum() / (1024 * 1024)
+        print(
+            f"{name:16s} | {elapsed:7.2f}s | {peak_mb:9.1f}Mo | {frame_mb:7.1f}Mo"
+            f" ({reference_time / elapsed:.2f}x)"
+        )
+
+    # Mêmes données, aux types du schéma près (Int64 pour tous les entiers)
+    same = apply_games_schema(outputs["liste de dicts"]).equals(
+        apply_games_schema(outputs["colonnes typées"])
+    )
+    print(f"sortie identique : {same}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    run(args.games, args.repeat)
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+import argparse
+import random
+import time
+
+from src.clean.clean_raw_data_helper import (
+    is_valid_date,
+    merge_and_clean_sales_histories,
+    merge_sales_histories,
+    parse_day_number_cached,
+)
+
+# Fusion des historiques GGDeals / PlatPrices : concaténation + dict + tri
+# (version d'avant) vs validation par source et fusion linéaire
+# Lancer : python -m src.benchmarks.bench_sales_history_merge --points 1000 5000
+
+
+def merge_with_sort(history1, history2):
+    # Version d'avant : concaténation, dédoublonnage par dict, tri complet
+    merged = {}
+
+    def process_entry(entry):
+        date = entry.get("x", "")
+        price = entry.get("y", -1)
+        if isinstance(price, str):
+            try:
+                price = float(price)
+            except ValueError:
+                return None
+        if is_valid_date(date) and price > 0:
+            return date, price
+        return None
+
+    for entry in history1 + history2:
+        result = process_entry(entry)
+        if result:
+            date, price = result
+            merged[date] = price
+
+    result = [{"x": date, "y": price} for date, price in merged.items()]
+    result.sort(key=lambda item: parse_day_number_cached(item["x"]))
+    return result
+
+
+def generate_histories(rng: random.Random, n_points: int):
+    """Historiques journaliers triés, PlatPrices recouvre une partie de GGDeals."""
+    start = datetime(2025, 10, 1) - timedelta(days=n_points)
+    base_price = rng.choice([19.99, 39.99, 69.99])
+    ggdeals = []
+    platprices = []
+    for day in range(n_points):
+        date = (start + timedelta(days=day)).strftime("%Y-%m-%d")
+        price = round(base_price * rng.choice([1.0, 0.9, 0.75, 0.5]), 2)
+        ggdeals.append({"x": date, "y": price})
+        if day % 3 == 0:
+            # Prix PlatPrices parfois au format texte
+            platprices.append({"x": date, "y": str(price) if day % 2 else price})
+    return ggdeals, platprices
+
+
+def timed(func, games):
+    start = time.perf_counter()
+    for ggdeals, platprices in games:
+        func(ggdeals, platprices)
+    return time.perf_counter() - start
+
+
+def run(points_list, n_games):
+    rng = random.Random(0)
+    print(
+        f"{'points':>7} | {'dict + tri':>10} | {'fusion (dicts)':>15}"
+        f" | {'fusion (arrays)':>16} | identique"
+    )
+    for n_points in points_list:
+        games = [generate_histories(rng, n_points) for _ in range(n_games)]
+        # Dates déjà en cache pour toutes les versions
+        timed(merge_with_sort, games)
+
+        time_sort = timed(merge_with_sort, games)
+        time_merge = timed(merge_and_clean_sales_histories, games)
+        time_arrays = timed(merge_sales_histories, games)
+        same = all(
+            merge_with_sort(*histories) == merge_and_clean_sales_histories(*histories)
+            for histories in games
+        )
+        print(
+            f"{n_points:>7} | {time_sort:9.3f}s"
+            f" | {time_merge:8.3f}s ({time_sort / time_merge:.1f}x)"
+            f" | {time_arrays:9.3f}s ({time_sort / time_arrays:.1f}x) | {same}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, nargs="+", default=[20, 1000, 5000])
+    parser.add_argument("--games", type=int, default=200)
+    args = parser.parse_args()
+    run(args.points, args.games)
@@ -0,0 +1,171 @@
+from datetime import datetime
+from pathlib import Path
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import tempfile
+
+from src.benchmarks.bench_streaming_ingestion import measure_peak
+from src.benchmarks.synthetic_catalogue import write_raw_catalogue
+from src.clean.clean_raw_data import (
+    build_games_dataframe,
+    iter_extracted_rows,
+    remove_duplicates_keep_min_nan,
+)
+from src.clean.clean_raw_data_helper import clean_and_merge_publishers
+from src.data_loader import read_processed_csv
+
+# Temps et pic mémoire de chaque étape du nettoyage sur un catalogue synthétique
+# (chargement JSON, extraction, DataFrame, publishers, doublons, écriture CSV, relecture)
+# Lancer : python -m src.benchmarks.bench_stages --sizes 10000 100000 1000000
+# Les résultats sont écrits en JSON ; --compare ancien.json affiche l'écart par étape
+
+BENCH_RESULTS_DIR = "data/benchmarks"
+
+EXTRACT_PARAMS = {
+    "released_date_filter": datetime(2020, 10, 10),
+    "min_price_ps5": 4.9,
+    "min_price_ps4": 18.9,
+    "min_price_dlc": 14.9,
+}
+
+
+def load_json(file_path):
+    with open(file_path, "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def clean_publishers(df):
+    # Les statistiques du nettoyage sont affichées : on les masque
+    with contextlib.redirect_stdout(io.StringIO()):
+        return clean_and_merge_publishers(df, "publisher")
+
+
+def run_stages(file_path, csv_path):
+    """
+    Enchaîne les étapes, chacune reçoit la sortie de la précédente.
+    Retourne [(étape, durée en s, pic mémoire en Mo)].
+    """
+    stages = [
+        ("json_load", lambda _: load_json(file_path)),
+        (
+            "extraction",
+            lambda games: list(iter_extracted_rows(games, **EXTRACT_PARAMS)),
+        ),
+        ("dataframe", lambda rows: build_games_dataframe(rows, clean_publishers=False)),
+        ("publisher_cleaning", clean_publishers),
+        (
+            "dedup",
+            lambda df: remove_duplicates_keep_min_nan(df, ["id_store", "game_name"])[0],
+        ),
+        ("csv_write", lambda df: df.to_csv(csv_path, index=False, encoding="utf-8")),
+        ("csv_load", lambda _: read_processed_csv(csv_path)),
+    ]
+
+    results = []
+    previous = None
+    for name, func in stages:
+        outputs = []
+        elapsed, peak_mb = measure_peak(lambda: outputs.append(func(previous)))
+        # Seule la sortie de l'étape en cours est gardée en mémoire
+        previous = outputs[0]
+        results.append((name, elapsed, peak_mb))
+
+    return results
+
+
+def compare_results(results, previous_path):
+    with open(previous_path, "r", encoding="utf-8") as fp:
+        previous = {
+            (entry["games"], entry["stage"]): entry
+            for entry in json.load(fp)["results"]
+        }
+
+    print(f"\nComparaison avec {previous_path}")
+    print(f"{'jeux':>8} {'étape':20s} | {'durée':>8} | {'mémoire':>8}")
+    for entry in results:
+        old = previous.get((entry["games"], entry["stage"]))
+        if old is None:
+            continue
+        time_ratio = entry["seconds"] / max(old["seconds"], 1e-9)
+        memory_ratio = entry["peak_mb"] / max(old["peak_mb"], 1e-9)
+        print(
+            f"{entry['games']:>8} {entry['stage']:20s} | "
+            f"{time_ratio:7.2f}x | {memory_ratio:7.2f}x"
+        )
+
+
+def run(sizes, options, output_path=None, compare_path=None):
+    results = []
+    print(f"{'jeux':>8} {'étape':20s} | {'durée':>9} | {'pic mémoire':>11}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_games in sizes:
+            file_path = os.path.join(tmp_dir, f"catalogue_{n_games}.json")
+            csv_path = os.path.join(tmp_dir, f"games_data_{n_games}.csv")
+            write_raw_catalogue(file_path, n_games, options=options)
+
+            for stage, elapsed, peak_mb in run_stages(file_path, csv_path):
+                print(f"{n_games:>8} {stage:20s} | {elapsed:8.2f}s | {peak_mb:8.1f}Mo")
+                results.append(
+                    {
+                        "games": n_games,
+                        "stage": stage,
+                        "seconds": elapsed,
+                        "peak_mb": peak_mb,
+                    }
+                )
+            os.remove(file_path)
+
+    if output_path is None:
+        run_name = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = os.path.join(
+            Path.cwd(), BENCH_RESULTS_DIR, f"bench_stages_{run_name}.json"
+        )
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as fp:
+        json.dump(
+            {
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "cpu_count": os.cpu_count(),
+                "options": options,
+                "results": results,
+            },
+            fp,
+            indent=2,
+        )
+    print(f"Résultats écrits dans {output_path}")
+
+    if compare_path is not None:
+        compare_results(results, compare_path)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10000, 100000, 1000000]
+    )
+    parser.add_argument("--history-length", type=int, nargs=2, default=[3, 30])
+    parser.add_argument(
+        "--missing-ratio",
+        type=float,
+        default=0.0,
+        help="part des jeux sans sous-document GGDeals / PlatPrices",
+    )
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--compare", default=None)
+    args = parser.parse_args()
+    catalogue_options = {
+        "history_length": tuple(args.history_length),
+        "missing_source_ratios": {
+            "GGDeals": args.missing_ratio,
+            "PlatPrices": args.missing_ratio,
+        },
+    }
+    run(args.sizes, catalogue_options, args.output, args.compare)
@@ -0,0 +1,81 @@
+from datetime import datetime
+from pathlib import Path
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.benchmarks.synthetic_catalogue import write_raw_catalogue
+from src.clean.clean_raw_data import filter_and_process_raw_json_file
+from src.clean.raw_json_reader import iter_raw_json_array
+
+# Benchmark mémoire : json.load complet vs lecture incrémentale du tableau brut
+# Lancer : python -m src.benchmarks.bench_streaming_ingestion
+
+
+def measure_peak(func):
+    """Retourne (durée en s, pic mémoire en Mo) de func()."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def load_full(file_path):
+    with open(file_path, "r", encoding="utf-8") as fp:
+        count = sum(len(game) for game in json.load(fp))
+    return count
+
+
+def load_streaming(file_path):
+    with open(file_path, "r", encoding="utf-8") as fp:
+        count = sum(len(game) for game in iter_raw_json_array(fp))
+    return count
+
+
+def clean_file(file_path, streaming):
+    return filter_and_process_raw_json_file(
+        file_path,
+        released_date_filter=datetime(2020, 11, 10),
+        min_price_ps5=1.0,
+        min_price_ps4=-1.0,
+        min_price_dlc=-1.0,
+        streaming=streaming,
+    )
+
+
+def run(sizes):
+    print(
+        f"{'jeux':>8} {'taille Mo':>10} | {'json.load':>18} | {'streaming':>18}"
+        f" | {'clean complet':>18} | {'clean streaming':>18}"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_games in sizes:
+            file_path = os.path.join(tmp_dir, f"catalogue_{n_games}.json")
+            write_raw_catalogue(file_path, n_games)
+            size_mb = Path(file_path).stat().st_size / (1024 * 1024)
+
+            results = [
+                measure_peak(lambda: load_full(file_path)),
+                measure_peak(lambda: load_streaming(file_path)),
+                measure_peak(lambda: clean_file(file_path, streaming=False)),
+                measure_peak(lambda: clean_file(file_path, streaming=True)),
+            ]
+            cells = " | ".join(
+                f"{elapsed:7.2f}s {peak:7.1f}Mo" for elapsed, peak in results
+            )
+            print(f"{n_games:>8} {size_mb:>10.1f} | {cells}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[2000, 4000, 8000, 16000]
+    )
+    args = parser.parse_args()
+    run(args.sizes)
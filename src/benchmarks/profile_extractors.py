@@ -0,0 +1,74 @@
+from datetime import datetime
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from src.benchmarks.synthetic_catalogue import write_raw_catalogue
+from src.clean.clean_raw_data import filter_and_process_raw_json_file
+from src.clean.extraction_profiler import disable_profiling, enable_profiling
+
+# Rapport de profilage par extracteur et par étape sur un catalogue synthétique,
+# et surcoût de l'instrumentation (désactivée / temps seuls / avec exceptions)
+# Lancer : python -m src.benchmarks.profile_extractors --games 20000 --report profil.json
+
+
+def clean_file(file_path, **kwargs):
+    return filter_and_process_raw_json_file(
+        file_path,
+        released_date_filter=datetime(2020, 11, 10),
+        min_price_ps5=1.0,
+        min_price_ps4=-1.0,
+        min_price_dlc=-1.0,
+        **kwargs,
+    )
+
+
+def timed(file_path, **kwargs):
+    # Les statistiques du nettoyage et le rapport sont masqués
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        clean_file(file_path, **kwargs)
+        return time.perf_counter() - start
+
+
+def run(n_games, report_path=None):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, f"catalogue_{n_games}.json")
+        write_raw_catalogue(file_path, n_games)
+
+        time_disabled = timed(file_path)
+
+        enable_profiling(count_exceptions=False)
+        try:
+            time_timing_only = timed(file_path)
+        finally:
+            disable_profiling()
+
+        time_profiled = timed(file_path, profile=True)
+
+        # Rapport complet affiché
+        clean_file(file_path, profile=True, profile_report_path=report_path)
+
+    print(f"\n{n_games} jeux")
+    print(f"profilage désactivé  : {time_disabled:7.3f}s")
+    print(
+        f"temps seuls          : {time_timing_only:7.3f}s"
+        f" ({time_timing_only / time_disabled:.2f}x)"
+    )
+    print(
+        f"temps et exceptions  : {time_profiled:7.3f}s"
+        f" ({time_profiled / time_disabled:.2f}x)"
+    )
+    if report_path is not None:
+        print(f"Rapport JSON écrit dans {report_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--report", default=None)
+    args = parser.parse_args()
+    run(args.games, args.report)
@@ -0,0 +1,94 @@
+from datetime import datetime
+import argparse
+import contextlib
+import cProfile
+import io
+import pstats
+import time
+
+from src.benchmarks.synthetic_catalogue import iter_raw_catalogue
+from src.clean import clean_raw_data
+from src.clean.clean_raw_data_helper import RawGameContext
+
+# Profil de l'extraction avec et sans contexte partagé par jeu :
+# nombre de calculs par jeu des vues dérivées (date futur, notices, tags, historiques)
+# Lancer : python -m src.benchmarks.profile_game_context
+
+PROFILED_FUNCTIONS = [
+    "check_released_date_is_futur",
+    "psstore_notices",
+    "ggdeals_tags",
+    "ggdeals_tags_list",
+    "ggdeals_sales_history",
+    "platprices_sales_history",
+    "get_max_price_from_sales_histroy",
+    "merge_and_clean_sales_histories",
+]
+
+
+class UnsharedContext:
+    # Chaque accès recalcule la vue, comme les extracteurs indépendants d'avant
+    def __init__(self, data):
+        self.data = data
+
+    def __getattr__(self, name):
+        return getattr(RawGameContext(self.data), name)
+
+
+def extract_all(games):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for game in games:
+            for game_key, data in game.items():
+                clean_raw_data.process_raw_game(
+                    game_key, data, datetime(2020, 11, 10), 1.0, -1.0, -1.0
+                )
+
+
+def profile_calls(games):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    extract_all(games)
+    profiler.disable()
+
+    calls = {name: 0 for name in PROFILED_FUNCTIONS}
+    for (_, _, func_name), stat in pstats.Stats(profiler).stats.items():
+        if func_name in calls:
+            calls[func_name] += stat[1]
+    return calls
+
+
+def timed(games):
+    start = time.perf_counter()
+    extract_all(games)
+    return time.perf_counter() - start
+
+
+def run(n_games):
+    games = list(iter_raw_catalogue(n_games))
+
+    clean_raw_data.RawGameContext = UnsharedContext
+    try:
+        calls_unshared = profile_calls(games)
+        time_unshared = timed(games)
+    finally:
+        clean_raw_data.RawGameContext = RawGameContext
+
+    calls_shared = profile_calls(games)
+    time_shared = timed(games)
+
+    print(f"{n_games} jeux, calculs par jeu")
+    print(f"{'':34s} {'sans partage':>12s} {'contexte':>9s}")
+    for name in PROFILED_FUNCTIONS:
+        print(
+            f"{name:34s} {calls_unshared[name] / n_games:12.2f}"
+            f" {calls_shared[name] / n_games:9.2f}"
+        )
+    print(f"sans partage : {time_unshared:7.3f}s")
+    print(f"contexte     : {time_shared:7.3f}s ({time_unshared / time_shared:.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--games", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.games)
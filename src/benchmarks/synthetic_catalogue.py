@@ -0,0 +1,185 @@
+from datetime import datetime, timedelta
+import json
+import random
+
+# Générateur déterministe de catalogue brut au format data/raw/psstore_all_games.json
+
+PUBLISHERS = [
+    "Ubisoft Entertainment",
+    "Bandai Namco Entertainment Inc.",
+    "Square Enix Co., Ltd.",
+    "Team17 Digital Ltd",
+    "Devolver Digital Inc.",
+    "Microids SA",
+    "Sega Europe",
+    "Electronic Arts Inc.",
+]
+
+TAGS = [
+    "Action",
+    "Adventure",
+    "RPG",
+    "Puzzle",
+    "Platformer",
+    "Racing",
+    "Horror",
+    "Difficult",
+    "PlayStation exclusive",
+    "Open World",
+    "Story Rich",
+    "Souls-like",
+]
+
+VOICE_LANGS = ["English", "French", "German", "Spanish", "Italian", "Japanese"]
+
+# Codes PlatPrices (LANGUAGE_CODE_TO_NAME de src/clean/languages.py)
+LANGUAGE_CODES = ["en", "fr", "de", "es", "it", "ja", "pt_BR", "ko", "zh", "ru"]
+
+# Les trois formats de chaîne de langues PlatPrices gérés par normalize_languages
+LANGUAGE_FORMATS = ["array", "object", "code"]
+
+SOURCES = ["PSStore", "GGDeals", "PlatPrices"]
+
+# Options du générateur :
+#   history_length        : (min, max) points de l'historique de prix GGDeals
+#   language_formats      : formats tirés pour les langues PlatPrices
+#   missing_source_ratios : {source: part des jeux sans ce sous-document}
+#   requests              : champ Request tiré uniformément dans cette liste
+REQUESTS = ["games_ps5", "games_ps5", "games_ps5", "games_ps4", "dlcs_ps5"]
+
+DEFAULT_CATALOGUE_OPTIONS = {
+    "history_length": (3, 30),
+    "language_formats": LANGUAGE_FORMATS,
+    "missing_source_ratios": {},
+    "requests": REQUESTS,
+}
+
+
+def _sales_history(
+    rng: random.Random, release_date: datetime, base_price: float, length=(3, 30)
+):
+    history = []
+    date = release_date
+    price = base_price
+    for _ in range(rng.randint(*length)):
+        history.append({"x": date.strftime("%Y-%m-%d"), "y": price})
+        date += timedelta(days=rng.randint(5, 90))
+        price = round(base_price * rng.choice([1.0, 0.9, 0.75, 0.5, 0.3]), 2)
+    return history
+
+
+def _language_string(rng: random.Random, formats) -> str:
+    codes = rng.sample(LANGUAGE_CODES, rng.randint(1, 5))
+    language_format = rng.choice(formats)
+    if language_format == "object":
+        # '{"0": "en", "1": "fr"}'
+        return json.dumps({str(i): code for i, code in enumerate(codes)})
+    if language_format == "code":
+        # Code isolé : 'en'
+        return codes[0]
+    return json.dumps(codes)
+
+
+def generate_raw_game(index: int, rng: random.Random, options=None):
+    """Retourne un élément {game_key: data} du catalogue brut."""
+    options = {**DEFAULT_CATALOGUE_OPTIONS, **(options or {})}
+    short_url_name = f"synthetic-game-{index}"
+    release_date = datetime(2019, 1, 1) + timedelta(days=rng.randint(0, 2400))
+    base_price = rng.choice([4.99, 9.99, 14.99, 19.99, 29.99, 39.99, 69.99])
+    name = f"Synthetic Game {index}"
+    publisher = rng.choice(PUBLISHERS)
+    tags = ",".join(rng.sample(TAGS, rng.randint(1, 5)))
+    history = _sales_history(
+        rng, release_date, base_price, length=options["history_length"]
+    )
+
+    data = {
+        "Request": rng.choice(options["requests"]),
+        "PSStore": {
+            "Name": name,
+            "Publisher": publisher,
+            "ID": f"EP0000-PPSA{index:05d}_00-SYNTHETIC{index:07d}",
+            "ReleaseDate": release_date.strftime("%Y-%m-%d"),
+            "StarRatingAverage": round(rng.uniform(1, 5), 2),
+            "StarRatingTotalCount": rng.randint(0, 50000),
+            "Notices": [["De 1 à 4 joueurs", "Achats intra-jeu facultatifs"]],
+            "IsPS4": str(rng.randint(0, 1)),
+        },
+        "GGDeals": {
+            "GameName": name,
+            "Publisher": publisher,
+            "Developer": f"Studio {index % 500}",
+            "SeriesCount": rng.randint(0, 10),
+            "EditionPackCount": rng.randint(0, 3),
+            "DLCsCount": rng.randint(0, 20),
+            "IsIndie": str(rng.randint(0, 1)),
+            "InfosVR": "",
+            "Tags": tags,
+            "Features": "Single-player,Online multiplayer",
+            "HowLong": {"main_story": rng.randint(2, 60), "completionist": 80},
+            "MetacriticScore": {
+                "score": rng.randint(40, 95),
+                "user_score": rng.randint(3, 9),
+            },
+            "RatingPEGI": rng.choice(["3", "7", "12", "16", "18"]),
+            "RatingPEGIDesc": ["Violence"],
+            "RatingESRBDesc": [],
+            "VoiceLang": rng.sample(VOICE_LANGS, rng.randint(1, 4)),
+            "SubtitleLang": rng.sample(VOICE_LANGS, rng.randint(1, 6)),
+            "SalesHistory": history,
+        },
+        "PlatPrices": {
+            "GameName": name,
+            "Publisher": publisher,
+            "PSNID": f"PPSA{index:05d}",
+            "Bronze": rng.randint(0, 40),
+            "Silver": rng.randint(0, 10),
+            "Gold": rng.randint(0, 5),
+            "Platinum": 1,
+            "OfflinePlayers": rng.randint(1, 4),
+            "OnlinePlayers": rng.randint(0, 8),
+            "OnlinePlay": rng.randint(0, 1),
+            "HoursLow": rng.randint(2, 40),
+            "HoursHigh": rng.randint(40, 100),
+            "Difficulty": rng.randint(0, 10),
+            "OldDifficulty": 0,
+            "PS4Size": 0,
+            "PS5Size": rng.randint(1, 100),
+            "IsVR": 0,
+            "ReleaseDate": release_date.strftime("%Y-%m-%d"),
+            "formattedBasePrice": f"{base_price}€",
+            "Rating": "PEGI 16+",
+            "VoiceLang": _language_string(rng, options["language_formats"]),
+            "SubtitleLang": _language_string(rng, options["language_formats"]),
+            "SalesHistory": history[: len(history) // 2],
+            "GenreAction": rng.randint(0, 1),
+            "GenreRPG": rng.randint(0, 1),
+        },
+    }
+
+    # Sous-documents absents (source non trouvée lors du scraping)
+    for source in SOURCES:
+        missing_ratio = options["missing_source_ratios"].get(source, 0.0)
+        if missing_ratio > 0 and rng.random() < missing_ratio:
+            del data[source]
+
+    return {short_url_name: data}
+
+
+def iter_raw_catalogue(n_games: int, seed: int = 0, options=None):
+    rng = random.Random(seed)
+    for index in range(n_games):
+        yield generate_raw_game(index, rng, options)
+
+
+def write_raw_catalogue(file_path, n_games: int, seed: int = 0, options=None):
+    """Écrit le catalogue jeu par jeu, sans le construire entièrement en mémoire."""
+    with open(file_path, "w", encoding="utf-8") as fp:
+        fp.write("[\n")
+        for index, game in enumerate(iter_raw_catalogue(n_games, seed, options)):
+            if index > 0:
+                fp.write(",\n")
+            json.dump(game, fp, ensure_ascii=False)
+        fp.write("\n]\n")
+
+    return file_path
@@ -1,21 +1,25 @@
 # Import et chargement
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
+import contextlib
 import os
 import json
+import shutil
+import numpy as np
 import pandas as pd
 from src.clean.clean_raw_data_helper import (
-    check_released_date_is_futur,
+    RawGameContext,
     clean_and_merge_publishers,
-    days_until_first_discount,
-    days_until_first_sales_record,
     get_additionnal_features_tags,
     get_base_price,
     get_developer,
     get_difficulty,
     get_dlcs_count,
-    get_genres_list,
+    get_genres_mask,
     get_have_micro_transaction,
     get_how_long,
     get_id_store,
@@ -43,39 +47,80 @@ from src.clean.clean_raw_data_helper import (
     get_trophys_count,
     get_voice_subtitle_list,
 )
+from src.clean.column_builder import GameColumnBuilder
+from src.clean.extraction_profiler import (
+    disable_profiling,
+    enable_profiling,
+    print_profiling_report,
+    profile_stage,
+    write_profiling_report,
+)
+from src.clean.field_registry import MISSING
+from src.clean.genre_bitmask import genre_mask_to_names
+from src.clean.languages import languages_to_bitset
+from src.clean.multi_hot_store import MULTI_HOT_DIR_NAME, write_multi_hot_store
+from src.clean.incremental_store import (
+    get_settings_key,
+    hash_raw_game,
+    load_incremental_store,
+    save_incremental_store,
+)
+from src.clean.price_history_store import (
+    PRICE_HISTORY_DIR_NAME,
+    write_price_history_store,
+)
+from src.clean.price_panel import PRICE_PANEL_FILE_NAME, write_price_panel
+from src.clean.ndjson_shards import (
+    get_shard_paths,
+    is_sharded_catalogue,
+    iter_shard_games,
+    iter_sharded_games,
+    read_raw_game,
+)
+from src.clean.raw_json_reader import iter_raw_json_array
+from src.games_schema import (
+    PARTITION_COLUMN,
+    apply_games_schema,
+    games_arrow_schema,
+)
 
 
-def remove_id_duplicate_keep_min_nan_optimized(df_to_opti: pd.DataFrame):
-    # Calculer le nombre de NaN pour chaque ligne
-    df_copy = df_to_opti.copy()
-    df_copy["nan_count"] = df_copy.isnull().sum(axis=1)
-
-    # Trier par id_store puis par nombre de NaN
-    df_sorted = df_copy.sort_values(["id_store", "nan_count"])
-
-    # Garder la première ligne de chaque groupe (celle avec le moins de NaN)
-    result = df_sorted.groupby("id_store").first().reset_index()
+def remove_duplicates_keep_min_nan(
+    df_to_opti: pd.DataFrame, keys=("id_store", "game_name")
+):
+    """
+    Supprime les doublons sur chaque clé (dans l'ordre) en gardant la ligne
+    entière qui a le moins de NaN. Les lignes sans clé sont supprimées.
+    Retourne (DataFrame, {clé: nombre de lignes supprimées}).
+    """
+    # Calculer le nombre de NaN pour chaque ligne, une seule fois
+    nan_count = df_to_opti.isnull().sum(axis=1).to_numpy()
 
-    # Supprimer la colonne temporaire
-    result = result.drop("nan_count", axis=1)
+    # Lignes de la plus complète à la moins complète
+    # (tri stable : l'ordre d'origine départage les égalités)
+    order = np.argsort(nan_count, kind="stable")
 
-    return result
+    # Pour chaque clé, la première occurrence est la ligne avec le moins de NaN
+    removed_counts = {}
+    for key in keys:
+        key_values = df_to_opti[key].take(order)
+        keep = (key_values.notna() & ~key_values.duplicated()).to_numpy()
+        removed_counts[key] = int(len(order) - keep.sum())
+        order = order[keep]
 
+    # Lignes gardées dans l'ordre d'origine
+    result = df_to_opti.take(np.sort(order)).reset_index(drop=True)
 
-def remove_game_name_duplicate_keep_min_nan_optimized(df_to_opti: pd.DataFrame):
-    # Calculer le nombre de NaN pour chaque ligne
-    df_copy = df_to_opti.copy()
-    df_copy["nan_count"] = df_copy.isnull().sum(axis=1)
+    return result, removed_counts
 
-    # Trier par game_name puis par nombre de NaN
-    df_sorted = df_copy.sort_values(["game_name", "nan_count"])
 
-    # Garder la première ligne de chaque groupe (celle avec le moins de NaN)
-    result = df_sorted.groupby("game_name").first().reset_index()
+def remove_id_duplicate_keep_min_nan_optimized(df_to_opti: pd.DataFrame):
+    result, _ = remove_duplicates_keep_min_nan(df_to_opti, keys=["id_store"])
+    return result
 
-    # Supprimer la colonne temporaire
-    result = result.drop("nan_count", axis=1)
 
+def remove_game_name_duplicate_keep_min_nan_optimized(df_to_opti: pd.DataFrame):
+    result, _ = remove_duplicates_keep_min_nan(df_to_opti, keys=["game_name"])
     return result
 
 
@@ -96,297 +141,727 @@ def filter_and_process_raw_json_file_get_ps5_games():
     return df
 
 
-def filter_and_process_raw_json_file(
-    file_path,
+def filter_raw_game(
+    data,
+    context,
     released_date_filter: datetime,
     min_price_ps5: float,
     min_price_ps4: float,
     min_price_dlc: float,
 ):
-    # Liste pour stocker toutes les données
-    data_list = []
+    """
+    Phase 1 de l'extraction : seuls les champs utilisés par les filtres sont
+    extraits, du moins coûteux au plus coûteux, et le jeu est rejeté au premier
+    filtre qui échoue. Retourne None si le jeu est filtré, sinon les champs déjà
+    extraits (réutilisés par extract_game_row).
+    """
+    # On ne prend que les jeux déjà sortie avant extraction
+    if context.is_futur:
+        return None
+
+    request = data["Request"]
+    is_ps5_li = request == "games_ps5"
+    is_dlc_li = request == "dlcs_ps5"
+    is_ps4_li = request == "games_ps4"
+
+    release_date = get_release_date(data)
+
+    # On ne garde que les jeux récents
+    if is_ps4_li or is_ps5_li or is_dlc_li:
+        if release_date is None:
+            return None
+        # Date de référence :  sortie ps5
+        if release_date < released_date_filter:
+            return None
+
+    base_price = get_base_price(data, context)
+
+    # Sans prix de base exploitable (source PlatPrices absente), le jeu est ignoré
+    if base_price is None:
+        return None
+
+    if base_price > 90:
+        # Verify price twice
+        ggprice = get_max_price_from_ggsales_history_complete(data, context)
+        if ggprice > 0:
+            base_price = ggprice
+
+    # On ne garde que les prix exploitable
+    if is_ps5_li:
+        if base_price < min_price_ps5:
+            return None
+
+    if is_ps4_li:
+        if base_price < min_price_ps4:
+            return None
+
+    if is_dlc_li:
+        if base_price < min_price_dlc:
+            return None
+
+    pegi_rating, esrb_rating, rating_desc = get_rating_pegi_esrb(data)
+    if esrb_rating is None and pegi_rating is None:
+        return None
+
+    # Fusion des historiques : le filtre le plus coûteux, appliqué en dernier
+    sales_history = get_sales_history(data, context)
+    lowest_price = get_min_price_from_sales_history(sales_history)
+
+    if lowest_price is None:
+        return None
+
+    if lowest_price < 0:
+        lowest_price = 0
+
+    return {
+        "is_ps5_li": is_ps5_li,
+        "is_ps4_li": is_ps4_li,
+        "is_dlc_li": is_dlc_li,
+        "release_date": release_date,
+        "base_price": base_price,
+        "pegi_rating": pegi_rating,
+        "esrb_rating": esrb_rating,
+        "rating_desc": rating_desc,
+        "sales_history": sales_history,
+        "lowest_price": lowest_price,
+    }
+
+
+def extract_game_row(name, data, context, filtered: dict):
+    """
+    Phase 2 de l'extraction : extracteurs coûteux (genres, langues, multijoueur...),
+    exécutés uniquement pour les jeux qui ont passé filter_raw_game.
+    """
+    short_url_name = name
+    id_store = get_id_store(data)
+    game_name = get_product_name(data)
+    publisher = get_publisher(data)
+    developer = get_developer(data)
+
+    is_ps5_li = filtered["is_ps5_li"]
+    is_ps4_li = filtered["is_ps4_li"]
+    is_dlc_li = filtered["is_dlc_li"]
+    release_date = filtered["release_date"]
+    sales_history = filtered["sales_history"]
+
+    if is_ps5_li or is_dlc_li:
+        is_ps5 = 1
+    else:
+        is_ps5 = 0
 
-    if min_price_dlc < 0:
-        min_price_dlc = 1000
+    if is_ps4_li:
+        is_ps4 = 1
+    else:
+        is_ps4 = 0
+
+    if is_ps5_li or is_dlc_li:
+        is_ps4 = get_is_ps4(data)
+
+    pssstore_star_rating = get_psstore_start_rating_average(data)
+    pssstore_star_rating_count = get_psstore_start_rating_total_count(data)
+    genres_mask = get_genres_mask(data, context)
+    genres_list = genre_mask_to_names(genres_mask)
+    series_count = get_serie_count(data)
+    pack_deluxe_count = get_pack_deluxe_count(data)
+    has_micro_transactions = get_have_micro_transaction(data, context)
+    dlcs_count = get_dlcs_count(data)
+    trophy_count = get_trophys_count(data)
+    is_indie = get_is_indie(data)
+    isps5pro = get_is_ps5_pro(data, context)
+    ps_exclusive = get_is_ps5_exclusive(data, context)
+    is_vr = get_is_vr(data, context)
+    is_remaster = get_is_remaster(id_store, game_name)
+
+    local_multi_available, local_multi_nbplayers = get_local_multi_player_count(
+        data, context
+    )
+    if local_multi_nbplayers is not None:
+        local_multi_nbplayers = int(local_multi_nbplayers)
 
-    if min_price_ps4 < 0:
-        min_price_ps4 = 1000
+    online_multi_available, online_multi_nbplayers, online_only = (
+        get_online_multi_player_count(data, context)
+    )
 
-    with open(file_path, "r", encoding="utf-8") as fp:
-        try:
-            try:
-                data_all = json.load(fp)
-            except Exception as e:
-                print(f"Load json {e}")
-                return None
-
-            for curr_game in data_all:
-
-                for game_key, data in curr_game.items():
-                    name = game_key
-
-                    # On ne prend que les jeux déjà sortie avant extraction
-                    is_futur_game = check_released_date_is_futur(data)
-                    if is_futur_game:
-                        continue
-
-                    short_url_name = name
-                    id_store = get_id_store(data)
-                    game_name = get_product_name(data)
-                    publisher = get_publisher(data)
-                    developer = get_developer(data)
-
-                    is_ps5_li = False
-                    is_ps4_li = False
-                    is_dlc_li = False
-
-                    if data["Request"] == "games_ps5":
-                        is_ps5_li = True
-
-                    if data["Request"] == "dlcs_ps5":
-                        is_dlc_li = True
-
-                    if data["Request"] == "games_ps4":
-                        is_ps4_li = True
-
-                    if is_ps5_li or is_dlc_li:
-                        is_ps5 = 1
-                    else:
-                        is_ps5 = 0
-
-                    if is_ps4_li:
-                        is_ps4 = 1
-                    else:
-                        is_ps4 = 0
-
-                    if is_ps5_li or is_dlc_li:
-                        is_ps4 = get_is_ps4(data)
-
-                    release_date = get_release_date(data)
-                    base_price = get_base_price(data)
-
-                    if base_price > 90:
-                        # Verify price twice
-                        ggprice = get_max_price_from_ggsales_history_complete(data)
-                        if ggprice > 0:
-                            base_price = ggprice
-
-                        # print(short_url_name)
-
-                    # On ne garde que les jeux récents
-                    if is_ps4_li or is_ps5_li or is_dlc_li:
-                        if release_date is None:
-                            continue
-                        # Date de référence :  sortie ps5
-                        if release_date < released_date_filter:
-                            continue
-
-                    # On ne garde que les prix exploitable
-                    if is_ps5_li:
-                        if base_price < min_price_ps5:
-                            continue
-
-                    if is_ps4_li:
-                        if base_price < min_price_ps4:
-                            continue
-
-                    if is_dlc_li:
-                        if base_price < min_price_dlc:
-                            continue
-
-                    pssstore_star_rating = get_psstore_start_rating_average(data)
-                    pssstore_star_rating_count = get_psstore_start_rating_total_count(
-                        data
-                    )
-                    genres_list = get_genres_list(data)
-                    series_count = get_serie_count(data)
-                    pack_deluxe_count = get_pack_deluxe_count(data)
-                    has_micro_transactions = get_have_micro_transaction(data)
-                    dlcs_count = get_dlcs_count(data)
-                    trophy_count = get_trophys_count(data)
-                    is_indie = get_is_indie(data)
-                    isps5pro = get_is_ps5_pro(data)
-                    ps_exclusive = get_is_ps5_exclusive(data)
-                    is_vr = get_is_vr(data)
-                    is_remaster = get_is_remaster(id_store, game_name)
-
-                    local_multi_available, local_multi_nbplayers = (
-                        get_local_multi_player_count(data)
-                    )
-                    if local_multi_nbplayers is not None:
-                        local_multi_nbplayers = int(local_multi_nbplayers)
+    difficulty = get_difficulty(data, context)
+    ps4size, ps5size = get_size(data)
+
+    # if is_ps4 == 0:
+    #     if ps4size is None:
+    #         ps4size = 0
+
+    # if is_ps5 == 0:
+    #     if ps5size is None:
+    #         ps5size = 0
+
+    low_hour, high_hour = get_how_long(data)
+
+    metacritic_critic_score, metacritic_critic_userscore = get_metacritic(data)
+
+    rating_desc = filtered["rating_desc"]
+    voices_lang, subs_lang = get_voice_subtitle_list(data)
+
+    if len(rating_desc) == 0:
+        rating_desc = None
+
+    # Les délais avant promo (10/25/33/50/75%) ne sont pas calculés jeu par jeu :
+    # compute_discount_targets (src/features/feature_transforms.py) les calcule
+    # pour tout le DataFrame avec days_until_first_discount_batch
+
+    is_dlc = int(is_dlc_li)
+
+    # print(days_from_first_record)
+
+    additional_features_tags = get_additionnal_features_tags(data, context)
+
+    # Créer un dictionnaire avec toutes les données
+    row_data = {
+        "short_url_name": short_url_name,
+        "id_store": id_store,
+        "game_name": game_name,
+        "publisher": publisher,
+        "developer": developer,
+        "release_date": release_date,
+        "pssstore_stars_rating": pssstore_star_rating,
+        "pssstore_stars_rating_count": pssstore_star_rating_count,
+        "metacritic_critic_score": metacritic_critic_score,
+        "metacritic_critic_userscore": metacritic_critic_userscore,
+        "genres": ",".join(genres_list) if genres_list else "",
+        "genres_mask": genres_mask,
+        "is_ps4": is_ps4,
+        "is_ps5": is_ps5,
+        "is_indie": is_indie,
+        "is_dlc": is_dlc,
+        "is_vr": is_vr,
+        "is_opti_ps5_pro": isps5pro,
+        "is_remaster": is_remaster,
+        "is_ps_exclusive": ps_exclusive,
+        "series_count": series_count,
+        "packs_deluxe_count": pack_deluxe_count,
+        "has_microtransactions": has_micro_transactions,
+        "dlcs_count": dlcs_count,
+        "trophies_count": trophy_count,
+        "has_local_multiplayer": local_multi_available,
+        "local_multiplayer_max_players": local_multi_nbplayers,
+        "has_online_multiplayer": online_multi_available,
+        "online_multiplayer_max_players": online_multi_nbplayers,
+        "is_online_only": online_only,
+        "difficulty": difficulty,
+        # "download_size_ps4": ps4size,
+        "download_size": ps5size,
+        "hours_main_story": low_hour,
+        "hours_completionist": high_hour,
+        "pegi_rating": filtered["pegi_rating"],
+        "esrb_rating": filtered["esrb_rating"],
+        "rating_descriptions": (",".join(rating_desc) if rating_desc else ""),
+        "voice_languages": ",".join(voices_lang) if voices_lang else "",
+        "subtitle_languages": ",".join(subs_lang) if subs_lang else "",
+        "voice_languages_bitset": languages_to_bitset(voices_lang),
+        "subtitle_languages_bitset": languages_to_bitset(subs_lang),
+        # "additional_features_tags": (
+        #     ",".join(additional_features_tags)
+        #     if additional_features_tags
+        #     else ""
+        # ),
+        "base_price": filtered["base_price"],
+        "lowest_price": filtered["lowest_price"],
+        # "days_to_X_percent_discount": voir compute_discount_targets
+        "price_history": (json.dumps(sales_history) if sales_history else None),
+    }
+
+    return row_data
+
+
+def process_raw_game(
+    game_key,
+    data,
+    released_date_filter: datetime,
+    min_price_ps5: float,
+    min_price_ps4: float,
+    min_price_dlc: float,
+):
+    """
+    Extrait la ligne d'un jeu brut {game_key: data}.
+    Retourne None si le jeu est filtré.
+    """
+    # Vues partagées entre extracteurs (notices, tags, historiques)
+    context = RawGameContext(data)
+
+    filtered = filter_raw_game(
+        data,
+        context,
+        released_date_filter,
+        min_price_ps5,
+        min_price_ps4,
+        min_price_dlc,
+    )
+    if filtered is None:
+        return None
 
-                    online_multi_available, online_multi_nbplayers, online_only = (
-                        get_online_multi_player_count(data)
-                    )
+    return extract_game_row(game_key, data, context, filtered)
 
-                    difficulty = get_difficulty(data)
-                    ps4size, ps5size = get_size(data)
 
-                    # if is_ps4 == 0:
-                    #     if ps4size is None:
-                    #         ps4size = 0
+def process_raw_games_chunk(
+    games_chunk,
+    released_date_filter: datetime,
+    min_price_ps5: float,
+    min_price_ps4: float,
+    min_price_dlc: float,
+    keep_filtered: bool = False,
+):
+    """
+    Extrait les lignes d'un lot de jeux bruts (exécuté dans un worker).
+    Retourne (lignes, erreur) : l'erreur est renvoyée au processus principal
+    pour s'arrêter au même jeu que la boucle série.
+    Avec keep_filtered, les jeux filtrés donnent une ligne None.
+    """
+    rows = []
+    try:
+        for curr_game in games_chunk:
+            for game_key, data in curr_game.items():
+                row_data = process_raw_game(
+                    game_key,
+                    data,
+                    released_date_filter,
+                    min_price_ps5,
+                    min_price_ps4,
+                    min_price_dlc,
+                )
+                if row_data is not None or keep_filtered:
+                    rows.append(row_data)
+    except Exception as e:
+        return rows, e
+
+    return rows, None
+
+
+def iter_chunks(items, chunk_size: int):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def map_ordered_bounded(executor, func, iterable, max_pending: int):
+    """
+    Équivalent de executor.map qui conserve l'ordre des résultats
+    sans soumettre tout l'itérable d'un coup (compatible avec le streaming).
+    """
+    pending = deque()
+    for args in iterable:
+        pending.append(executor.submit(func, args))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def iter_extracted_rows(
+    games,
+    released_date_filter: datetime,
+    min_price_ps5: float,
+    min_price_ps4: float,
+    min_price_dlc: float,
+    workers: int = 1,
+    games_per_chunk: int = 256,
+    keep_filtered: bool = False,
+):
+    """Extrait les lignes des jeux bruts, dans l'ordre d'entrée."""
+    if workers > 1:
+        # Extraction répartie par lots sur plusieurs processus,
+        # les lignes sont fusionnées dans l'ordre du fichier
+        process_chunk = partial(
+            process_raw_games_chunk,
+            released_date_filter=released_date_filter,
+            min_price_ps5=min_price_ps5,
+            min_price_ps4=min_price_ps4,
+            min_price_dlc=min_price_dlc,
+            keep_filtered=keep_filtered,
+        )
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for rows, error in map_ordered_bounded(
+                executor,
+                process_chunk,
+                iter_chunks(games, games_per_chunk),
+                max_pending=workers * 2,
+            ):
+                yield from rows
+                if error is not None:
+                    raise error
+    else:
+        for curr_game in games:
+
+            for game_key, data in curr_game.items():
+                row_data = process_raw_game(
+                    game_key,
+                    data,
+                    released_date_filter,
+                    min_price_ps5,
+                    min_price_ps4,
+                    min_price_dlc,
+                )
+                if row_data is not None or keep_filtered:
+                    yield row_data
+
+
+def process_raw_shard(
+    shard_path,
+    released_date_filter: datetime,
+    min_price_ps5: float,
+    min_price_ps4: float,
+    min_price_dlc: float,
+):
+    """Extrait les lignes d'un shard NDJSON (exécuté dans un worker)."""
+    return process_raw_games_chunk(
+        iter_shard_games(shard_path),
+        released_date_filter,
+        min_price_ps5,
+        min_price_ps4,
+        min_price_dlc,
+    )
 
-                    # if is_ps5 == 0:
-                    #     if ps5size is None:
-                    #         ps5size = 0
 
-                    low_hour, high_hour = get_how_long(data)
+def iter_extracted_rows_from_shards(
+    shard_dir,
+    released_date_filter: datetime,
+    min_price_ps5: float,
+    min_price_ps4: float,
+    min_price_dlc: float,
+    workers: int = 1,
+    games_per_chunk: int = 256,
+):
+    """
+    Extrait les lignes d'un catalogue découpé par ndjson_shards, un shard par
+    tâche : chaque worker lit son shard lui-même. Lignes dans l'ordre du fichier.
+    games_per_chunk est ignoré (mêmes paramètres que iter_extracted_rows).
+    """
+    process_shard = partial(
+        process_raw_shard,
+        released_date_filter=released_date_filter,
+        min_price_ps5=min_price_ps5,
+        min_price_ps4=min_price_ps4,
+        min_price_dlc=min_price_dlc,
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for rows, error in executor.map(process_shard, get_shard_paths(shard_dir)):
+            yield from rows
+            if error is not None:
+                raise error
+
 
-                    metacritic_critic_score, metacritic_critic_userscore = (
-                        get_metacritic(data)
+def extract_game_from_shards(
+    shard_dir,
+    key,
+    released_date_filter: datetime,
+    min_price_ps5: float,
+    min_price_ps4: float,
+    min_price_dlc: float,
+    by="short_url_name",
+    index=None,
+):
+    """
+    Ré-extrait un seul jeu (par short_url_name ou id_store) d'un catalogue
+    découpé, via l'index des shards. Retourne None si absent ou filtré.
+    """
+    game = read_raw_game(shard_dir, key, by=by, index=index)
+    if game is None:
+        return None
+
+    for game_key, data in game.items():
+        return process_raw_game(
+            game_key,
+            data,
+            released_date_filter,
+            min_price_ps5,
+            min_price_ps4,
+            min_price_dlc,
+        )
+
+
+def iter_extracted_rows_incremental(
+    games,
+    previous_games: dict,
+    current_games: dict,
+    workers: int = 1,
+    games_per_chunk: int = 256,
+    **extract_kwargs,
+):
+    """
+    Réutilise la ligne des jeux dont le brut n'a pas changé depuis le run
+    précédent et n'extrait que les jeux nouveaux ou modifiés, en une passe :
+    seuls les lots en cours d'extraction sont gardés en mémoire (streaming).
+    current_games est rempli avec {short_url_name: {hash: ligne}} pour le store.
+    """
+    process_chunk = partial(
+        process_raw_games_chunk, keep_filtered=True, **extract_kwargs
+    )
+    # Entrées (clé, hash, ligne réutilisée, à extraire) des lots soumis, dans l'ordre
+    pending_entries = deque()
+    counts = {"extracted": 0, "reused": 0}
+    # Un lot est aussi soumis après une longue suite de jeux réutilisés
+    max_entries = games_per_chunk * 8
+
+    def iter_changed_chunks():
+        entries = []
+        changed_games = []
+        for curr_game in games:
+            for game_key, data in curr_game.items():
+                content_hash = hash_raw_game(data)
+                previous_rows = previous_games.get(game_key, {})
+                if content_hash in previous_rows:
+                    entries.append(
+                        (game_key, content_hash, previous_rows[content_hash], False)
                     )
+                    counts["reused"] += 1
+                else:
+                    entries.append((game_key, content_hash, None, True))
+                    changed_games.append({game_key: data})
+                    counts["extracted"] += 1
+
+                if len(changed_games) >= games_per_chunk or len(entries) >= max_entries:
+                    pending_entries.append(entries)
+                    yield changed_games
+                    entries = []
+                    changed_games = []
+
+        if entries:
+            pending_entries.append(entries)
+            yield changed_games
+
+    def merge_chunk(entries, rows, error):
+        # Lignes extraites replacées entre les lignes réutilisées
+        rows = iter(rows)
+        for game_key, content_hash, row_data, is_changed in entries:
+            if is_changed:
+                row_data = next(rows, MISSING)
+                if row_data is MISSING:
+                    # Extraction interrompue : arrêt au même jeu que la boucle série
+                    raise error
+            current_games.setdefault(game_key, {})[content_hash] = row_data
+            if row_data is not None:
+                yield row_data
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for rows, error in map_ordered_bounded(
+                executor, process_chunk, iter_changed_chunks(), max_pending=workers * 2
+            ):
+                yield from merge_chunk(pending_entries.popleft(), rows, error)
+    else:
+        for rows, error in map(process_chunk, iter_changed_chunks()):
+            yield from merge_chunk(pending_entries.popleft(), rows, error)
 
-                    pegi_rating, esrb_rating, rating_desc = get_rating_pegi_esrb(data)
-                    voices_lang, subs_lang = get_voice_subtitle_list(data)
+    print(
+        f"Nettoyage incrémental: {counts['extracted']} jeux extraits,"
+        f" {counts['reused']} réutilisés"
+    )
 
-                    if len(rating_desc) == 0:
-                        rating_desc = None
 
-                    if esrb_rating is None and pegi_rating is None:
-                        continue
+def filter_and_process_raw_json_file(
+    file_path,
+    released_date_filter: datetime,
+    min_price_ps5: float,
+    min_price_ps4: float,
+    min_price_dlc: float,
+    streaming: bool = False,
+    workers: int = 1,
+    games_per_chunk: int = 256,
+    incremental_store_path=None,
+    profile: bool = False,
+    profile_report_path=None,
+):
+    """
+    profile : chronomètre les étapes et les extracteurs (voir extraction_profiler),
+    rapport affiché en fin de traitement et écrit en JSON dans profile_report_path.
+    Avec workers > 1 les extracteurs tournent dans d'autres processus :
+    seules les étapes sont alors mesurées.
+    """
+    if profile:
+        enable_profiling()
+        try:
+            return filter_and_process_raw_json_file(
+                file_path,
+                released_date_filter,
+                min_price_ps5,
+                min_price_ps4,
+                min_price_dlc,
+                streaming=streaming,
+                workers=workers,
+                games_per_chunk=games_per_chunk,
+                incremental_store_path=incremental_store_path,
+            )
+        finally:
+            disable_profiling()
+            print_profiling_report()
+            if profile_report_path is not None:
+                write_profiling_report(profile_report_path)
+
+    # Lignes extraites versées directement dans des colonnes typées
+    data_list = GameColumnBuilder()
 
-                    sales_history = get_sales_history(data)
+    if min_price_dlc < 0:
+        min_price_dlc = 1000
 
-                    days_until_first_10 = days_until_first_discount(
-                        sales_history, base_price, release_date, 10
-                    )
+    if min_price_ps4 < 0:
+        min_price_ps4 = 1000
 
-                    days_until_first_25 = days_until_first_discount(
-                        sales_history, base_price, release_date, 25
-                    )
+    extract_kwargs = {
+        "released_date_filter": released_date_filter,
+        "min_price_ps5": min_price_ps5,
+        "min_price_ps4": min_price_ps4,
+        "min_price_dlc": min_price_dlc,
+        "workers": workers,
+        "games_per_chunk": games_per_chunk,
+    }
+
+    sharded = is_sharded_catalogue(file_path)
+    if sharded:
+        # Catalogue découpé par ndjson_shards : les shards sont lus par les workers
+        raw_file = contextlib.nullcontext()
+    else:
+        raw_file = open(file_path, "r", encoding="utf-8")
 
-                    days_until_first_50 = days_until_first_discount(
-                        sales_history, base_price, release_date, 50
+    with raw_file as fp:
+        try:
+            if sharded:
+                # NDJSON : toujours lu jeu par jeu
+                data_all = iter_sharded_games(file_path)
+            elif streaming:
+                # Lecture incrémentale : un élément {game_key: data} à la fois
+                data_all = iter_raw_json_array(fp)
+            else:
+                try:
+                    with profile_stage("json_load"):
+                        data_all = json.load(fp)
+                except Exception as e:
+                    print(f"Load json {e}")
+                    return None
+
+            if incremental_store_path is not None:
+                # Le store n'est valable que pour ces filtres et ce code d'extraction
+                settings_key = get_settings_key(
+                    released_date_filter, min_price_ps5, min_price_ps4, min_price_dlc
+                )
+                with profile_stage("incremental_store_load"):
+                    previous_games = load_incremental_store(
+                        incremental_store_path, settings_key
                     )
-
-                    days_until_first_75 = days_until_first_discount(
-                        sales_history, base_price, release_date, 75
+                current_games = {}
+                with profile_stage("extraction"):
+                    for row_data in iter_extracted_rows_incremental(
+                        data_all, previous_games, current_games, **extract_kwargs
+                    ):
+                        data_list.append(row_data)
+                with profile_stage("incremental_store_save"):
+                    save_incremental_store(
+                        incremental_store_path, settings_key, current_games
                     )
+            else:
+                # En streaming, la lecture du JSON est comprise dans l'extraction
+                if sharded and workers > 1:
+                    # Un shard par tâche : le brut n'est pas envoyé aux workers
+                    rows = iter_extracted_rows_from_shards(file_path, **extract_kwargs)
+                else:
+                    rows = iter_extracted_rows(data_all, **extract_kwargs)
+                with profile_stage("extraction"):
+                    for row_data in rows:
+                        data_list.append(row_data)
+
+        except json.JSONDecodeError as e:
+            print(f"Load json {e}")
+            return None
+        except Exception as e:
+            print(e)
 
-                    days_to_first_price_record = days_until_first_sales_record(
-                        sales_history, release_date
-                    )
+    with profile_stage("dataframe"):
+        return build_games_dataframe(data_list)
 
-                    lowest_price = get_min_price_from_sales_history(sales_history)
 
-                    if lowest_price is not None and lowest_price < 0:
-                        lowest_price = 0
+def build_games_dataframe(data_list, clean_publishers: bool = True):
+    """
+    data_list : GameColumnBuilder (ou liste de lignes extraites, versées dans un
+    GameColumnBuilder). Les colonnes ont directement les types de games_schema.
+    """
+    builder = data_list
+    if not isinstance(builder, GameColumnBuilder):
+        builder = GameColumnBuilder().extend(data_list)
 
-                    if lowest_price is None:
-                        continue
+    # Créer le DataFrame
+    data_frame_games = builder.to_dataframe()
 
-                    if (
-                        days_to_first_price_record is not None
-                        and days_to_first_price_record < 0
-                    ):
-                        days_to_first_price_record = 0
-
-                    is_dlc = int(is_dlc_li)
-
-                    # print(days_from_first_record)
-
-                    additional_features_tags = get_additionnal_features_tags(data)
-
-                    # Créer un dictionnaire avec toutes les données
-                    row_data = {
-                        "short_url_name": short_url_name,
-                        "id_store": id_store,
-                        "game_name": game_name,
-                        "publisher": publisher,
-                        "developer": developer,
-                        "release_date": release_date,
-                        "pssstore_stars_rating": pssstore_star_rating,
-                        "pssstore_stars_rating_count": pssstore_star_rating_count,
-                        "metacritic_critic_score": metacritic_critic_score,
-                        "metacritic_critic_userscore": metacritic_critic_userscore,
-                        "genres": ",".join(genres_list) if genres_list else "",
-                        "is_ps4": is_ps4,
-                        "is_ps5": is_ps5,
-                        "is_indie": is_indie,
-                        "is_dlc": is_dlc,
-                        "is_vr": is_vr,
-                        "is_opti_ps5_pro": isps5pro,
-                        "is_remaster": is_remaster,
-                        "is_ps_exclusive": ps_exclusive,
-                        "series_count": series_count,
-                        "packs_deluxe_count": pack_deluxe_count,
-                        "has_microtransactions": has_micro_transactions,
-                        "dlcs_count": dlcs_count,
-                        "trophies_count": trophy_count,
-                        "has_local_multiplayer": local_multi_available,
-                        "local_multiplayer_max_players": local_multi_nbplayers,
-                        "has_online_multiplayer": online_multi_available,
-                        "online_multiplayer_max_players": online_multi_nbplayers,
-                        "is_online_only": online_only,
-                        "difficulty": difficulty,
-                        # "download_size_ps4": ps4size,
-                        "download_size": ps5size,
-                        "hours_main_story": low_hour,
-                        "hours_completionist": high_hour,
-                        "pegi_rating": pegi_rating,
-                        "esrb_rating": esrb_rating,
-                        "rating_descriptions": (
-                            ",".join(rating_desc) if rating_desc else ""
-                        ),
-                        "voice_languages": ",".join(voices_lang) if voices_lang else "",
-                        "subtitle_languages": ",".join(subs_lang) if subs_lang else "",
-                        # "additional_features_tags": (
-                        #     ",".join(additional_features_tags)
-                        #     if additional_features_tags
-                        #     else ""
-                        # ),
-                        "base_price": base_price,
-                        "lowest_price": lowest_price,
-                        # "days_to_first_price_record": days_to_first_price_record,
-                        # "days_to_10_percent_discount": days_until_first_10,
-                        # "days_to_25_percent_discount": days_until_first_25,
-                        # "days_to_50_percent_discount": days_until_first_50,
-                        # "days_to_75_percent_discount": days_until_first_75,
-                        "price_history": (
-                            json.dumps(sales_history) if sales_history else None
-                        ),
-                    }
-
-                    data_list.append(row_data)
+    # Clean de la colonne publisher
+    if clean_publishers:
+        with profile_stage("publisher_cleaning"):
+            data_frame_games = clean_and_merge_publishers(data_frame_games, "publisher")
 
-        except Exception as e:
-            print(e)
+    return data_frame_games
 
-        # Créer le DataFrame
-    data_frame_games = pd.DataFrame(data_list)
-    # Le problème est que pandas convertit automatiquement en float quand il y a un mélange de None et d'entiers dans une colonne
-
-    col_to_int_nullable = [
-        "trophies_count",
-        "local_multiplayer_max_players",
-        "online_multiplayer_max_players",
-        "difficulty",
-        "download_size",
-        # "download_size_ps5",
-        "hours_main_story",
-        "hours_completionist",
-        "metacritic_critic_score",
-        "metacritic_critic_userscore",
-        "pegi_rating",
-        # "days_to_first_price_record",
-        # "days_to_first_discount",
-        # "days_to_10_percent_discount",
-        # "days_to_25_percent_discount",
-        # "days_to_50_percent_discount",
-        # "days_to_75_percent_discount",
-    ]
-
-    for col in col_to_int_nullable:
-        data_frame_games[col] = data_frame_games[col].astype("Int64")
 
-    # Clean de la colonne publisher
-    data_frame_games = clean_and_merge_publishers(data_frame_games, "publisher")
+def write_games_parquet(df: pd.DataFrame, output_dir, compression="snappy"):
+    """
+    Écrit le dataset en parquet avec le schéma explicite de src/games_schema.py,
+    partitionné par année de sortie (output_dir/release_year=AAAA/...).
+    compression : "snappy", "zstd", "gzip", "brotli", "lz4" ou "none".
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
-    return data_frame_games
+    df_typed = apply_games_schema(df)
+    df_typed[PARTITION_COLUMN] = df_typed["release_date"].dt.year.astype("Int64")
+
+    table = pa.Table.from_pandas(
+        df_typed, schema=games_arrow_schema(df_typed), preserve_index=False
+    )
 
+    # On repart d'un dossier vide : pas de fichiers d'un export précédent
+    if os.path.exists(output_dir):
+        shutil.rmtree(output_dir)
+
+    pq.write_to_dataset(
+        table,
+        root_path=output_dir,
+        partition_cols=[PARTITION_COLUMN],
+        compression=compression,
+    )
+
+    return output_dir
+
+
+def create_csv(
+    df: pd.DataFrame,
+    output_format="csv",
+    keep_price_history_json: bool = True,
+    compression="snappy",
+    write_daily_price_panel: bool = False,
+):
+    # Historiques de prix au format colonnaire, à côté du dataset
+    if "price_history" in df.columns:
+        history_dir = os.path.join(Path.cwd(), "data/processed", PRICE_HISTORY_DIR_NAME)
+        write_price_history_store(df, history_dir)
+        print(f"Historiques de prix colonnaires créés: {history_dir}")
+
+        # Prix journaliers depuis la sortie (jeux x jours), relus en mmap.
+        # Optionnel : matrice dense bien plus lourde que le CSV
+        if write_daily_price_panel:
+            panel_file = os.path.join(
+                Path.cwd(), "data/processed", PRICE_PANEL_FILE_NAME
+            )
+            write_price_panel(df, panel_file)
+            print(f"Panel des prix journaliers créé: {panel_file}")
+
+        # La colonne JSON n'est plus nécessaire si les consommateurs lisent le store
+        if not keep_price_history_json:
+            df = df.drop(columns=["price_history"])
+
+    # Colonnes multi-valuées (genres, langues...) en multi-hot CSR
+    multi_hot_dir = os.path.join(Path.cwd(), "data/processed", MULTI_HOT_DIR_NAME)
+    write_multi_hot_store(df, multi_hot_dir)
+    print(f"Colonnes multi-hot créées: {multi_hot_dir}")
 
-def create_csv(df: pd.DataFrame, output_format="csv"):
     # Sauvegarder selon le format choisi
 
     if output_format.lower() == "csv":
@@ -394,9 +869,9 @@ def create_csv(df: pd.DataFrame, output_format="csv"):
         df.to_csv(output_file, index=False, encoding="utf-8")
         print(f"Fichier CSV créé: {output_file}")
     elif output_format.lower() == "parquet":
-        output_file = os.path.join(Path.cwd(), "data/processed/games_data.parquet")
-        df.to_parquet(output_file, index=False, engine="pyarrow")
-        print(f"Fichier Parquet créé: {output_file}")
+        output_dir = os.path.join(Path.cwd(), "data/processed/games_data_parquet")
+        write_games_parquet(df, output_dir, compression=compression)
+        print(f"Dataset Parquet créé: {output_dir}")
     else:
         raise ValueError("Format non supporté. Utilisez 'csv' ou 'parquet'")
 
@@ -415,8 +890,8 @@ def clean_and_convert():
         min_price_dlc=14.9,
     )
 
-    df = remove_id_duplicate_keep_min_nan_optimized(df)
-    df = remove_game_name_duplicate_keep_min_nan_optimized(df)
+    df, removed_counts = remove_duplicates_keep_min_nan(df, ["id_store", "game_name"])
+    print(f"Doublons supprimés: {removed_counts}")
 
     print(f"DataFrame créé avec {len(df)} lignes et {len(df.columns)} colonnes")
     # Afficher un aperçu
@@ -1,57 +1,290 @@
 from datetime import datetime
+from functools import cached_property, lru_cache
 import json
 import re
+import numpy as np
 import pandas as pd
 
+from src.clean.field_registry import MISSING, compile_field_registry
+from src.clean.genre_bitmask import (
+    genre_mask_from_flags,
+    genre_mask_from_tags,
+    genre_mask_to_flags,
+    genre_mask_to_names,
+)
+from src.clean.languages import parse_language_string, parse_language_string_cached
+from src.clean.price_history_store import encode_price_histories
 from src.constants.constants import EXTRACT_DATE
 
+# Numéro de jour du 1970-01-01 (même origine que les dates du store colonnaire)
+EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+EXTRACT_DAY = EXTRACT_DATE.toordinal() - EPOCH_ORDINAL
 
-def is_valid_date(date_str):
-    """Vérifie si une date est valide"""
+
+@lru_cache(maxsize=65536)
+def parse_day_number_cached(date_str):
+    """
+    Représentation canonique d'une date "YYYY-MM-DD" des historiques :
+    numéro de jour depuis le 1970-01-01, None si la date est invalide.
+    Chaque chaîne n'est parsée qu'une fois, quel que soit le nombre d'appels.
+    """
     try:
-        entry_date = datetime.strptime(date_str, "%Y-%m-%d")
-        if entry_date > EXTRACT_DATE:
-            return False
-        return True
+        return datetime.strptime(date_str, "%Y-%m-%d").toordinal() - EPOCH_ORDINAL
     except ValueError:
+        return None
+
+
+def parse_day_number(date_str) -> int:
+    """Comme datetime.strptime : lève ValueError si la date est invalide."""
+    day = parse_day_number_cached(date_str)
+    if day is None:
+        raise ValueError(f"date invalide: {date_str!r}")
+    return day
+
+
+def to_day_number(date_value) -> int:
+    """Date de sortie (datetime ou chaîne) en numéro de jour."""
+    if isinstance(date_value, str):
+        return parse_day_number(date_value)
+    return date_value.toordinal() - EPOCH_ORDINAL
+
+
+def is_valid_date(date_str):
+    """Vérifie si une date est valide"""
+    entry_day = parse_day_number_cached(date_str)
+    if entry_day is None:
+        return False
+    # Une date (minuit) est après l'extraction si son jour est postérieur
+    if entry_day > EXTRACT_DAY:
         return False
+    return True
 
 
-def merge_and_clean_sales_histories(history1, history2):
+# Au-delà de ce nombre d'entrées (deux sources), la fusion passe par numpy
+VECTORIZED_MERGE_MIN_ENTRIES = 256
+
+
+def validate_sales_history(history):
     """
-    Fusionne deux historiques, supprime les dates invalides et prix = -1,
-    puis trie par date.
+    Valide et convertit un historique brut en une passe : (jours, dates, prix)
+    des entrées valides (date "YYYY-MM-DD" jusqu'à l'extraction, prix > 0, prix
+    convertis en float), triés par jour. Pour un même jour la dernière entrée
+    l'emporte. Les historiques sont normalement déjà dans l'ordre des dates :
+    le tri n'est fait que si la source ne l'est pas.
     """
-    merged = {}
+    days = []
+    dates = []
+    prices = []
+    is_sorted = True
+
+    previous_day = None
 
-    def process_entry(entry):
+    for entry in history:
+        if not isinstance(entry, dict):
+            continue
         date = entry.get("x", "")
         price = entry.get("y", -1)
 
         # Convertir le prix en float
-        if isinstance(price, str):
+        if type(price) is not float:
+            if not isinstance(price, (str, int, float)):
+                continue
             try:
                 price = float(price)
             except ValueError:
-                return None
+                continue
 
-        # Vérifier validité
-        if is_valid_date(date) and price > 0:
-            return date, price
+        if not price > 0 or not isinstance(date, str):
+            continue
+        day = parse_day_number_cached(date)
+        if day is None or day > EXTRACT_DAY:
+            continue
+
+        if previous_day is not None:
+            if day == previous_day:
+                dates[-1] = date
+                prices[-1] = price
+                continue
+            if day < previous_day:
+                is_sorted = False
+
+        previous_day = day
+        days.append(day)
+        dates.append(date)
+        prices.append(price)
+
+    if is_sorted:
+        return days, dates, prices
+
+    # Source non triée : tri stable, l'entrée la plus tardive d'un jour est gardée
+    order = sorted(range(len(days)), key=days.__getitem__)
+    sorted_days = []
+    sorted_dates = []
+    sorted_prices = []
+    for i in order:
+        if sorted_days and sorted_days[-1] == days[i]:
+            sorted_dates[-1] = dates[i]
+            sorted_prices[-1] = prices[i]
+            continue
+        sorted_days.append(days[i])
+        sorted_dates.append(dates[i])
+        sorted_prices.append(prices[i])
+
+    return sorted_days, sorted_dates, sorted_prices
+
+
+def validate_sales_history_arrays(history):
+    """
+    Version numpy de validate_sales_history pour les longs historiques :
+    (jours float64, dates object, prix float64). Retourne None si une entrée
+    ne se convertit pas directement (l'historique passe alors par la version Python).
+    """
+    try:
+        dates = [entry["x"] for entry in history]
+        prices = np.array([entry["y"] for entry in history], dtype=np.float64)
+        # Numéros de jour en cache, None (NaN) si la date est invalide
+        days = np.array(list(map(parse_day_number_cached, dates)), dtype=np.float64)
+    except (KeyError, TypeError, ValueError):
         return None
 
-    # Traiter les deux historiques
-    for entry in history1 + history2:
-        result = process_entry(entry)
-        if result:
-            date, price = result
-            merged[date] = price  # Évite les doublons automatiquement
+    valid = (prices > 0) & (days <= EXTRACT_DAY)
+    days = days[valid]
+    dates = np.array(dates, dtype=object)[valid]
+    prices = prices[valid]
 
-    # Convertir en liste et trier
-    result = [{"x": date, "y": price} for date, price in merged.items()]
-    result.sort(key=lambda item: datetime.strptime(item["x"], "%Y-%m-%d"))
+    if len(days) > 1 and not (days[1:] >= days[:-1]).all():
+        order = np.argsort(days, kind="stable")
+        days = days[order]
+        dates = dates[order]
+        prices = prices[order]
 
-    return result
+    # Pour un même jour, la dernière entrée l'emporte
+    last = np.ones(len(days), dtype=bool)
+    last[:-1] = days[1:] != days[:-1]
+    return days[last], dates[last], prices[last]
+
+
+def merge_validated_sales_histories(history1, history2):
+    """
+    Fusion linéaire de deux historiques validés (validate_sales_history).
+    Pour un même jour, history2 l'emporte sur history1.
+    """
+    days1, dates1, prices1 = history1
+    days2, dates2, prices2 = history2
+    if not days1:
+        return history2
+    if not days2:
+        return history1
+
+    days = []
+    dates = []
+    prices = []
+    i = 0
+    j = 0
+    n1 = len(days1)
+    n2 = len(days2)
+    while i < n1 and j < n2:
+        day1 = days1[i]
+        day2 = days2[j]
+        if day1 < day2:
+            days.append(day1)
+            dates.append(dates1[i])
+            prices.append(prices1[i])
+            i += 1
+        else:
+            days.append(day2)
+            dates.append(dates2[j])
+            prices.append(prices2[j])
+            if day1 == day2:
+                i += 1
+            j += 1
+
+    # Reste d'une seule des deux sources
+    days.extend(days1[i:])
+    dates.extend(dates1[i:])
+    prices.extend(prices1[i:])
+    days.extend(days2[j:])
+    dates.extend(dates2[j:])
+    prices.extend(prices2[j:])
+
+    return days, dates, prices
+
+
+def merge_validated_sales_histories_arrays(history1, history2):
+    """
+    Fusion de deux historiques validés en tableaux numpy : history2 est placé
+    avant history1 puis tri stable (deux séquences déjà triées, fusionnées en
+    temps linéaire par le tri). Pour un même jour, history2 l'emporte.
+    """
+    days = np.concatenate([history2[0], history1[0]])
+    dates = np.concatenate([history2[1], history1[1]])
+    prices = np.concatenate([history2[2], history1[2]])
+
+    order = np.argsort(days, kind="stable")
+    days = days[order]
+    first = np.ones(len(days), dtype=bool)
+    first[1:] = days[1:] != days[:-1]
+    return days[first], dates[order][first], prices[order][first]
+
+
+def merge_sales_histories_arrays(history1, history2):
+    """Fusion numpy de deux historiques bruts : (jours, dates, prix) en tableaux."""
+    validated = []
+    for history in (history1, history2):
+        arrays = validate_sales_history_arrays(history)
+        if arrays is None:
+            days, dates, prices = validate_sales_history(history)
+            arrays = (
+                np.array(days, dtype=np.float64),
+                np.array(dates, dtype=object),
+                np.array(prices, dtype=np.float64),
+            )
+        validated.append(arrays)
+    return merge_validated_sales_histories_arrays(*validated)
+
+
+def is_long_sales_history(history1, history2) -> bool:
+    return len(history1) + len(history2) >= VECTORIZED_MERGE_MIN_ENTRIES
+
+
+def merge_sales_histories(ggdeals_history, platprices_history):
+    """
+    Fusionne les historiques GGDeals et PlatPrices : chaque source est validée
+    une fois, puis fusion des deux séquences triées. Pour un même jour, le prix
+    PlatPrices l'emporte sur celui de GGDeals.
+    Retourne (jours int32 depuis le 1970-01-01, prix float64, dates "YYYY-MM-DD").
+    """
+    if is_long_sales_history(ggdeals_history, platprices_history):
+        days, dates, prices = merge_sales_histories_arrays(
+            ggdeals_history, platprices_history
+        )
+        return days.astype(np.int32), prices, dates.tolist()
+
+    days, dates, prices = merge_validated_sales_histories(
+        validate_sales_history(ggdeals_history),
+        validate_sales_history(platprices_history),
+    )
+    return (
+        np.array(days, dtype=np.int32),
+        np.array(prices, dtype=np.float64),
+        dates,
+    )
+
+
+def merge_and_clean_sales_histories(history1, history2):
+    """
+    Fusionne deux historiques, supprime les dates invalides et prix = -1,
+    puis trie par date. Pour un même jour, history2 l'emporte.
+    """
+    if is_long_sales_history(history1, history2):
+        _, dates, prices = merge_sales_histories_arrays(history1, history2)
+        dates = dates.tolist()
+        prices = prices.tolist()
+    else:
+        _, dates, prices = merge_validated_sales_histories(
+            validate_sales_history(history1), validate_sales_history(history2)
+        )
+    return [{"x": date, "y": price} for date, price in zip(dates, prices)]
 
 
 def days_until_first_sales_record(sales_history, release_date):
@@ -61,17 +294,16 @@ def days_until_first_sales_record(sales_history, release_date):
     if len(sales_history) == 0:
         return -1
 
-    # Convertir release_date en datetime si c'est une string
-    if isinstance(release_date, str):
-        release_date = datetime.strptime(release_date, "%Y-%m-%d")
+    # Convertir release_date en numéro de jour (datetime ou string)
+    release_day = to_day_number(release_date)
 
     # Parcourir l'historique pour trouver le premier record
     for entry in sales_history:
         date_str = entry["x"]
-        date = datetime.strptime(date_str, "%Y-%m-%d")
+        day = parse_day_number(date_str)
 
         # Vérifier le nombre de jours qui sépare la date de sortie de la première date enregistrée
-        days_diff = (date - release_date).days
+        days_diff = day - release_day
         return days_diff
 
     # Aucune baisse trouvée
@@ -90,9 +322,8 @@ def days_until_first_discount(
     if not isinstance(base_price, (int, float)):
         return None
 
-    # Convertir release_date en datetime si c'est une string
-    if isinstance(release_date, str):
-        release_date = datetime.strptime(release_date, "%Y-%m-%d")
+    # Convertir release_date en numéro de jour (datetime ou string)
+    release_day = to_day_number(release_date)
 
     # Calculer le prix cible selon le seuil de réduction
     target_price = base_price * (1 - discount_threshold / 100)
@@ -101,21 +332,125 @@ def days_until_first_discount(
     for entry in sales_history:
         price = entry["y"]
         date_str = entry["x"]
-        date = datetime.strptime(date_str, "%Y-%m-%d")
+        day = parse_day_number(date_str)
 
         # Ignorer les prix négatifs
         if price < 0.5:
             continue
 
         # Vérifier si la réduction atteint le seuil et après la date de sortie
-        if price <= target_price and date >= release_date:
-            days_diff = (date - release_date).days
+        if price <= target_price and day >= release_day:
+            days_diff = day - release_day
             return days_diff
 
     # Aucune baisse au seuil voulu trouvée
     return None
 
 
+def release_dates_to_day_numbers(release_dates):
+    """
+    Convertit des dates de sortie (datetime, chaîne "YYYY-MM-DD" ou None)
+    en numéros de jour depuis le 1970-01-01 (float, NaN si absente).
+    """
+    release_dt = pd.to_datetime(pd.Series(release_dates), errors="coerce")
+    days = release_dt.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    days = days.astype(np.int64).astype(np.float64)
+    days[release_dt.isna().to_numpy()] = np.nan
+    return days
+
+
+def days_until_first_discount_batch(
+    offsets,
+    dates,
+    prices,
+    base_prices,
+    release_days,
+    discount_thresholds,
+    min_price=0.5,
+):
+    """
+    Version vectorisée de days_until_first_discount pour tous les jeux et seuils.
+    Historiques à plat (voir price_history_store) : l'historique du jeu i est
+    dates/prices[offsets[i]:offsets[i + 1]], dates et release_days en jours.
+    Retourne une matrice float (jeux x seuils), NaN là où la fonction retourne None.
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    dates = np.asarray(dates)
+    prices = np.asarray(prices)
+    if not np.issubdtype(prices.dtype, np.floating):
+        prices = prices.astype(np.float64)
+    base_prices = np.asarray(base_prices, dtype=np.float64)
+    release_days = np.asarray(release_days, dtype=np.float64)
+    discount_thresholds = np.asarray(discount_thresholds, dtype=np.float64)
+
+    n_games = len(offsets) - 1
+    n_entries = len(dates)
+    result = np.full((n_games, len(discount_thresholds)), np.nan)
+    if n_games == 0 or n_entries == 0:
+        return result
+
+    # Jeu de chaque entrée, calculé une seule fois pour tous les seuils
+    lengths = np.diff(offsets)
+    game_ids = np.repeat(np.arange(n_games), lengths)
+    non_empty = lengths > 0
+    segment_starts = offsets[:-1][non_empty]
+
+    # Ignorer les prix négatifs et les entrées avant la date de sortie
+    # (une date de sortie NaN rend toutes les entrées du jeu inéligibles)
+    eligible = (prices >= min_price) & (dates >= release_days[game_ids])
+    entry_base_prices = base_prices[game_ids]
+    entry_indexes = np.arange(n_entries)
+    # Sentinelle pour les jeux sans baisse au seuil voulu
+    dates_with_sentinel = np.append(dates, 0)
+
+    # Une passe vectorisée par seuil : évite une matrice entrées x seuils
+    for col, discount_threshold in enumerate(discount_thresholds):
+        # Cible arrondie dans le type des prix (float32 pour le store colonnaire)
+        target_prices = (entry_base_prices * (1 - discount_threshold / 100)).astype(
+            prices.dtype
+        )
+        reached = eligible & (prices <= target_prices)
+
+        # Première entrée atteignant le seuil dans chaque historique
+        first_indexes = np.minimum.reduceat(
+            np.where(reached, entry_indexes, n_entries), segment_starts
+        )
+        days_diff = dates_with_sentinel[first_indexes] - release_days[non_empty]
+        result[non_empty, col] = np.where(first_indexes < n_entries, days_diff, np.nan)
+
+    return result
+
+
+def add_days_to_discount_columns(
+    df: pd.DataFrame, discount_thresholds, min_price=0.5
+) -> pd.DataFrame:
+    """
+    Ajoute les colonnes days_to_X_percent_discount (Int64) pour tous les seuils
+    en une seule passe, depuis les colonnes price_history, base_price et release_date.
+    """
+    # Prix en float64 : mêmes comparaisons que days_until_first_discount
+    offsets, dates, prices = encode_price_histories(
+        df["price_history"], price_dtype=np.float64
+    )
+    days = days_until_first_discount_batch(
+        offsets,
+        dates,
+        prices,
+        pd.to_numeric(df["base_price"], errors="coerce").to_numpy(dtype=np.float64),
+        release_dates_to_day_numbers(df["release_date"]),
+        discount_thresholds,
+        min_price=min_price,
+    )
+
+    df_result = df.copy()
+    for col, discount_threshold in enumerate(discount_thresholds):
+        df_result[f"days_to_{discount_threshold}_percent_discount"] = pd.array(
+            days[:, col], dtype="Int64"
+        )
+
+    return df_result
+
+
 def get_max_price_from_sales_histroy(sales_history):
     # Parcourir l'historique pour trouver la première baisse
     max_price = 0
@@ -147,171 +482,299 @@ def get_min_price_from_sales_history(sales_history):
     return min_price
 
 
-def get_product_name(data):
-    result = None
-
+def coerce_int(value):
     try:
-        result = data["PSStore"]["Name"]
-        return result
+        return int(value)
     except Exception:
-        result = None
+        return MISSING
 
-    try:
-        result = data["GGDeals"]["GameName"]
-        return result
-    except Exception:
-        result = None
 
+def coerce_int_0_1(value):
     try:
-        result = data["PlatPrices"]["GameName"]
-        return result
+        return parse_int_0_1(value)
     except Exception:
-        result = None
+        return MISSING
 
-    return result
 
+def coerce_int_0_1_or_next(value):
+    # None (valeur hors 0/1) : on essaie la source suivante
+    result = coerce_int_0_1(value)
+    if result is None:
+        return MISSING
+    return result
 
-def get_publisher(data):
-    result = None
 
+def coerce_star_rating(value):
     try:
-        result = data["PSStore"]["Publisher"]
-        return result
+        result = round(float(value), 2)
     except Exception:
-        result = None
+        return MISSING
+    if result < 0:
+        return None
+    return result
 
-    try:
-        result = data["PlatPrices"]["Publisher"]
-        return result
-    except Exception:
-        result = None
 
+def coerce_positive_count(value):
     try:
-        result = data["GGDeals"]["Publisher"]
-        return result
+        result = int(value)
     except Exception:
-        result = None
-
+        return MISSING
+    if result < 0:
+        return None
     return result
 
 
-def get_id_store(data):
-    result = None
+def coerce_release_date(value):
+    if value is None:
+        return MISSING
+    # Si c'est une string, la convertir en datetime
+    if isinstance(value, str):
+        try:
+            return datetime.strptime(value, "%Y-%m-%d")
+        except Exception:
+            return None
+    return value
 
-    try:
-        result = data["PSStore"]["ID"]
-        return result
-    except Exception:
-        result = None
 
-    try:
-        result = data["PSStore"]["Sku"]
-        return result
-    except Exception:
-        result = None
+# Sources par colonne, dans l'ordre de priorité
+FIELD_SOURCES = {
+    "game_name": {
+        "sources": [
+            ("PSStore", "Name"),
+            ("GGDeals", "GameName"),
+            ("PlatPrices", "GameName"),
+        ],
+    },
+    "publisher": {
+        "sources": [
+            ("PSStore", "Publisher"),
+            ("PlatPrices", "Publisher"),
+            ("GGDeals", "Publisher"),
+        ],
+    },
+    "id_store": {
+        "sources": [
+            ("PSStore", "ID"),
+            ("PSStore", "Sku"),
+            ("PlatPrices", "PSNID"),
+        ],
+    },
+    "developer": {
+        "sources": [
+            ("GGDeals", "Developer"),
+            ("PlatPrices", "Developer"),
+            ("PSStore", "Developer"),
+        ],
+    },
+    "release_date": {
+        "sources": [("PSStore", "ReleaseDate"), ("PlatPrices", "ReleaseDate")],
+        "coerce": coerce_release_date,
+    },
+    "series_count": {
+        "sources": [("GGDeals", "SeriesCount")],
+        "coerce": coerce_int,
+        "default": 0,
+    },
+    "packs_deluxe_count": {
+        "sources": [("GGDeals", "EditionPackCount")],
+        "coerce": coerce_int,
+        "default": 0,
+    },
+    "dlcs_count": {
+        "sources": [("GGDeals", "DLCsCount")],
+        "coerce": coerce_int,
+        "default": 0,
+    },
+    "is_indie": {
+        "sources": [("GGDeals", "IsIndie")],
+        "coerce": coerce_int_0_1,
+        "default": 0,
+    },
+    "is_ps4": {
+        "sources": [
+            ("PSStore", "IsPS4"),
+            ("PlatPrices", "IsPS4"),
+            ("GGDeals", "IsPS4"),
+        ],
+        "coerce": coerce_int_0_1_or_next,
+    },
+    "pssstore_stars_rating": {
+        "sources": [("PSStore", "StarRatingAverage")],
+        "coerce": coerce_star_rating,
+    },
+    "pssstore_stars_rating_count": {
+        "sources": [("PSStore", "StarRatingTotalCount")],
+        "coerce": coerce_positive_count,
+    },
+    "trophies_bronze": {
+        "sources": [("PlatPrices", "Bronze")],
+        "coerce": coerce_int,
+        "default": -1,
+    },
+    "trophies_silver": {
+        "sources": [("PlatPrices", "Silver")],
+        "coerce": coerce_int,
+        "default": -1,
+    },
+    "trophies_gold": {
+        "sources": [("PlatPrices", "Gold")],
+        "coerce": coerce_int,
+        "default": -1,
+    },
+    "trophies_platinum": {
+        "sources": [("PlatPrices", "Platinum")],
+        "coerce": coerce_int,
+        "default": -1,
+    },
+    "platprices_hours_low": {
+        "sources": [("PlatPrices", "HoursLow")],
+        "coerce": coerce_int,
+        "default": -1,
+    },
+    "platprices_hours_high": {
+        "sources": [("PlatPrices", "HoursHigh")],
+        "coerce": coerce_int,
+        "default": -1,
+    },
+}
+
+FIELD_EXTRACTORS = compile_field_registry(FIELD_SOURCES)
 
-    try:
-        result = data["PlatPrices"]["PSNID"]
-        return result
-    except Exception:
-        result = None
 
-    return result
+def get_product_name(data):
+    return FIELD_EXTRACTORS["game_name"](data)
 
 
-def get_serie_count(data):
-    result = None
-    # SeriesCount
-    try:
-        result = data["GGDeals"]["SeriesCount"]
-        result = int(result)
-        return result
-    except Exception:
-        result = 0
-
-    return result
+def get_publisher(data):
+    return FIELD_EXTRACTORS["publisher"](data)
 
 
-def get_pack_deluxe_count(data):
-    result = None
-    # SeriesCount
-    try:
-        result = data["GGDeals"]["EditionPackCount"]
-        result = int(result)
-        return result
-    except Exception:
-        result = 0
+def get_id_store(data):
+    return FIELD_EXTRACTORS["id_store"](data)
 
-    return result
 
+def get_serie_count(data):
+    return FIELD_EXTRACTORS["series_count"](data)
 
-def get_dlcs_count(data):
-    result = None
-    # SeriesCount
-    try:
-        result = data["GGDeals"]["DLCsCount"]
-        result = int(result)
-        return result
-    except Exception:
-        result = 0
 
-    return result
+def get_pack_deluxe_count(data):
+    return FIELD_EXTRACTORS["packs_deluxe_count"](data)
 
 
-def get_trophys_count(data):
+def get_dlcs_count(data):
+    return FIELD_EXTRACTORS["dlcs_count"](data)
 
-    cpt = 0
 
-    try:
-        bronze = data["PlatPrices"]["Bronze"]
-        bronze = int(bronze)
-        if bronze >= 0:
-            cpt += bronze
-    except Exception:
-        bronze = -1
-    try:
-        silver = data["PlatPrices"]["Silver"]
-        silver = int(silver)
-        if silver >= 0:
-            cpt += silver
-    except Exception:
-        silver = -1
-    try:
-        gold = data["PlatPrices"]["Gold"]
-        gold = int(gold)
-        if gold >= 0:
-            cpt += gold
-    except Exception:
-        gold = -1
-    try:
-        plat = data["PlatPrices"]["Platinum"]
-        plat = int(plat)
-        if plat >= 0:
-            cpt += plat
-    except Exception:
-        plat = -1
+def get_trophys_count(data):
+    bronze = FIELD_EXTRACTORS["trophies_bronze"](data)
+    silver = FIELD_EXTRACTORS["trophies_silver"](data)
+    gold = FIELD_EXTRACTORS["trophies_gold"](data)
+    plat = FIELD_EXTRACTORS["trophies_platinum"](data)
 
     if bronze < 0 and silver < 0 and gold < 0 and plat < 0:
         return None
 
+    cpt = 0
+    for count in [bronze, silver, gold, plat]:
+        if count >= 0:
+            cpt += count
+
     return cpt
 
 
 def get_is_indie(data):
-    result = 0
-    try:
-        result = data["GGDeals"]["IsIndie"]
-        result = parse_int_0_1(result)
+    return FIELD_EXTRACTORS["is_indie"](data)
+
+
+class RawGameContext:
+    """
+    Vues dérivées d'un jeu brut (notices PS Store, tags GGDeals, historiques),
+    calculées à la première demande puis partagées par les extracteurs du jeu.
+    """
+
+    def __init__(self, data):
+        self.data = data
+
+    @cached_property
+    def is_futur(self):
+        return check_released_date_is_futur(self.data)
+
+    @cached_property
+    def psstore_notices(self):
+        # data["PSStore"]["Notices"][0], None si absent
+        try:
+            return self.data["PSStore"]["Notices"][0]
+        except Exception:
+            return None
+
+    @cached_property
+    def ggdeals_tags(self):
+        try:
+            return self.data["GGDeals"]["Tags"]
+        except Exception:
+            return None
+
+    @cached_property
+    def ggdeals_tags_list(self):
+        try:
+            return self.ggdeals_tags.split(",")
+        except Exception:
+            return None
+
+    @cached_property
+    def ggdeals_sales_history(self):
+        try:
+            return self.data["GGDeals"]["SalesHistory"]
+        except Exception:
+            return []
+
+    @cached_property
+    def platprices_sales_history(self):
+        try:
+            return self.data["PlatPrices"]["SalesHistory"]
+        except Exception:
+            return []
+
+    @cached_property
+    def ggdeals_max_price_result(self):
+        # (prix max, erreur) : l'erreur éventuelle est relevée à chaque demande
+        try:
+            return get_max_price_from_sales_histroy(self.ggdeals_sales_history), None
+        except Exception as e:
+            return None, e
+
+    def ggdeals_max_price(self):
+        max_price, error = self.ggdeals_max_price_result
+        if error is not None:
+            raise error
+        return max_price
+
+    @cached_property
+    def sales_history(self):
+        if self.is_futur is True:
+            return []
+
+        try:
+            result = merge_and_clean_sales_histories(
+                self.ggdeals_sales_history, self.platprices_sales_history
+            )
+        except Exception as e:
+            print(e)
+            result = []
+
         return result
-    except Exception:
-        result = 0
 
-    return result
+
+def get_raw_game_context(data, context=None) -> RawGameContext:
+    if context is None:
+        context = RawGameContext(data)
+    return context
 
 
-def get_is_ps5_pro(data):
+def get_is_ps5_pro(data, context=None):
+    context = get_raw_game_context(data, context)
     try:
-        result = data["PSStore"]["Notices"][0]
+        result = context.psstore_notices
         if "Optimisé pour la PS5 Pro" in result:
             return 1
 
@@ -329,9 +792,10 @@ def get_is_ps5_pro(data):
     return 0
 
 
-def get_is_ps5_exclusive(data):
+def get_is_ps5_exclusive(data, context=None):
+    context = get_raw_game_context(data, context)
     try:
-        result = data["GGDeals"]["Tags"]
+        result = context.ggdeals_tags
         if "PlayStation exclusive" in result:
             return 1
 
@@ -341,11 +805,12 @@ def get_is_ps5_exclusive(data):
     return 0
 
 
-def get_local_multi_player_count(data) -> tuple[int, int | None]:
+def get_local_multi_player_count(data, context=None) -> tuple[int, int | None]:
+    context = get_raw_game_context(data, context)
     available = int(0)
     nb_players: int | None = None
     try:
-        notices = data["PSStore"]["Notices"][0]
+        notices = context.psstore_notices
 
         for notice in notices:
             # Recherche le pattern "De 1 à X joueurs"
@@ -387,13 +852,14 @@ def get_local_multi_player_count(data) -> tuple[int, int | None]:
         return int(0), int(0)
 
 
-def get_online_multi_player_count(data) -> tuple[int, int | None, int]:
+def get_online_multi_player_count(data, context=None) -> tuple[int, int | None, int]:
+    context = get_raw_game_context(data, context)
     available = int(0)
     online_only = int(0)
     nb_players: int | None = None
     # Get online only
     try:
-        notices = data["PSStore"]["Notices"][0]
+        notices = context.psstore_notices
         if "Jeu en ligne requis" in notices:
             online_only = 1
     except Exception:
@@ -401,7 +867,7 @@ def get_online_multi_player_count(data) -> tuple[int, int | None, int]:
 
     #  get nombre de joueur en ligne ps store infos
     try:
-        notices = data["PSStore"]["Notices"][0]
+        notices = context.psstore_notices
 
         for notice in notices:
             # Pattern 1: "X joueurs en ligne" ou "X joueur en ligne"
@@ -488,17 +954,8 @@ def get_how_long(data):
         except Exception:
             all_style = None
 
-    try:
-        pprices_h_low = data["PlatPrices"]["HoursLow"]
-        pprices_h_low = int(pprices_h_low)
-    except Exception:
-        pprices_h_low = -1
-
-    try:
-        pprices_h_high = data["PlatPrices"]["HoursHigh"]
-        pprices_h_high = int(pprices_h_high)
-    except Exception:
-        pprices_h_high = -1
+    pprices_h_low = FIELD_EXTRACTORS["platprices_hours_low"](data)
+    pprices_h_high = FIELD_EXTRACTORS["platprices_hours_high"](data)
 
     result_h_low = -1
     result_h_high = -1
@@ -534,7 +991,8 @@ def get_how_long(data):
     return result_h_low, result_h_high
 
 
-def get_difficulty(data) -> int | None:
+def get_difficulty(data, context=None) -> int | None:
+    context = get_raw_game_context(data, context)
     # PLatPrices
     try:
         difficulty = data["PlatPrices"]["Difficulty"]
@@ -553,7 +1011,7 @@ def get_difficulty(data) -> int | None:
 
     # GGDeals "Features",
     try:
-        infos = data["GGDeals"]["Tags"]
+        infos = context.ggdeals_tags
 
         keywords = ["Difficult"]
         # Vérifie si au moins une notice contient un mot-clé
@@ -621,9 +1079,10 @@ def get_metacritic(data):
     return critic_score, user_score
 
 
-def get_is_vr(data):
+def get_is_vr(data, context=None):
+    context = get_raw_game_context(data, context)
     try:
-        notices = data["PSStore"]["Notices"][0]
+        notices = context.psstore_notices
 
         vr_keywords = [
             "Casque PS VR requis",
@@ -671,7 +1130,8 @@ def get_is_vr(data):
     return 0
 
 
-def get_have_micro_transaction(data) -> int:
+def get_have_micro_transaction(data, context=None) -> int:
+    context = get_raw_game_context(data, context)
     result = None
     # PSStore Achats intra-jeu facultatifs
     #   "Notices": [
@@ -686,7 +1146,7 @@ def get_have_micro_transaction(data) -> int:
     #   ],
 
     try:
-        result = data["PSStore"]["Notices"][0]
+        result = context.psstore_notices
         if "Achats intra-jeu" in result:
             return 1
     except Exception:
@@ -729,161 +1189,38 @@ def parse_int_0_1(value: str) -> int | None:
 
 
 def get_is_ps4(data):
-    result = None
-
-    try:
-        result = data["PSStore"]["IsPS4"]
-        result = parse_int_0_1(result)
-        if result is not None:
-            return result
-    except Exception:
-        result = None
-
-    try:
-        result = data["PlatPrices"]["IsPS4"]
-        result = parse_int_0_1(result)
-        if result is not None:
-            return result
-    except Exception:
-        result = None
-
-    try:
-        result = data["GGDeals"]["IsPS4"]
-        result = parse_int_0_1(result)
-        if result is not None:
-            return result
-    except Exception:
-        result = None
+    return FIELD_EXTRACTORS["is_ps4"](data)
 
 
 def get_psstore_start_rating_average(data):
-    result = None
-
-    try:
-        result = data["PSStore"]["StarRatingAverage"]
-        result = float(result)
-        result = round(result, 2)
-
-        if result < 0:
-            return None
-
-        return result
-    except Exception:
-        result = None
-
-    return result
+    return FIELD_EXTRACTORS["pssstore_stars_rating"](data)
 
 
 def get_psstore_start_rating_total_count(data):
-    result = None
-
-    try:
-        result = data["PSStore"]["StarRatingTotalCount"]
-        result = int(result)
-
-        if result < 0:
-            return None
-
-        return result
-    except Exception:
-        result = None
-
-    return result
+    return FIELD_EXTRACTORS["pssstore_stars_rating_count"](data)
 
 
 def get_developer(data):
-    result = None
-
-    try:
-        result = data["GGDeals"]["Developer"]
-        return result
-    except Exception:
-        result = None
-
-    try:
-        result = data["PlatPrices"]["Developer"]
-        return result
-    except Exception:
-        result = None
-
-    try:
-        result = data["PSStore"]["Developer"]
-        return result
-    except Exception:
-        result = None
-
-    return result
+    return FIELD_EXTRACTORS["developer"](data)
 
 
 def get_release_date(data):
-    try:
-        result = data["PSStore"]["ReleaseDate"]
-    except Exception:
-        result = None
+    return FIELD_EXTRACTORS["release_date"](data)
 
-    if result is None:
-        try:
-            result = data["PlatPrices"]["ReleaseDate"]
-        except Exception:
-            result = None
 
-    if result is not None:
-        # Si c'est une string, la convertir en datetime
-        try:
-            if isinstance(result, str):
-                result = datetime.strptime(result, "%Y-%m-%d")
-                return result
-        except Exception:
-            result = None
-
-    return result
+def get_sales_history(data, context=None):
+    context = get_raw_game_context(data, context)
+    return context.sales_history
 
 
-def get_sales_history(data):
-    is_futur_game = check_released_date_is_futur(data)
-    if is_futur_game is True:
-        return []
+def get_max_price_from_ggsales_history_complete(data, context=None):
+    context = get_raw_game_context(data, context)
+    return context.ggdeals_max_price()
 
-    try:
-        ggsales = data["GGDeals"]["SalesHistory"]
-    except Exception:
-        ggsales = []
 
-    try:
-        ppsales = data["PlatPrices"]["SalesHistory"]
-    except Exception:
-        ppsales = []
-
-    try:
-        result = merge_and_clean_sales_histories(ggsales, ppsales)
-    except Exception as e:
-        print(e)
-        result = []
-
-    return result
-
-
-def get_max_price_from_ggsales_history_complete(data):
-    try:
-        ggsales = data["GGDeals"]["SalesHistory"]
-    except Exception:
-        ggsales = []
-
-    # Parcourir l'historique pour trouver la première baisse
-    max_price = 0
-    for entry in ggsales:
-        price = entry["y"]
-        if max_price < price:
-            max_price = price
-
-    return max_price
-
-
-def get_base_price(data) -> float | None:
-    try:
-        ggsales = data["GGDeals"]["SalesHistory"]
-    except Exception:
-        ggsales = []
+def get_base_price(data, context=None) -> float | None:
+    context = get_raw_game_context(data, context)
+    ggsales = context.ggdeals_sales_history
 
     try:
         error = data["PlatPrices"]["error"]
@@ -891,7 +1228,7 @@ def get_base_price(data) -> float | None:
             # try get base price from ggdeals or psstore
             if ggsales is not None:
                 # get max price
-                max_price = get_max_price_from_sales_histroy(ggsales)
+                max_price = context.ggdeals_max_price()
                 try:
                     max_price = float(max_price, 2)
                     return max_price
@@ -1066,111 +1403,28 @@ def get_rating_pegi_esrb(data):
 
 
 def normalize_languages(lang_string):
-    # Mapping des codes langue vers noms complets
-    lang_map = {
-        "en": "English",
-        "fr": "French",
-        "de": "German",
-        "pt_BR": "Portuguese (Brazil)",
-        "es": "Spanish",
-        "nl": "Dutch",
-        "it": "Italian",
-        "ch": "Chinese",
-        "zh": "Chinese (Simplified)",
-        "pl": "Polish",
-        "ru": "Russian",
-        "pt": "Portuguese",
-        "pt_PT": "Portuguese",
-        "ja": "Japanese",
-        "in": "Indonesian",
-        "tr": "Turkish",
-        "ko": "Korean",
-        "es_MX": "Spanish (Mexico)",
-        "ar": "Arabic",
-        "ca": "Catalan",
-        "uk": "Ukrainian",
-        "hu": "Hungarian",
-        "cs": "Czech",
-        "no": "Norwegian",
-        "sv": "Swedish",
-        "th": "Thai",
-        "fi": "Finnish",
-        "hi": "Hindi",
-        "hr": "Croatian",
-        "eu": "Basque",
-        "da": "Danish",
-        "ms": "Malay",
-        # Codes moins courants (ignorés ou mappés)
-        "ch_HK": "Chinese",
-        "en_GR": "English",
-        "en_CZ": "English",
-        "fr_CA": "French",
-        "fr_BE": "French",
-        "sk": "Slovaque",  # Slovaque - non dans ta liste
-        "el": "Grec",  # Grec
-        "ro": "Roumain",  # Roumain
-        "he": "Hébreu",  # Hébreu
-        "bg": "Bulgare",  # Bulgare
-        "vi": "Vietnamien",  # Vietnamien
-        "sl": "Slovène",  # Slovène
-        "tl": "Tagalog",  # Tagalog
-        "ga": "Irlandais",  # Irlandais
-        "gl": "Galicien",  # Galicien
-        "cy": "Gallois",  # Gallois
-        "af": "Afrikaans",  # Afrikaans
-        "gd": "Gaélique",  # Gaélique écossais
-    }
+    # Chaînes identiques parsées une seule fois (table et parsing dans languages.py)
+    if isinstance(lang_string, str):
+        return list(parse_language_string_cached(lang_string))
+    return parse_language_string(lang_string)
 
-    try:
-        # Nettoyer la chaîne et parser
-        lang_string = lang_string.strip()
-
-        # Cas 1: Array JSON standard [\"en\", \"fr\"]
-        if lang_string.startswith("["):
-            # Réparer les JSON malformés (manque crochets fermants)
-            if not lang_string.endswith("]"):
-                lang_string += "]"
-            codes = json.loads(lang_string)
-
-        # Cas 2: Objet JSON {\"0\":\"en\", \"1\":\"fr\"}
-        elif lang_string.startswith("{"):
-            # Réparer les JSON malformés
-            if not lang_string.endswith("}"):
-                lang_string += "}"
-            obj = json.loads(lang_string)
-            codes = list(obj.values())
-
-        # Cas 3: Code isolé \"en\"
-        else:
-            codes = [lang_string.strip('"')]
-
-        # Convertir les codes en noms de langues
-        languages = []
-        for code in codes:
-            code = code.strip()
-            if code in lang_map and lang_map[code] is not None:
-                lang_name = lang_map[code]
-                if lang_name not in languages:  # Éviter les doublons
-                    languages.append(lang_name)
-
-        return languages
-
-    except (json.JSONDecodeError, Exception):
-        # En cas d'erreur, essayer d'extraire manuellement les codes
-        codes = re.findall(r"\"([a-z_A-Z]+)\"", lang_string)
-        languages = []
-        for code in codes:
-            if code in lang_map and lang_map[code] is not None:
-                lang_name = lang_map[code]
-                if lang_name not in languages:
-                    languages.append(lang_name)
-        return languages
 
+def merge_unique_languages(sources):
+    # Langues des sources dans l'ordre, sans doublons
+    languages = []
+    seen = set()
+    for source in sources:
+        try:
+            for element in source:
+                if element not in seen:
+                    seen.add(element)
+                    languages.append(element)
+        except Exception:
+            pass
+    return languages
 
-def get_voice_subtitle_list(data):
-    voice_list = []
-    sub_list = []
 
+def get_voice_subtitle_list(data):
     try:
         ggvoices = data["GGDeals"]["VoiceLang"]
         # "Delete More +" array str entry
@@ -1195,33 +1449,8 @@ def get_voice_subtitle_list(data):
     except Exception:
         ppsubs = []
 
-    try:
-        for element in ggvoices:
-            if element not in voice_list:
-                voice_list.append(element)
-    except Exception:
-        pass
-
-    try:
-        for element in ppvoices:
-            if element not in voice_list:
-                voice_list.append(element)
-    except Exception:
-        pass
-
-    try:
-        for element in ggsubs:
-            if element not in sub_list:
-                sub_list.append(element)
-    except Exception:
-        pass
-
-    try:
-        for element in ppsubs:
-            if element not in sub_list:
-                sub_list.append(element)
-    except Exception:
-        pass
+    voice_list = merge_unique_languages([ggvoices, ppvoices])
+    sub_list = merge_unique_languages([ggsubs, ppsubs])
 
     return voice_list, sub_list
 
@@ -1231,184 +1460,7 @@ def update_genres_from_tags(tags):
     Met à jour les genres en fonction d'une liste de tags.
     Retourne un dictionnaire avec les genres mis à jour.
     """
-    # Initialiser tous les genres à 0
-    genres = {
-        "GenreAction": 0,
-        "GenreAdventure": 0,
-        "GenreCasual": 0,
-        "GenreMMO": 0,
-        "GenreRacing": 0,
-        "GenreRPG": 0,
-        "GenreSimulation": 0,
-        "GenreSports": 0,
-        "GenreStrategy": 0,
-        "GenreTPS": 0,
-        "GenreFPS": 0,
-        "GenrePlatformer": 0,
-        "GenreFighting": 0,
-        "GenreArcade": 0,
-        "GenrePuzzle": 0,
-        "GenreMusic": 0,
-        "GenreHorror": 0,
-    }
-
-    # Mapping des tags vers les genres
-    tag_to_genre = {
-        # Action
-        "Action": "GenreAction",
-        "Action Roguelike": "GenreAction",
-        "Action RTS": "GenreAction",
-        "Action Games": "GenreAction",
-        "Character Action Game": "GenreAction",
-        "Hack and Slash": "GenreAction",
-        "Beat 'em up": "GenreAction",
-        "Spectacle fighter": "GenreAction",
-        # Adventure
-        "Adventure": "GenreAdventure",
-        "Action-Adventure": "GenreAdventure",
-        "Choose Your Own Adventure": "GenreAdventure",
-        "Point & Click": "GenreAdventure",
-        "Walking Simulator": "GenreAdventure",
-        "Visual Novel": "GenreAdventure",
-        "Interactive Fiction": "GenreAdventure",
-        # Casual
-        "Casual": "GenreCasual",
-        "Family Friendly": "GenreCasual",
-        "Wholesome": "GenreCasual",
-        "Cozy": "GenreCasual",
-        "Relaxing": "GenreCasual",
-        "Party Game": "GenreCasual",
-        "Party": "GenreCasual",
-        "Clicker": "GenreCasual",
-        "Idler": "GenreCasual",
-        # MMO
-        "Massively Multiplayer": "GenreMMO",
-        "MMORPG": "GenreMMO",
-        "MOBA": "GenreMMO",
-        # Racing
-        "Racing": "GenreRacing",
-        "Driving": "GenreRacing",
-        "Combat Racing": "GenreRacing",
-        "Automobile Sim": "GenreRacing",
-        "Motocross": "GenreRacing",
-        "Motorbike": "GenreRacing",
-        "Bikes": "GenreRacing",
-        "ATV": "GenreRacing",
-        "Offroad": "GenreRacing",
-        # RPG
-        "RPG": "GenreRPG",
-        "JRPG": "GenreRPG",
-        "Action RPG": "GenreRPG",
-        "Tactical RPG": "GenreRPG",
-        "Strategy RPG": "GenreRPG",
-        "CRPG": "GenreRPG",
-        "Party-Based RPG": "GenreRPG",
-        "Dungeon Crawler": "GenreRPG",
-        "Souls-like": "GenreRPG",
-        "RPGMaker": "GenreRPG",
-        # Simulation
-        "Simulation": "GenreSimulation",
-        "Life Sim": "GenreSimulation",
-        "Farming Sim": "GenreSimulation",
-        "City Builder": "GenreSimulation",
-        "Colony Sim": "GenreSimulation",
-        "Management": "GenreSimulation",
-        "Tycoon games": "GenreSimulation",
-        "Medical Sim": "GenreSimulation",
-        "Job Simulator": "GenreSimulation",
-        "Flight": "GenreSimulation",
-        "Space Sim": "GenreSimulation",
-        "Political Sim": "GenreSimulation",
-        "God Game": "GenreSimulation",
-        "Hobby Sim": "GenreSimulation",
-        # Sports
-        "Sports": "GenreSports",
-        "Football (American)": "GenreSports",
-        "Basketball": "GenreSports",
-        "Baseball": "GenreSports",
-        "Football (Soccer)": "GenreSports",
-        "Tennis": "GenreSports",
-        "Hockey": "GenreSports",
-        "Golf": "GenreSports",
-        "Volleyball": "GenreSports",
-        "Rugby": "GenreSports",
-        "Cricket": "GenreSports",
-        "Badminton": "GenreSports",
-        "Boxing": "GenreSports",
-        "Wrestling": "GenreSports",
-        "Skateboarding": "GenreSports",
-        "Snowboarding": "GenreSports",
-        "Skiing": "GenreSports",
-        "Cycling": "GenreSports",
-        "BMX": "GenreSports",
-        "Skating": "GenreSports",
-        # Strategy
-        "Strategy": "GenreStrategy",
-        "Turn-Based Strategy": "GenreStrategy",
-        "Turn-Based Tactics": "GenreStrategy",
-        "Real Time Tactics": "GenreStrategy",
-        "RTS": "GenreStrategy",
-        "Grand Strategy": "GenreStrategy",
-        "4X": "GenreStrategy",
-        "Tower Defense": "GenreStrategy",
-        "Tactical": "GenreStrategy",
-        "Wargame": "GenreStrategy",
-        # TPS (Third Person Shooter)
-        "Third-Person Shooter": "GenreTPS",
-        "Third Person": "GenreTPS",
-        # FPS (First Person Shooter)
-        "FPS": "GenreFPS",
-        "First-Person": "GenreFPS",
-        "Boomer Shooter": "GenreFPS",
-        "Arena Shooter": "GenreFPS",
-        "Hero Shooter": "GenreFPS",
-        "Extraction Shooter": "GenreFPS",
-        "Looter Shooter": "GenreFPS",
-        # Platformer
-        "Platformer": "GenrePlatformer",
-        "2D Platformer": "GenrePlatformer",
-        "3D Platformer": "GenrePlatformer",
-        "Precision Platformer": "GenrePlatformer",
-        "Puzzle Platformer": "GenrePlatformer",
-        "Metroidvania": "GenrePlatformer",
-        # Fighting
-        "Fighting": "GenreFighting",
-        "2D Fighter": "GenreFighting",
-        "3D Fighter": "GenreFighting",
-        "Martial Arts": "GenreFighting",
-        # Arcade
-        "Arcade": "GenreArcade",
-        "Score Attack": "GenreArcade",
-        "Bullet Hell": "GenreArcade",
-        "Shoot 'Em Up": "GenreArcade",
-        "Twin Stick Shooter": "GenreArcade",
-        "Top-Down Shooter": "GenreArcade",
-        "Pinball": "GenreArcade",
-        # Puzzle
-        "Puzzle": "GenrePuzzle",
-        "Logic": "GenrePuzzle",
-        "Match 3": "GenrePuzzle",
-        "Sokoban": "GenrePuzzle",
-        "Hidden Object": "GenrePuzzle",
-        "Maze": "GenrePuzzle",
-        "Escape Room": "GenrePuzzle",
-        # Music
-        "Music": "GenreMusic",
-        "Rhythm": "GenreMusic",
-        "Music-Based Procedural Generation": "GenreMusic",
-        # Horror
-        "Horror": "GenreHorror",
-        "Survival Horror": "GenreHorror",
-        "Psychological Horror": "GenreHorror",
-    }
-
-    # Parcourir les tags et mettre à jour les genres
-    for tag in tags:
-        if tag in tag_to_genre:
-            genre_key = tag_to_genre[tag]
-            genres[genre_key] = 1
-
-    return genres
+    return genre_mask_to_flags(genre_mask_from_tags(tags))
 
 
 def merge_genres(dict_a, dict_b):
@@ -1416,70 +1468,17 @@ def merge_genres(dict_a, dict_b):
     Fusionne deux dictionnaires de genres.
     Si au moins un des deux dict a la valeur 1 pour un genre, le résultat sera 1.
     """
-    genre_merged = {}
-
-    genre_keywords = [
-        "GenreAction",
-        "GenreAdventure",
-        "GenreCasual",
-        "GenreMMO",
-        "GenreRacing",
-        "GenreRPG",
-        "GenreSimulation",
-        "GenreSports",
-        "GenreStrategy",
-        "GenreTPS",
-        "GenreFPS",
-        "GenrePlatformer",
-        "GenreFighting",
-        "GenreArcade",
-        "GenrePuzzle",
-        "GenreMusic",
-        "GenreHorror",
-    ]
-
-    for keyword in genre_keywords:
-        # Si au moins un des deux dict a 1, le résultat est 1 (OR logique)
-        value_a = dict_a.get(keyword, 0)
-        value_b = dict_b.get(keyword, 0)
-        genre_merged[keyword] = 1 if (value_a == 1 or value_b == 1) else 0
-
-    return genre_merged
+    return genre_mask_to_flags(
+        genre_mask_from_flags(dict_a) | genre_mask_from_flags(dict_b)
+    )
 
 
 def get_array(dict_genre):
-    genre_result = []
-
-    genre_keywords = [
-        "GenreAction",
-        "GenreAdventure",
-        "GenreCasual",
-        "GenreMMO",
-        "GenreRacing",
-        "GenreRPG",
-        "GenreSimulation",
-        "GenreSports",
-        "GenreStrategy",
-        "GenreTPS",
-        "GenreFPS",
-        "GenrePlatformer",
-        "GenreFighting",
-        "GenreArcade",
-        "GenrePuzzle",
-        "GenreMusic",
-        "GenreHorror",
-    ]
-
-    for keyword in genre_keywords:
-        if dict_genre.get(keyword, 0) == 1:
-            # Enlever "Genre" du début du nom
-            genre_name = keyword.replace("Genre", "")
-            genre_result.append(genre_name)
-
-    return genre_result
-
-
-def get_additionnal_features_tags(data):
+    return list(genre_mask_to_names(genre_mask_from_flags(dict_genre)))
+
+
+def get_additionnal_features_tags(data, context=None):
+    context = get_raw_game_context(data, context)
     # "Single-player",
     # "Online multiplayer",
     # "Local multiplayer",
@@ -1854,7 +1853,7 @@ def get_additionnal_features_tags(data):
 
     # Récupérer les tags
     try:
-        tags = data["GGDeals"]["Tags"].split(",")
+        tags = context.ggdeals_tags_list
         # Nettoyer les espaces
         tags = [tag.strip() for tag in tags if tag.strip()]
     except Exception:
@@ -1875,8 +1874,9 @@ def get_additionnal_features_tags(data):
     return ggfeatures
 
 
-def get_genres_list(data):
-    genres_list = []
+def get_genres_mask(data, context=None) -> int:
+    """Genres PlatPrices | GGDeals | tags GGDeals sous forme de masque (genre_bitmask)."""
+    context = get_raw_game_context(data, context)
 
     # Récupérer les sources de genres
     try:
@@ -1890,31 +1890,32 @@ def get_genres_list(data):
         pprices = None
 
     try:
-        ggtags = data["GGDeals"]["Tags"].split(",")
-        genres_tags = update_genres_from_tags(ggtags)
+        tags_mask = genre_mask_from_tags(context.ggdeals_tags_list)
     except Exception:
-        genres_tags = None
+        tags_mask = None
 
-    # Fusionner les dictionnaires disponibles
-    merged_dict = None
+    flag_sources = [src for src in [pprices, ggdeals] if src is not None]
 
-    # Liste des sources à fusionner (dans l'ordre de priorité)
-    sources = [pprices, ggdeals, genres_tags]
-    available_sources = [src for src in sources if src is not None]
+    # Une seule source : une source illisible donne une liste vide
+    if len(flag_sources) == 0:
+        return tags_mask or 0
 
-    if len(available_sources) > 0:
-        merged_dict = available_sources[0]
-        for source in available_sources[1:]:
-            merged_dict = merge_genres(merged_dict, source)
-
-    # Convertir en array
-    if merged_dict is not None:
+    if len(flag_sources) == 1 and tags_mask is None:
         try:
-            genres_list = get_array(merged_dict)
+            return genre_mask_from_flags(flag_sources[0])
         except Exception:
-            genres_list = []
+            return 0
+
+    # Fusion (OU logique) des sources disponibles
+    mask = tags_mask or 0
+    for source in flag_sources:
+        mask |= genre_mask_from_flags(source)
 
-    return genres_list
+    return mask
+
+
+def get_genres_list(data, context=None):
+    return list(genre_mask_to_names(get_genres_mask(data, context)))
 
 
 def get_is_remaster(id_store: str, game_name: str):
@@ -1939,6 +1940,110 @@ def get_game_name(file_name: str):
     return file_name.replace(".json", "")
 
 
+# Liste exhaustive des suffixes corporatifs (regex insensible à la casse)
+CORPORATE_SUFFIXES = [
+    # Suffixes anglo-saxons
+    r"\s+Inc\.?",
+    r"\s+Incorporated",
+    r"\s+LLC",
+    r"\s+L\.L\.C\.?",
+    r"\s+Ltd\.?",
+    r"\s+LTD",
+    r"\s+LTDA",
+    r"\s+Limited",
+    r"\s+Co\.,?\s*Ltd\.?",
+    r"\s+Corporation",
+    r"\s+Corp\.?",
+    r"\s+PTE\.?",
+    r"\s+Pte\.?\s*Ltd\.?",
+    r"\s+PLC",
+    r"\s+Co\.?,?",
+    r"\s+CO\.?,?",
+    # Suffixes avec descriptions (ex: T/a, A/S)
+    r"\s+S\.A\.\s+T/a\s+[^,]+",
+    r"\s+A/S",
+    r"\s+A/V",
+    # Suffixes européens (France, Espagne, Italie)
+    r"\s+S\.A\.S\.U\.?",
+    r"\s+SASU",
+    r"\s+S\.A\.S\.?",
+    r"\s+SAS",
+    r"\s+S\.?\s*A\.?,?",
+    r"\s+SA",
+    r"\s+S\.A\.R\.L\.?",
+    r"\s+SARL",
+    r"\s+Sarl",
+    r"\s+S\.L\.U\.?",
+    r"\s+SLU",
+    r"\s+S\.L\.?",
+    r"\s+SL",
+    r"\s+Sociedad\s+Limitada",
+    r"\s+S\.R\.L\.?",
+    r"\s+SRL",
+    r"\s+S\.r\.l\.?",
+    r"\s+De\s+R\.L",
+    # Suffixes allemands/autrichiens
+    r"\s+GmbH\s+&\s+Co\.?\s+KG",
+    r"\s+GmbH",
+    r"\s+GMBH",
+    r"\s+AG",
+    r"\s+UG",
+    # Suffixes Pays-Bas/Belgique
+    r"\s+B\.V\.?",
+    r"\s+BV",
+    r"\s+N\.V\.?",
+    r"\s+NV",
+    # Suffixes d'Europe de l'Est
+    r"\s+Z\s*O\.O\.?",
+    r"\s+z\s*o\.\s*o\.?",
+    r"\s+Sp\.?\s*Z\.?o\.o\.?",
+    r"\s+Sp\.\s*z\s*o\.o\.?",
+    r"\s+Sp\.\s*Z\s*O\.\s*O\.?",
+    r"\s+S\.\s*R\.\s*O\.?",
+    r"\s+s\.\s*r\.\s*o\.?",
+    r"\s+S\.r\.o\.?",
+    r"\s+D\.o\.o\.?",
+    r"\s+d\.o\.o\.?",
+    r"\s+Sp\.\s*K\.?",
+    # Suffixes asiatiques
+    r"\s+Sdn\.?\s*Bhd\.?,?",
+    r"\s+KK",
+    r"\s+K\.K\.?",
+    # Suffixes nordiques
+    r"\s+AB",
+    r"\s+AS",
+    r"\s+Oy",
+    # Suffixes australiens
+    r"\s+Pty\s+Ltd",
+    # Autres
+    r"\s+Int\'l(\s+BV)?",
+    r"\s+International",
+    r",\s*INC\.?",
+    r"\s+sp\.?",
+    # Mentions géographiques
+    r"\s+Europe",
+    r"\s+EUROPE",
+    r"\s+America",
+    r"\s+U\.S\.A\.?,?",
+    r"\s+USA",
+    r"\s+UK",
+    r"\s+Japan",
+]
+
+# Compilés une seule fois : un motif ancré par suffixe (appliqués dans l'ordre)
+# et une alternance unique qui détecte en une recherche si un suffixe est présent
+_CORPORATE_SUFFIX_PATTERNS = [
+    re.compile(suffix_pattern + r"$", flags=re.IGNORECASE)
+    for suffix_pattern in CORPORATE_SUFFIXES
+]
+_ANY_CORPORATE_SUFFIX_PATTERN = re.compile(
+    "(?:" + "|".join(CORPORATE_SUFFIXES) + r")$", flags=re.IGNORECASE
+)
+_EDGE_NON_WORD_PATTERN = re.compile(r"^[^\w]+|[^\w]+$", flags=re.UNICODE)
+_MULTI_SPACES_PATTERN = re.compile(r"\s+")
+_TRAILING_PARENTHESES_PATTERN = re.compile(r"\s*\([^)]*\)\s*$")
+
+
 def clean_publisher_name(name):
     """
     Nettoyage et normalisation avancée des noms de publishers
@@ -1951,103 +2056,16 @@ def clean_publisher_name(name):
     name = str(name).strip()
 
     # Supprimer les caractères spéciaux problématiques en début/fin
-    name = re.sub(r"^[^\w]+|[^\w]+$", "", name, flags=re.UNICODE)
-
-    # Liste exhaustive des suffixes corporatifs (regex insensible à la casse)
-    corporate_suffixes = [
-        # Suffixes anglo-saxons
-        r"\s+Inc\.?",
-        r"\s+Incorporated",
-        r"\s+LLC",
-        r"\s+L\.L\.C\.?",
-        r"\s+Ltd\.?",
-        r"\s+LTD",
-        r"\s+LTDA",
-        r"\s+Limited",
-        r"\s+Co\.,?\s*Ltd\.?",
-        r"\s+Corporation",
-        r"\s+Corp\.?",
-        r"\s+PTE\.?",
-        r"\s+Pte\.?\s*Ltd\.?",
-        r"\s+PLC",
-        r"\s+Co\.?,?",
-        r"\s+CO\.?,?",
-        # Suffixes avec descriptions (ex: T/a, A/S)
-        r"\s+S\.A\.\s+T/a\s+[^,]+",
-        r"\s+A/S",
-        r"\s+A/V",
-        # Suffixes européens (France, Espagne, Italie)
-        r"\s+S\.A\.S\.U\.?",
-        r"\s+SASU",
-        r"\s+S\.A\.S\.?",
-        r"\s+SAS",
-        r"\s+S\.?\s*A\.?,?",
-        r"\s+SA",
-        r"\s+S\.A\.R\.L\.?",
-        r"\s+SARL",
-        r"\s+Sarl",
-        r"\s+S\.L\.U\.?",
-        r"\s+SLU",
-        r"\s+S\.L\.?",
-        r"\s+SL",
-        r"\s+Sociedad\s+Limitada",
-        r"\s+S\.R\.L\.?",
-        r"\s+SRL",
-        r"\s+S\.r\.l\.?",
-        r"\s+De\s+R\.L",
-        # Suffixes allemands/autrichiens
-        r"\s+GmbH\s+&\s+Co\.?\s+KG",
-        r"\s+GmbH",
-        r"\s+GMBH",
-        r"\s+AG",
-        r"\s+UG",
-        # Suffixes Pays-Bas/Belgique
-        r"\s+B\.V\.?",
-        r"\s+BV",
-        r"\s+N\.V\.?",
-        r"\s+NV",
-        # Suffixes d'Europe de l'Est
-        r"\s+Z\s*O\.O\.?",
-        r"\s+z\s*o\.\s*o\.?",
-        r"\s+Sp\.?\s*Z\.?o\.o\.?",
-        r"\s+Sp\.\s*z\s*o\.o\.?",
-        r"\s+Sp\.\s*Z\s*O\.\s*O\.?",
-        r"\s+S\.\s*R\.\s*O\.?",
-        r"\s+s\.\s*r\.\s*o\.?",
-        r"\s+S\.r\.o\.?",
-        r"\s+D\.o\.o\.?",
-        r"\s+d\.o\.o\.?",
-        r"\s+Sp\.\s*K\.?",
-        # Suffixes asiatiques
-        r"\s+Sdn\.?\s*Bhd\.?,?",
-        r"\s+KK",
-        r"\s+K\.K\.?",
-        # Suffixes nordiques
-        r"\s+AB",
-        r"\s+AS",
-        r"\s+Oy",
-        # Suffixes australiens
-        r"\s+Pty\s+Ltd",
-        # Autres
-        r"\s+Int\'l(\s+BV)?",
-        r"\s+International",
-        r",\s*INC\.?",
-        r"\s+sp\.?",
-        # Mentions géographiques
-        r"\s+Europe",
-        r"\s+EUROPE",
-        r"\s+America",
-        r"\s+U\.S\.A\.?,?",
-        r"\s+USA",
-        r"\s+UK",
-        r"\s+Japan",
-    ]
+    name = _EDGE_NON_WORD_PATTERN.sub("", name)
 
     # Supprimer tous les suffixes (plusieurs passes pour les cas multiples)
     for _ in range(3):
+        # Aucun suffixe en fin de nom : la passe ne changerait rien
+        if _ANY_CORPORATE_SUFFIX_PATTERN.search(name) is None:
+            break
         original = name
-        for suffix_pattern in corporate_suffixes:
-            name = re.sub(suffix_pattern + r"$", "", name, flags=re.IGNORECASE).strip()
+        for suffix_pattern in _CORPORATE_SUFFIX_PATTERNS:
+            name = suffix_pattern.sub("", name).strip()
         if name == original:
             break
 
@@ -2055,10 +2073,10 @@ def clean_publisher_name(name):
     name = name.rstrip(",").strip()
 
     # Normaliser les espaces multiples
-    name = re.sub(r"\s+", " ", name)
+    name = _MULTI_SPACES_PATTERN.sub(" ", name)
 
     # Supprimer les parenthèses vides et leur contenu si peu informatif
-    name = re.sub(r"\s*\([^)]*\)\s*$", "", name).strip()
+    name = _TRAILING_PARENTHESES_PATTERN.sub("", name).strip()
 
     # Supprimer à nouveau les virgules après nettoyage
     name = name.rstrip(",").strip()
@@ -2072,6 +2090,12 @@ def clean_publisher_name(name):
     return name
 
 
+@lru_cache(maxsize=16384)
+def clean_publisher_name_cached(name):
+    """clean_publisher_name mémoïsé (les publishers distincts sont peu nombreux)"""
+    return clean_publisher_name(name)
+
+
 def clean_and_merge_publishers(
     df: pd.DataFrame, publisher_col: str = "publisher"
 ) -> pd.DataFrame:
@@ -2124,28 +2148,31 @@ def clean_and_merge_publishers(
         ],
     }
 
-    # Appliquer le nettoyage de base
-    df_result[f"{publisher_col}_clean"] = df_result[publisher_col].apply(
-        clean_publisher_name
-    )
-
     # CORRECTION : Créer le reverse_mapping
     reverse_mapping = {}
     for canonical, variations in manual_corrections.items():
         # Le canonical est déjà en minuscules
         for variation in variations:
             # Nettoyer chaque variation
-            cleaned_variation = clean_publisher_name(variation)
+            cleaned_variation = clean_publisher_name_cached(variation)
             reverse_mapping[cleaned_variation] = canonical
 
-    # Appliquer les corrections manuelles
-    df_result[f"{publisher_col}_normalized"] = df_result[
-        f"{publisher_col}_clean"
-    ].apply(lambda x: reverse_mapping.get(x, x) if pd.notna(x) else x)
+    # Nettoyage et corrections sur les publishers distincts uniquement,
+    # puis report sur toutes les lignes via les codes de catégorie
+    codes, uniques = pd.factorize(df_result[publisher_col])
+    normalized_uniques = np.empty(len(uniques), dtype=object)
+    for code, publisher in enumerate(uniques):
+        cleaned = clean_publisher_name_cached(publisher)
+        normalized_uniques[code] = reverse_mapping.get(cleaned, cleaned)
+
+    # Les valeurs manquantes (code -1) sont conservées telles quelles
+    normalized = df_result[publisher_col].to_numpy(dtype=object, copy=True)
+    has_value = codes >= 0
+    normalized[has_value] = normalized_uniques[codes[has_value]]
 
     # Stats
-    original_count = df_result[publisher_col].nunique()
-    cleaned_count = df_result[f"{publisher_col}_normalized"].nunique()
+    original_count = len(uniques)
+    cleaned_count = len(set(normalized_uniques))
 
     print(f"Résultats du nettoyage:")
     print(f"   Publishers originaux: {original_count}")
@@ -2155,9 +2182,8 @@ def clean_and_merge_publishers(
     )
 
     # Remplacer la colonne originale
-    df_result[publisher_col] = df_result[f"{publisher_col}_normalized"]
-    df_result = df_result.drop(
-        columns=[f"{publisher_col}_clean", f"{publisher_col}_normalized"]
-    )
+    df_result[publisher_col] = pd.Series(
+        normalized, index=df_result.index
+    ).infer_objects()
 
     return df_result
@@ -0,0 +1,224 @@
+from array import array
+from operator import itemgetter
+import numpy as np
+import pandas as pd
+
+from src.games_schema import (
+    CATEGORY_COLUMNS,
+    DATE_COLUMNS,
+    FLOAT_COLUMNS,
+    INT_COLUMNS,
+    STRING_COLUMNS,
+    UINT64_COLUMNS,
+)
+
+# Construction du DataFrame du nettoyage colonne par colonne : les lignes
+# extraites sont versées par lots dans des buffers typés (array + masque des
+# valeurs manquantes, codes de catégories, chaînes internées), puis le DataFrame
+# est créé en une fois avec les types de src/games_schema.py.
+# Remplace pd.DataFrame(liste de dicts) suivi des conversions en Int64 : les
+# dicts des lignes peuvent être libérés au fur et à mesure de l'extraction.
+
+# Lignes gardées en tuples avant conversion en colonnes typées
+ROWS_PER_CHUNK = 4096
+
+# Chaînes quasi uniques par jeu : pas d'intérêt à les interner
+UNIQUE_STRING_COLUMNS = [
+    "short_url_name",
+    "id_store",
+    "game_name",
+    "price_history",
+]
+
+
+class IntColumn:
+    """Entiers nullable : valeurs int64 et masque des manquants (Int64)."""
+
+    def __init__(self):
+        self.values = array("q")
+        self.mask = array("b")
+
+    def extend(self, values):
+        values = np.array(values, dtype=object)
+        # None ou NaN
+        mask = pd.isna(values)
+        values[mask] = 0
+        self.values.frombytes(values.astype(np.int64).tobytes())
+        self.mask.frombytes(mask.tobytes())
+
+    def to_array(self):
+        return pd.arrays.IntegerArray(
+            np.frombuffer(self.values, dtype=np.int64).copy(),
+            np.frombuffer(self.mask, dtype=np.bool_).copy(),
+        )
+
+
+class UInt64Column:
+    """Bitsets de langues (le bit 63 dépasse int64)."""
+
+    def __init__(self):
+        self.values = array("Q")
+
+    def extend(self, values):
+        self.values.frombytes(np.array(values, dtype=np.uint64).tobytes())
+
+    def to_array(self):
+        return np.frombuffer(self.values, dtype=np.uint64).copy()
+
+
+class FloatColumn:
+    def __init__(self):
+        self.values = array("d")
+
+    def extend(self, values):
+        # None devient NaN
+        self.values.frombytes(np.array(values, dtype=np.float64).tobytes())
+
+    def to_array(self):
+        return np.frombuffer(self.values, dtype=np.float64).copy()
+
+
+class DateColumn:
+    """Dates en nanosecondes depuis 1970, NaT pour les manquantes."""
+
+    def __init__(self):
+        self.values = array("q")
+
+    def extend(self, values):
+        dates = np.array(values, dtype="datetime64[ns]")
+        self.values.frombytes(dates.view(np.int64).tobytes())
+
+    def to_array(self):
+        return np.frombuffer(self.values, dtype=np.int64).view("datetime64[ns]").copy()
+
+
+class CategoryColumn:
+    """Codes attribués à l'ajout (-1 si manquant), catégories triées à la fin."""
+
+    def __init__(self):
+        self.codes = array("i")
+        self.categories = {None: -1}
+
+    def extend(self, values):
+        categories = self.categories
+        self.codes.extend(
+            [categories.setdefault(value, len(categories) - 1) for value in values]
+        )
+
+    def to_array(self):
+        codes = np.frombuffer(self.codes, dtype=np.int32)
+        categories = [value for value in self.categories if value is not None]
+        # Catégories triées comme astype("category")
+        order = np.argsort(np.array(categories, dtype=object), kind="stable")
+        remap = np.empty(len(categories) + 1, dtype=np.int32)
+        remap[order] = np.arange(len(categories), dtype=np.int32)
+        remap[-1] = -1
+        return pd.Categorical.from_codes(
+            remap[codes], categories=[categories[i] for i in order]
+        )
+
+
+class StringColumn:
+    """Chaînes (object) : internées, les valeurs répétées partagent le même objet."""
+
+    def __init__(self, intern=True):
+        self.values = []
+        self.interned = {} if intern else None
+
+    def extend(self, values):
+        if self.interned is not None:
+            values = map(self.interned.setdefault, values, values)
+        self.values.extend(values)
+
+    def to_array(self):
+        values = np.empty(len(self.values), dtype=object)
+        values[:] = self.values
+        return values
+
+
+def create_column(name: str):
+    if name in INT_COLUMNS:
+        return IntColumn()
+    if name in UINT64_COLUMNS:
+        return UInt64Column()
+    if name in FLOAT_COLUMNS:
+        return FloatColumn()
+    if name in DATE_COLUMNS:
+        return DateColumn()
+    if name in CATEGORY_COLUMNS:
+        return CategoryColumn()
+    # Colonnes texte et colonnes hors schéma (non internées)
+    intern = name in STRING_COLUMNS and name not in UNIQUE_STRING_COLUMNS
+    return StringColumn(intern=intern)
+
+
+class GameColumnBuilder:
+    """
+    Accumule les lignes extraites (dicts de process_raw_game) dans des
+    colonnes typées. to_dataframe() crée le DataFrame en une fois.
+    """
+
+    def __init__(self, rows_per_chunk=ROWS_PER_CHUNK):
+        self.rows_per_chunk = rows_per_chunk
+        self.columns = {}
+        self.n_rows = 0
+        self._chunk = []
+        self._get_values = None
+
+    def __len__(self):
+        return self.n_rows + len(self._chunk)
+
+    def _flush(self):
+        if not self._chunk:
+            return
+        # Transposition du lot : un tuple de valeurs par colonne
+        for column, values in zip(self.columns.values(), zip(*self._chunk)):
+            column.extend(values)
+        self.n_rows += len(self._chunk)
+        self._chunk = []
+
+    def _add_columns(self, names):
+        # Colonnes apparues en cours de route : manquantes pour les lignes précédentes
+        self._flush()
+        for name in names:
+            column = create_column(name)
+            if self.n_rows:
+                column.extend([None] * self.n_rows)
+            self.columns[name] = column
+        get_values = itemgetter(*self.columns)
+        if len(self.columns) == 1:
+            # itemgetter d'une seule clé ne retourne pas de tuple
+            self._get_values = lambda row_data: (get_values(row_data),)
+        else:
+            self._get_values = get_values
+
+    def append(self, row_data: dict):
+        values = None
+        if len(row_data) == len(self.columns):
+            try:
+                values = self._get_values(row_data)
+            except (KeyError, TypeError):
+                values = None
+
+        if values is None:
+            # Clés différentes des colonnes connues
+            new_names = [name for name in row_data if name not in self.columns]
+            if new_names:
+                self._add_columns(new_names)
+            values = tuple(row_data.get(name) for name in self.columns)
+
+        self._chunk.append(values)
+        if len(self._chunk) >= self.rows_per_chunk:
+            self._flush()
+
+    def extend(self, rows):
+        for row_data in rows:
+            self.append(row_data)
+        return self
+
+    def to_dataframe(self) -> pd.DataFrame:
+        self._flush()
+        return pd.DataFrame(
+            {name: column.to_array() for name, column in self.columns.items()},
+            index=pd.RangeIndex(self.n_rows),
+        )
@@ -0,0 +1,209 @@
+from contextlib import contextmanager
+from functools import wraps
+import inspect
+import json
+import sys
+import time
+
+from src.clean import clean_raw_data_helper
+
+# Instrumentation optionnelle du nettoyage : appels, temps cumulé et exceptions
+# attrapées par extracteur (get_* de clean_raw_data_helper...) et par étape de
+# filter_and_process_raw_json_file.
+# Désactivée, elle ne coûte rien : les fonctions ne sont remplacées par leur
+# version chronométrée qu'entre enable_profiling() et disable_profiling().
+
+# Fonctions instrumentées en plus des get_*
+PROFILED_HELPERS = [
+    "check_released_date_is_futur",
+    "merge_and_clean_sales_histories",
+    "get_min_price_from_sales_history",
+    "normalize_ratings",
+    "normalize_languages",
+    "merge_unique_languages",
+    "clean_and_merge_publishers",
+]
+
+
+def get_patched_modules() -> list:
+    # Modules dont les noms sont remplacés : les extracteurs s'appellent entre eux
+    # via les globales de clean_raw_data_helper, process_raw_game via clean_raw_data
+    # (import local : clean_raw_data importe profile_stage de ce module)
+    from src.clean import clean_raw_data
+
+    return [clean_raw_data_helper, clean_raw_data]
+
+
+class ExtractionProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.count_exceptions = False
+        self.extractors = {}
+        self.stages = {}
+        self._originals = []
+        self._code_names = {}
+        self._previous_trace = None
+
+    def reset(self):
+        self.extractors = {}
+        self.stages = {}
+
+    def _get_stats(self, table, name):
+        stats = table.get(name)
+        if stats is None:
+            stats = {"calls": 0, "seconds": 0.0, "exceptions": 0}
+            table[name] = stats
+        return stats
+
+    def wrap(self, name, func):
+        stats = self._get_stats(self.extractors, name)
+
+        @wraps(func)
+        def profiled(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats["calls"] += 1
+                stats["seconds"] += time.perf_counter() - start
+
+        return profiled
+
+    def _trace_calls(self, frame, event, arg):
+        # Seules les frames des fonctions instrumentées sont suivies
+        name = self._code_names.get(frame.f_code)
+        if name is None:
+            return None
+        frame.f_trace_lines = False
+        stats = self.extractors[name]
+
+        def trace_exceptions(frame, event, arg):
+            if event == "exception":
+                stats["exceptions"] += 1
+            return trace_exceptions
+
+        return trace_exceptions
+
+
+PROFILER = ExtractionProfiler()
+
+
+def get_profiled_function_names() -> list:
+    names = [
+        name
+        for name, obj in vars(clean_raw_data_helper).items()
+        if inspect.isfunction(obj)
+        and obj.__module__ == clean_raw_data_helper.__name__
+        and name.startswith("get_")
+        and name != "get_raw_game_context"
+    ]
+    return names + [name for name in PROFILED_HELPERS if name not in names]
+
+
+def enable_profiling(count_exceptions: bool = True):
+    """
+    Remplace les extracteurs par leur version chronométrée.
+    count_exceptions : compte les exceptions levées dans chaque extracteur
+    (y compris celles attrapées par ses try/except) via sys.settrace,
+    ce qui ralentit l'extraction : les temps sont alors majorés.
+    """
+    if PROFILER.enabled:
+        return PROFILER
+
+    PROFILER.reset()
+    patched_modules = get_patched_modules()
+    for name in get_profiled_function_names():
+        func = getattr(clean_raw_data_helper, name)
+        PROFILER._code_names[func.__code__] = name
+        profiled = PROFILER.wrap(name, func)
+        for module in patched_modules:
+            if getattr(module, name, None) is func:
+                PROFILER._originals.append((module, name, func))
+                setattr(module, name, profiled)
+
+    PROFILER.count_exceptions = count_exceptions
+    if count_exceptions:
+        PROFILER._previous_trace = sys.gettrace()
+        sys.settrace(PROFILER._trace_calls)
+
+    PROFILER.enabled = True
+    return PROFILER
+
+
+def disable_profiling():
+    if not PROFILER.enabled:
+        return PROFILER
+
+    for module, name, func in reversed(PROFILER._originals):
+        setattr(module, name, func)
+    PROFILER._originals = []
+    PROFILER._code_names = {}
+
+    if PROFILER.count_exceptions:
+        sys.settrace(PROFILER._previous_trace)
+        PROFILER._previous_trace = None
+
+    PROFILER.enabled = False
+    return PROFILER
+
+
+@contextmanager
+def profile_stage(name: str):
+    """Chronomètre une étape du pipeline (sans effet si le profilage est désactivé)."""
+    if not PROFILER.enabled:
+        yield
+        return
+
+    stats = PROFILER._get_stats(PROFILER.stages, name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats["calls"] += 1
+        stats["seconds"] += time.perf_counter() - start
+
+
+def get_profiling_report() -> dict:
+    def sorted_stats(table):
+        return dict(
+            sorted(table.items(), key=lambda item: item[1]["seconds"], reverse=True)
+        )
+
+    return {
+        "count_exceptions": PROFILER.count_exceptions,
+        "stages": sorted_stats(PROFILER.stages),
+        "extractors": sorted_stats(
+            {
+                name: stats
+                for name, stats in PROFILER.extractors.items()
+                if stats["calls"]
+            }
+        ),
+    }
+
+
+def print_profiling_report(report=None):
+    report = report or get_profiling_report()
+
+    print(f"\n{'étape':38s} {'appels':>9s} {'temps':>9s}")
+    for name, stats in report["stages"].items():
+        print(f"{name:38s} {stats['calls']:9d} {stats['seconds']:8.3f}s")
+
+    print(
+        f"\n{'extracteur':38s} {'appels':>9s} {'temps cumulé':>13s}"
+        f" {'µs/appel':>9s} {'exceptions':>10s}"
+    )
+    for name, stats in report["extractors"].items():
+        per_call = stats["seconds"] / stats["calls"] * 1e6
+        exceptions = stats["exceptions"] if report["count_exceptions"] else "-"
+        print(
+            f"{name:38s} {stats['calls']:9d} {stats['seconds']:12.3f}s"
+            f" {per_call:9.1f} {exceptions:>10}"
+        )
+
+
+def write_profiling_report(output_path, report=None):
+    report = report or get_profiling_report()
+    with open(output_path, "w", encoding="utf-8") as fp:
+        json.dump(report, fp, indent=2)
+    return output_path
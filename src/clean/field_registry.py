@@ -0,0 +1,68 @@
+# Registre déclaratif des champs bruts : pour chaque colonne, les chemins sources
+# par ordre de priorité et un convertisseur. Compilé en fonctions d'extraction
+# qui n'utilisent que dict.get (pas de KeyError levée/attrapée par source absente).
+#
+# Spécification d'un champ :
+#   "sources" : liste de chemins, ex. [("PSStore", "Name"), ("GGDeals", "GameName")]
+#   "coerce"  : fonction valeur brute -> valeur (optionnelle), retourne MISSING
+#               pour passer à la source suivante
+#   "default" : valeur si aucune source ne convient (None par défaut)
+
+# Sentinelle "pas de valeur" (une valeur None présente dans le JSON est une valeur)
+MISSING = object()
+
+
+def lookup_path(data, path):
+    value = data
+    for key in path:
+        if type(value) is not dict:
+            return MISSING
+        value = value.get(key, MISSING)
+        if value is MISSING:
+            return MISSING
+    return value
+
+
+def compile_field_extractor(spec: dict):
+    sources = tuple(tuple(path) for path in spec["sources"])
+    coerce = spec.get("coerce")
+    default = spec.get("default")
+
+    # Cas le plus fréquent : chemins à deux niveaux data[source][clé]
+    if all(len(path) == 2 for path in sources):
+
+        def extract(data):
+            for source_key, field_key in sources:
+                source = data.get(source_key)
+                if type(source) is not dict:
+                    continue
+                value = source.get(field_key, MISSING)
+                if value is MISSING:
+                    continue
+                if coerce is not None:
+                    value = coerce(value)
+                    if value is MISSING:
+                        continue
+                return value
+            return default
+
+        return extract
+
+    def extract_generic(data):
+        for path in sources:
+            value = lookup_path(data, path)
+            if value is MISSING:
+                continue
+            if coerce is not None:
+                value = coerce(value)
+                if value is MISSING:
+                    continue
+            return value
+        return default
+
+    return extract_generic
+
+
+def compile_field_registry(registry: dict) -> dict:
+    """{colonne: spécification} -> {colonne: fonction d'extraction(data)}"""
+    return {name: compile_field_extractor(spec) for name, spec in registry.items()}
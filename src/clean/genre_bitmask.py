@@ -0,0 +1,225 @@
+from functools import lru_cache
+import numpy as np
+
+# Genres d'un jeu encodés en un entier : bit i = GENRE_KEYWORDS[i]
+# Les sources (PlatPrices, GGDeals, tags) se fusionnent par un OU binaire
+
+GENRE_KEYWORDS = [
+    "GenreAction",
+    "GenreAdventure",
+    "GenreCasual",
+    "GenreMMO",
+    "GenreRacing",
+    "GenreRPG",
+    "GenreSimulation",
+    "GenreSports",
+    "GenreStrategy",
+    "GenreTPS",
+    "GenreFPS",
+    "GenrePlatformer",
+    "GenreFighting",
+    "GenreArcade",
+    "GenrePuzzle",
+    "GenreMusic",
+    "GenreHorror",
+]
+
+# Nom exporté dans la colonne genres ("GenreAction" -> "Action")
+GENRE_NAMES = [keyword.replace("Genre", "") for keyword in GENRE_KEYWORDS]
+
+GENRE_BITS = {keyword: 1 << i for i, keyword in enumerate(GENRE_KEYWORDS)}
+
+# Mapping des tags GGDeals vers les genres
+TAG_TO_GENRE = {
+    # Action
+    "Action": "GenreAction",
+    "Action Roguelike": "GenreAction",
+    "Action RTS": "GenreAction",
+    "Action Games": "GenreAction",
+    "Character Action Game": "GenreAction",
+    "Hack and Slash": "GenreAction",
+    "Beat 'em up": "GenreAction",
+    "Spectacle fighter": "GenreAction",
+    # Adventure
+    "Adventure": "GenreAdventure",
+    "Action-Adventure": "GenreAdventure",
+    "Choose Your Own Adventure": "GenreAdventure",
+    "Point & Click": "GenreAdventure",
+    "Walking Simulator": "GenreAdventure",
+    "Visual Novel": "GenreAdventure",
+    "Interactive Fiction": "GenreAdventure",
+    # Casual
+    "Casual": "GenreCasual",
+    "Family Friendly": "GenreCasual",
+    "Wholesome": "GenreCasual",
+    "Cozy": "GenreCasual",
+    "Relaxing": "GenreCasual",
+    "Party Game": "GenreCasual",
+    "Party": "GenreCasual",
+    "Clicker": "GenreCasual",
+    "Idler": "GenreCasual",
+    # MMO
+    "Massively Multiplayer": "GenreMMO",
+    "MMORPG": "GenreMMO",
+    "MOBA": "GenreMMO",
+    # Racing
+    "Racing": "GenreRacing",
+    "Driving": "GenreRacing",
+    "Combat Racing": "GenreRacing",
+    "Automobile Sim": "GenreRacing",
+    "Motocross": "GenreRacing",
+    "Motorbike": "GenreRacing",
+    "Bikes": "GenreRacing",
+    "ATV": "GenreRacing",
+    "Offroad": "GenreRacing",
+    # RPG
+    "RPG": "GenreRPG",
+    "JRPG": "GenreRPG",
+    "Action RPG": "GenreRPG",
+    "Tactical RPG": "GenreRPG",
+    "Strategy RPG": "GenreRPG",
+    "CRPG": "GenreRPG",
+    "Party-Based RPG": "GenreRPG",
+    "Dungeon Crawler": "GenreRPG",
+    "Souls-like": "GenreRPG",
+    "RPGMaker": "GenreRPG",
+    # Simulation
+    "Simulation": "GenreSimulation",
+    "Life Sim": "GenreSimulation",
+    "Farming Sim": "GenreSimulation",
+    "City Builder": "GenreSimulation",
+    "Colony Sim": "GenreSimulation",
+    "Management": "GenreSimulation",
+    "Tycoon games": "GenreSimulation",
+    "Medical Sim": "GenreSimulation",
+    "Job Simulator": "GenreSimulation",
+    "Flight": "GenreSimulation",
+    "Space Sim": "GenreSimulation",
+    "Political Sim": "GenreSimulation",
+    "God Game": "GenreSimulation",
+    "Hobby Sim": "GenreSimulation",
+    # Sports
+    "Sports": "GenreSports",
+    "Football (American)": "GenreSports",
+    "Basketball": "GenreSports",
+    "Baseball": "GenreSports",
+    "Football (Soccer)": "GenreSports",
+    "Tennis": "GenreSports",
+    "Hockey": "GenreSports",
+    "Golf": "GenreSports",
+    "Volleyball": "GenreSports",
+    "Rugby": "GenreSports",
+    "Cricket": "GenreSports",
+    "Badminton": "GenreSports",
+    "Boxing": "GenreSports",
+    "Wrestling": "GenreSports",
+    "Skateboarding": "GenreSports",
+    "Snowboarding": "GenreSports",
+    "Skiing": "GenreSports",
+    "Cycling": "GenreSports",
+    "BMX": "GenreSports",
+    "Skating": "GenreSports",
+    # Strategy
+    "Strategy": "GenreStrategy",
+    "Turn-Based Strategy": "GenreStrategy",
+    "Turn-Based Tactics": "GenreStrategy",
+    "Real Time Tactics": "GenreStrategy",
+    "RTS": "GenreStrategy",
+    "Grand Strategy": "GenreStrategy",
+    "4X": "GenreStrategy",
+    "Tower Defense": "GenreStrategy",
+    "Tactical": "GenreStrategy",
+    "Wargame": "GenreStrategy",
+    # TPS (Third Person Shooter)
+    "Third-Person Shooter": "GenreTPS",
+    "Third Person": "GenreTPS",
+    # FPS (First Person Shooter)
+    "FPS": "GenreFPS",
+    "First-Person": "GenreFPS",
+    "Boomer Shooter": "GenreFPS",
+    "Arena Shooter": "GenreFPS",
+    "Hero Shooter": "GenreFPS",
+    "Extraction Shooter": "GenreFPS",
+    "Looter Shooter": "GenreFPS",
+    # Platformer
+    "Platformer": "GenrePlatformer",
+    "2D Platformer": "GenrePlatformer",
+    "3D Platformer": "GenrePlatformer",
+    "Precision Platformer": "GenrePlatformer",
+    "Puzzle Platformer": "GenrePlatformer",
+    "Metroidvania": "GenrePlatformer",
+    # Fighting
+    "Fighting": "GenreFighting",
+    "2D Fighter": "GenreFighting",
+    "3D Fighter": "GenreFighting",
+    "Martial Arts": "GenreFighting",
+    # Arcade
+    "Arcade": "GenreArcade",
+    "Score Attack": "GenreArcade",
+    "Bullet Hell": "GenreArcade",
+    "Shoot 'Em Up": "GenreArcade",
+    "Twin Stick Shooter": "GenreArcade",
+    "Top-Down Shooter": "GenreArcade",
+    "Pinball": "GenreArcade",
+    # Puzzle
+    "Puzzle": "GenrePuzzle",
+    "Logic": "GenrePuzzle",
+    "Match 3": "GenrePuzzle",
+    "Sokoban": "GenrePuzzle",
+    "Hidden Object": "GenrePuzzle",
+    "Maze": "GenrePuzzle",
+    "Escape Room": "GenrePuzzle",
+    # Music
+    "Music": "GenreMusic",
+    "Rhythm": "GenreMusic",
+    "Music-Based Procedural Generation": "GenreMusic",
+    # Horror
+    "Horror": "GenreHorror",
+    "Survival Horror": "GenreHorror",
+    "Psychological Horror": "GenreHorror",
+}
+
+# Table tag -> bit, calculée une seule fois
+TAG_TO_GENRE_BIT = {tag: GENRE_BITS[genre] for tag, genre in TAG_TO_GENRE.items()}
+
+GENRE_NAME_TO_BIT = {name: 1 << i for i, name in enumerate(GENRE_NAMES)}
+
+
+def genre_mask_from_tags(tags) -> int:
+    mask = 0
+    for tag in tags:
+        mask |= TAG_TO_GENRE_BIT.get(tag, 0)
+    return mask
+
+
+def genre_mask_from_flags(source) -> int:
+    """Source {"GenreAction": 1, ...} (PlatPrices, GGDeals) -> masque."""
+    mask = 0
+    for keyword, bit in GENRE_BITS.items():
+        if source.get(keyword, 0) == 1:
+            mask |= bit
+    return mask
+
+
+def genre_mask_to_flags(mask: int) -> dict:
+    return {keyword: 1 if mask & bit else 0 for keyword, bit in GENRE_BITS.items()}
+
+
+@lru_cache(maxsize=None)
+def genre_mask_to_names(mask: int) -> tuple:
+    # Peu de combinaisons distinctes dans le catalogue : résultat mis en cache
+    return tuple(name for i, name in enumerate(GENRE_NAMES) if mask >> i & 1)
+
+
+def genre_names_to_mask(names) -> int:
+    mask = 0
+    for name in names:
+        mask |= GENRE_NAME_TO_BIT.get(name.strip(), 0)
+    return mask
+
+
+def genre_masks_to_onehot(masks) -> np.ndarray:
+    """Masques (n,) -> matrice one-hot uint8 (n, 17), colonnes dans l'ordre GENRE_NAMES."""
+    masks = np.asarray(masks, dtype=np.int64)
+    bits = np.arange(len(GENRE_NAMES), dtype=np.int64)
+    return ((masks[:, None] >> bits) & 1).astype(np.uint8)
@@ -0,0 +1,94 @@
+from pathlib import Path
+import hashlib
+import inspect
+import json
+import os
+import pickle
+
+from src.features.stage_cache import get_source_modules
+
+# Store sidecar du nettoyage incrémental :
+# {short_url_name: {hash du brut: ligne extraite ou None si le jeu est filtré}}
+
+# A incrémenter si le format des lignes change sans modifier les modules d'extraction
+INCREMENTAL_STORE_VERSION = 1
+
+
+def get_extraction_sources() -> list:
+    """
+    Fichiers dont le code détermine le contenu des lignes extraites :
+    clean_raw_data et les modules src.* qu'il importe, récursivement
+    (helpers, registre des champs, constantes...).
+    """
+    # Import local : clean_raw_data importe ce module
+    from src.clean.clean_raw_data import process_raw_game
+
+    return [
+        Path(inspect.getfile(module)) for module in get_source_modules(process_raw_game)
+    ]
+
+
+def hash_raw_game(data) -> str:
+    """Empreinte du contenu brut d'un jeu (PSStore, GGDeals, PlatPrices...)."""
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_settings_key(
+    released_date_filter,
+    min_price_ps5: float,
+    min_price_ps4: float,
+    min_price_dlc: float,
+) -> str:
+    """
+    Clé de validité du store : filtres du run et code d'extraction.
+    Un changement de l'un ou de l'autre invalide toutes les lignes gardées.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(INCREMENTAL_STORE_VERSION).encode("utf-8"))
+    digest.update(
+        repr(
+            (
+                released_date_filter.isoformat(),
+                min_price_ps5,
+                min_price_ps4,
+                min_price_dlc,
+            )
+        ).encode("utf-8")
+    )
+    for source in get_extraction_sources():
+        digest.update(source.read_bytes())
+
+    return digest.hexdigest()
+
+
+def load_incremental_store(file_path, settings_key: str) -> dict:
+    if not os.path.exists(file_path):
+        return {}
+
+    try:
+        with open(file_path, "rb") as fp:
+            store = pickle.load(fp)
+    except Exception as e:
+        print(f"Store incrémental illisible, extraction complète: {e}")
+        return {}
+
+    if store.get("settings_key") != settings_key:
+        print(
+            "Store incrémental obsolète (filtres ou code modifiés), extraction complète"
+        )
+        return {}
+
+    return store["games"]
+
+
+def save_incremental_store(file_path, settings_key: str, games: dict):
+    # Écriture dans un fichier temporaire puis remplacement atomique
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "wb") as fp:
+        pickle.dump(
+            {"settings_key": settings_key, "games": games},
+            fp,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(tmp_path, file_path)
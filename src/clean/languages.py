@@ -0,0 +1,140 @@
+from functools import lru_cache
+import json
+import re
+import numpy as np
+
+# Langues voix/sous-titres : table interne nom -> id et bitsets uint64
+# (bit i = LANGUAGE_NAMES[i], bit LANGUAGE_OTHER_ID = langue hors table)
+
+# Mapping des codes langue PlatPrices vers noms complets
+LANGUAGE_CODE_TO_NAME = {
+    "en": "English",
+    "fr": "French",
+    "de": "German",
+    "pt_BR": "Portuguese (Brazil)",
+    "es": "Spanish",
+    "nl": "Dutch",
+    "it": "Italian",
+    "ch": "Chinese",
+    "zh": "Chinese (Simplified)",
+    "pl": "Polish",
+    "ru": "Russian",
+    "pt": "Portuguese",
+    "pt_PT": "Portuguese",
+    "ja": "Japanese",
+    "in": "Indonesian",
+    "tr": "Turkish",
+    "ko": "Korean",
+    "es_MX": "Spanish (Mexico)",
+    "ar": "Arabic",
+    "ca": "Catalan",
+    "uk": "Ukrainian",
+    "hu": "Hungarian",
+    "cs": "Czech",
+    "no": "Norwegian",
+    "sv": "Swedish",
+    "th": "Thai",
+    "fi": "Finnish",
+    "hi": "Hindi",
+    "hr": "Croatian",
+    "eu": "Basque",
+    "da": "Danish",
+    "ms": "Malay",
+    # Codes moins courants (ignorés ou mappés)
+    "ch_HK": "Chinese",
+    "en_GR": "English",
+    "en_CZ": "English",
+    "fr_CA": "French",
+    "fr_BE": "French",
+    "sk": "Slovaque",  # Slovaque - non dans ta liste
+    "el": "Grec",  # Grec
+    "ro": "Roumain",  # Roumain
+    "he": "Hébreu",  # Hébreu
+    "bg": "Bulgare",  # Bulgare
+    "vi": "Vietnamien",  # Vietnamien
+    "sl": "Slovène",  # Slovène
+    "tl": "Tagalog",  # Tagalog
+    "ga": "Irlandais",  # Irlandais
+    "gl": "Galicien",  # Galicien
+    "cy": "Gallois",  # Gallois
+    "af": "Afrikaans",  # Afrikaans
+    "gd": "Gaélique",  # Gaélique écossais
+}
+
+LANGUAGE_NAMES = list(dict.fromkeys(LANGUAGE_CODE_TO_NAME.values()))
+
+LANGUAGE_IDS = {name: i for i, name in enumerate(LANGUAGE_NAMES)}
+
+# Dernier bit du bitset : langues absentes de la table (noms GGDeals non prévus)
+LANGUAGE_OTHER_ID = 63
+
+LANGUAGE_NAME_BITS = {name: 1 << i for name, i in LANGUAGE_IDS.items()}
+
+
+def codes_to_languages(codes):
+    languages = []
+    seen = set()
+    for code in codes:
+        lang_name = LANGUAGE_CODE_TO_NAME.get(code)
+        if lang_name is not None and lang_name not in seen:  # Éviter les doublons
+            seen.add(lang_name)
+            languages.append(lang_name)
+    return languages
+
+
+def parse_language_string(lang_string) -> list:
+    """Chaîne PlatPrices ('["en", "fr"]', '{"0":"en"}' ou 'en') -> noms de langues."""
+    try:
+        # Nettoyer la chaîne et parser
+        lang_string = lang_string.strip()
+
+        # Cas 1: Array JSON standard [\"en\", \"fr\"]
+        if lang_string.startswith("["):
+            # Réparer les JSON malformés (manque crochets fermants)
+            if not lang_string.endswith("]"):
+                lang_string += "]"
+            codes = json.loads(lang_string)
+
+        # Cas 2: Objet JSON {\"0\":\"en\", \"1\":\"fr\"}
+        elif lang_string.startswith("{"):
+            # Réparer les JSON malformés
+            if not lang_string.endswith("}"):
+                lang_string += "}"
+            obj = json.loads(lang_string)
+            codes = list(obj.values())
+
+        # Cas 3: Code isolé \"en\"
+        else:
+            codes = [lang_string.strip('"')]
+
+        # Convertir les codes en noms de langues
+        return codes_to_languages([code.strip() for code in codes])
+
+    except (json.JSONDecodeError, Exception):
+        # En cas d'erreur, essayer d'extraire manuellement les codes
+        codes = re.findall(r"\"([a-z_A-Z]+)\"", lang_string)
+        return codes_to_languages(codes)
+
+
+@lru_cache(maxsize=16384)
+def parse_language_string_cached(lang_string: str) -> tuple:
+    # Peu de chaînes distinctes dans le catalogue : parsing mis en cache
+    return tuple(parse_language_string(lang_string))
+
+
+def languages_to_bitset(languages) -> int:
+    bitset = 0
+    for name in languages:
+        bitset |= LANGUAGE_NAME_BITS.get(name, 1 << LANGUAGE_OTHER_ID)
+    return bitset
+
+
+def bitset_to_languages(bitset: int) -> list:
+    """Noms des langues de la table présentes dans le bitset (sans LANGUAGE_OTHER_ID)."""
+    return [name for i, name in enumerate(LANGUAGE_NAMES) if bitset >> i & 1]
+
+
+def languages_count(bitsets) -> np.ndarray:
+    """Nombre de langues par jeu (popcount des bitsets uint64)."""
+    bitsets = np.asarray(bitsets, dtype=np.uint64)
+    return np.bitwise_count(bitsets).astype(np.int64)
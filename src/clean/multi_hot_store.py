@@ -0,0 +1,180 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Colonnes multi-valuées ("Action,RPG") en multi-hot creux au format CSR,
+# à côté du dataset nettoyé (même ordre de lignes que le CSV) :
+#   keys.npy                : short_url_name de chaque jeu
+#   {col}_indptr.npy        : int64, les labels du jeu i sont indices[indptr[i]:indptr[i + 1]]
+#   {col}_indices.npy       : int32, position du label dans le vocabulaire
+#   {col}_vocabulary.json   : labels de la colonne
+
+MULTI_HOT_DIR_NAME = "games_multi_hot"
+
+MULTI_VALUED_COLUMNS = [
+    "genres",
+    "voice_languages",
+    "subtitle_languages",
+    "rating_descriptions",
+]
+
+
+def split_labels(value) -> list:
+    # Même découpage que .str.split(",").str.strip(), valeurs vides ignorées
+    if not isinstance(value, str):
+        return []
+    return [label.strip() for label in value.split(",") if label.strip()]
+
+
+def encode_multi_hot(values, vocabulary=None):
+    """
+    Chaînes "a,b,c" -> (indptr, indices, vocabulaire).
+    Sans vocabulaire fourni, les labels sont numérotés par ordre d'apparition ;
+    avec un vocabulaire, les labels inconnus sont ignorés.
+    """
+    fixed_vocabulary = vocabulary is not None
+    vocabulary = list(vocabulary) if fixed_vocabulary else []
+    label_ids = {label: i for i, label in enumerate(vocabulary)}
+
+    # Peu de combinaisons distinctes : chaque chaîne n'est découpée qu'une fois
+    ids_by_value = {}
+    indptr = [0]
+    indices = []
+
+    for value in values:
+        key = value if isinstance(value, str) else None
+        ids = ids_by_value.get(key)
+        if ids is None:
+            ids = []
+            for label in split_labels(value):
+                label_id = label_ids.get(label)
+                if label_id is None:
+                    if fixed_vocabulary:
+                        continue
+                    label_id = len(vocabulary)
+                    label_ids[label] = label_id
+                    vocabulary.append(label)
+                if label_id not in ids:
+                    ids.append(label_id)
+            ids = sorted(ids)
+            ids_by_value[key] = ids
+        indices.extend(ids)
+        indptr.append(len(indices))
+
+    return (
+        np.array(indptr, dtype=np.int64),
+        np.array(indices, dtype=np.int32),
+        vocabulary,
+    )
+
+
+class MultiHotColumn:
+    """Une colonne multi-hot : matrice CSR (jeux x labels) et son vocabulaire."""
+
+    def __init__(self, indptr, indices, vocabulary):
+        self.indptr = indptr
+        self.indices = indices
+        self.vocabulary = vocabulary
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def to_csr(self):
+        """Matrice scipy.sparse (uint8), utilisable directement par scikit-learn."""
+        from scipy.sparse import csr_matrix
+
+        data = np.ones(len(self.indices), dtype=np.uint8)
+        return csr_matrix(
+            (data, self.indices, self.indptr),
+            shape=(len(self), len(self.vocabulary)),
+        )
+
+    def take(self, rows):
+        """Sous-ensemble de lignes (masque booléen ou positions), ordre conservé."""
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+
+        starts = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - starts
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+
+        # Position de chaque label gardé dans indices d'origine
+        offsets = np.repeat(starts - indptr[:-1], lengths)
+        positions = np.arange(indptr[-1], dtype=np.int64) + offsets
+        return MultiHotColumn(indptr, self.indices[positions], self.vocabulary)
+
+    def row_ids(self):
+        # Ligne de chaque entrée de indices
+        return np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.indptr))
+
+    def label_counts(self) -> pd.Series:
+        counts = np.bincount(self.indices, minlength=len(self.vocabulary))
+        return pd.Series(counts, index=self.vocabulary)
+
+    def top_k_counts(self, k: int) -> pd.Series:
+        """Les k labels les plus fréquents (nombre de jeux par label)."""
+        counts = self.label_counts()
+        counts = counts[counts > 0]
+        return counts.sort_values(ascending=False, kind="stable").head(k)
+
+    def group_means(self, values) -> pd.Series:
+        """Moyenne de values (une valeur par jeu) pour chaque label, NaN ignorés."""
+        values = np.asarray(values, dtype=np.float64)
+        entry_values = values[self.row_ids()]
+        valid = ~np.isnan(entry_values)
+
+        label_ids = self.indices[valid]
+        sums = np.bincount(
+            label_ids, weights=entry_values[valid], minlength=len(self.vocabulary)
+        )
+        counts = np.bincount(label_ids, minlength=len(self.vocabulary))
+
+        present = counts > 0
+        return pd.Series(
+            sums[present] / counts[present],
+            index=np.array(self.vocabulary, dtype=object)[present],
+        )
+
+
+def write_multi_hot_store(
+    df, output_dir, columns=MULTI_VALUED_COLUMNS, key_col="short_url_name"
+):
+    os.makedirs(output_dir, exist_ok=True)
+    keys = np.array(df[key_col].astype(str).to_numpy(), dtype=str)
+    np.save(os.path.join(output_dir, "keys.npy"), keys)
+
+    for col in columns:
+        if col not in df.columns:
+            continue
+        indptr, indices, vocabulary = encode_multi_hot(df[col])
+        np.save(os.path.join(output_dir, f"{col}_indptr.npy"), indptr)
+        np.save(os.path.join(output_dir, f"{col}_indices.npy"), indices)
+        with open(
+            os.path.join(output_dir, f"{col}_vocabulary.json"), "w", encoding="utf-8"
+        ) as fp:
+            json.dump(vocabulary, fp, ensure_ascii=False)
+
+    return output_dir
+
+
+def load_multi_hot_store(input_dir, mmap: bool = True) -> dict:
+    """Retourne {"keys": tableau des short_url_name, colonne: MultiHotColumn}."""
+    mmap_mode = "r" if mmap else None
+    store = {"keys": np.load(os.path.join(input_dir, "keys.npy"))}
+
+    for col in MULTI_VALUED_COLUMNS:
+        vocabulary_path = os.path.join(input_dir, f"{col}_vocabulary.json")
+        if not os.path.exists(vocabulary_path):
+            continue
+        with open(vocabulary_path, "r", encoding="utf-8") as fp:
+            vocabulary = json.load(fp)
+        store[col] = MultiHotColumn(
+            np.load(os.path.join(input_dir, f"{col}_indptr.npy"), mmap_mode=mmap_mode),
+            np.load(os.path.join(input_dir, f"{col}_indices.npy"), mmap_mode=mmap_mode),
+            vocabulary,
+        )
+
+    return store
@@ -0,0 +1,176 @@
+from pathlib import Path
+import argparse
+import csv
+import json
+import mmap
+import os
+import shutil
+
+import pandas as pd
+
+from src.clean.clean_raw_data_helper import get_id_store
+from src.clean.raw_json_reader import iter_raw_json_array
+
+# Découpage du catalogue brut (un seul tableau JSON) en N fichiers NDJSON :
+# une ligne {game_key: data} par jeu, les shards se suivent dans l'ordre du
+# fichier d'origine. Un index short_url_name / id_store -> (shard, offset,
+# longueur) permet de relire un jeu sans parcourir le reste.
+# Lancer : python -m src.clean.ndjson_shards --shards 16
+
+RAW_CATALOGUE_FILE = "data/raw/psstore_all_games.json"
+SHARDS_DIR = "data/raw/psstore_all_games_shards"
+
+MANIFEST_FILE = "manifest.json"
+INDEX_FILE = "index.csv"
+INDEX_COLUMNS = ["short_url_name", "id_store", "shard", "offset", "length"]
+
+
+def shard_file_name(shard: int) -> str:
+    return f"games_{shard:03d}.ndjson"
+
+
+def write_ndjson_shards(raw_path, output_dir, n_shards: int = 16):
+    """
+    Réécrit le tableau JSON brut en n_shards fichiers NDJSON de tailles proches
+    (lecture en flux). Écrit aussi manifest.json et index.csv dans output_dir.
+    Retourne le manifest.
+    """
+    # On repart d'un dossier vide : pas de shards d'un découpage précédent
+    if os.path.exists(output_dir):
+        shutil.rmtree(output_dir)
+    os.makedirs(output_dir)
+
+    # Shards contigus : un nouveau shard commence quand le précédent atteint
+    # sa part de la taille du fichier brut
+    target_bytes = max(1, os.path.getsize(raw_path) // n_shards)
+
+    shards = []
+    shard_fp = None
+    offset = 0
+
+    with open(raw_path, "r", encoding="utf-8") as raw_fp, open(
+        os.path.join(output_dir, INDEX_FILE), "w", encoding="utf-8", newline=""
+    ) as index_fp:
+        index_writer = csv.writer(index_fp)
+        index_writer.writerow(INDEX_COLUMNS)
+
+        try:
+            for game in iter_raw_json_array(raw_fp):
+                if shard_fp is None or (
+                    offset >= target_bytes and len(shards) < n_shards
+                ):
+                    if shard_fp is not None:
+                        shard_fp.close()
+                    shards.append(
+                        {"file": shard_file_name(len(shards)), "games": 0, "bytes": 0}
+                    )
+                    shard_fp = open(os.path.join(output_dir, shards[-1]["file"]), "wb")
+                    offset = 0
+
+                line = json.dumps(game, ensure_ascii=False).encode("utf-8") + b"\n"
+                shard_fp.write(line)
+
+                for game_key, data in game.items():
+                    index_writer.writerow(
+                        [
+                            game_key,
+                            get_id_store(data),
+                            len(shards) - 1,
+                            offset,
+                            len(line),
+                        ]
+                    )
+                shards[-1]["games"] += 1
+                shards[-1]["bytes"] += len(line)
+                offset += len(line)
+        finally:
+            if shard_fp is not None:
+                shard_fp.close()
+
+    manifest = {
+        "source": os.path.basename(raw_path),
+        "source_bytes": os.path.getsize(raw_path),
+        "games": sum(shard["games"] for shard in shards),
+        "shards": shards,
+    }
+    with open(os.path.join(output_dir, MANIFEST_FILE), "w", encoding="utf-8") as fp:
+        json.dump(manifest, fp, indent=2)
+
+    return manifest
+
+
+def is_sharded_catalogue(path) -> bool:
+    return os.path.isdir(path) and os.path.exists(os.path.join(path, MANIFEST_FILE))
+
+
+def load_manifest(shard_dir) -> dict:
+    with open(os.path.join(shard_dir, MANIFEST_FILE), "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def get_shard_paths(shard_dir) -> list:
+    return [
+        os.path.join(shard_dir, shard["file"])
+        for shard in load_manifest(shard_dir)["shards"]
+    ]
+
+
+def iter_shard_games(shard_path):
+    """Jeux {game_key: data} d'un shard, lus ligne par ligne via mmap."""
+    with open(shard_path, "rb") as fp:
+        # mmap refuse les fichiers vides
+        if os.fstat(fp.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                yield json.loads(line)
+
+
+def iter_sharded_games(shard_dir):
+    """Tous les jeux du catalogue découpé, dans l'ordre du fichier d'origine."""
+    for shard_path in get_shard_paths(shard_dir):
+        yield from iter_shard_games(shard_path)
+
+
+def load_shard_index(shard_dir) -> pd.DataFrame:
+    return pd.read_csv(
+        os.path.join(shard_dir, INDEX_FILE),
+        dtype={"short_url_name": "object", "id_store": "object"},
+    )
+
+
+def read_raw_game(shard_dir, key, by="short_url_name", index=None):
+    """
+    Relit un seul jeu {game_key: data} par short_url_name ou id_store,
+    sans décoder le reste du shard. Retourne None si la clé est absente.
+    index : résultat de load_shard_index, à réutiliser pour plusieurs lectures.
+    """
+    if index is None:
+        index = load_shard_index(shard_dir)
+
+    matches = index[index[by] == key]
+    if matches.empty:
+        return None
+
+    entry = matches.iloc[0]
+    shard_path = os.path.join(shard_dir, shard_file_name(int(entry["shard"])))
+    with open(shard_path, "rb") as fp:
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = int(entry["offset"])
+            line = mm[start : start + int(entry["length"])]
+
+    return json.loads(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--raw", default=os.path.join(Path.cwd(), RAW_CATALOGUE_FILE))
+    parser.add_argument("--output", default=os.path.join(Path.cwd(), SHARDS_DIR))
+    parser.add_argument("--shards", type=int, default=16)
+    args = parser.parse_args()
+
+    manifest = write_ndjson_shards(args.raw, args.output, n_shards=args.shards)
+    print(
+        f"{manifest['games']} jeux écrits en {len(manifest['shards'])} shards"
+        f" NDJSON: {args.output}"
+    )
@@ -0,0 +1,108 @@
+import json
+import os
+import numpy as np
+
+# Stockage colonnaire des historiques de prix, à côté du dataset nettoyé :
+#   keys.npy    : short_url_name de chaque jeu (même ordre que le CSV)
+#   offsets.npy : int64, l'historique du jeu i est [offsets[i], offsets[i + 1])
+#   dates.npy   : int32, numéro de jour depuis le 1970-01-01
+#   prices.npy  : float32
+
+PRICE_HISTORY_DIR_NAME = "games_price_history"
+
+
+def dates_to_day_numbers(date_strings) -> np.ndarray:
+    """Dates "YYYY-MM-DD" des historiques en numéros de jour (int32)."""
+    try:
+        # Conversion vectorisée des dates en numéros de jour
+        return np.array(date_strings, dtype="datetime64[D]").astype(np.int32)
+    except ValueError:
+        pass
+
+    # Dates acceptées par strptime mais pas par numpy ("2024-1-3") : même
+    # parsing que la fusion des historiques (import local : le helper importe
+    # ce module)
+    from src.clean.clean_raw_data_helper import parse_day_number
+
+    return np.array(list(map(parse_day_number, date_strings)), dtype=np.int32)
+
+
+def encode_price_histories(histories, price_dtype=np.float32):
+    """
+    Convertit des historiques [{"x": "YYYY-MM-DD", "y": prix}, ...]
+    (ou leur chaîne JSON, ou None) en tableaux plats offsets/dates/prix.
+    """
+    offsets = [0]
+    date_strings = []
+    prices = []
+
+    for history in histories:
+        if isinstance(history, str):
+            history = json.loads(history)
+        if history:
+            for entry in history:
+                date_strings.append(entry["x"])
+                prices.append(entry["y"])
+        offsets.append(len(date_strings))
+
+    dates = dates_to_day_numbers(date_strings)
+
+    return (
+        np.array(offsets, dtype=np.int64),
+        dates,
+        np.array(prices, dtype=price_dtype),
+    )
+
+
+def write_price_history_store(
+    df, output_dir, key_col="short_url_name", history_col="price_history"
+):
+    offsets, dates, prices = encode_price_histories(df[history_col])
+    keys = np.array(df[key_col].astype(str).to_numpy(), dtype=str)
+
+    os.makedirs(output_dir, exist_ok=True)
+    np.save(os.path.join(output_dir, "keys.npy"), keys)
+    np.save(os.path.join(output_dir, "offsets.npy"), offsets)
+    np.save(os.path.join(output_dir, "dates.npy"), dates)
+    np.save(os.path.join(output_dir, "prices.npy"), prices)
+
+    return output_dir
+
+
+class PriceHistoryStore:
+    """Accès aux historiques par jeu : vues NumPy sans copie sur les tableaux plats."""
+
+    def __init__(self, keys, offsets, dates, prices):
+        self.keys = keys
+        self.offsets = offsets
+        self.dates = dates
+        self.prices = prices
+        self._index_by_key = {key: i for i, key in enumerate(keys.tolist())}
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def get(self, game_index: int):
+        """Retourne (dates, prix) du jeu à la position game_index."""
+        start = self.offsets[game_index]
+        end = self.offsets[game_index + 1]
+        return self.dates[start:end], self.prices[start:end]
+
+    def get_by_key(self, short_url_name: str):
+        game_index = self._index_by_key.get(short_url_name)
+        if game_index is None:
+            return None
+        return self.get(game_index)
+
+    def lengths(self):
+        return np.diff(self.offsets)
+
+
+def load_price_history_store(input_dir, mmap: bool = True) -> PriceHistoryStore:
+    mmap_mode = "r" if mmap else None
+    return PriceHistoryStore(
+        keys=np.load(os.path.join(input_dir, "keys.npy")),
+        offsets=np.load(os.path.join(input_dir, "offsets.npy"), mmap_mode=mmap_mode),
+        dates=np.load(os.path.join(input_dir, "dates.npy"), mmap_mode=mmap_mode),
+        prices=np.load(os.path.join(input_dir, "prices.npy"), mmap_mode=mmap_mode),
+    )
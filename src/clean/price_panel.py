@@ -0,0 +1,245 @@
+import os
+import numpy as np
+
+from src.clean.clean_raw_data_helper import release_dates_to_day_numbers
+from src.clean.price_history_store import encode_price_histories
+
+# Panel dense des prix journaliers : une ligne par jeu (même ordre que le CSV),
+# une colonne par jour depuis la sortie (colonne 0 = jour de sortie).
+# Chaque historique est prolongé jusqu'au relevé suivant (forward fill), NaN avant
+# le premier relevé. Stocké en float32 dans un .npy relu en mmap : les questions
+# « prix au jour N », « prix minimum sur une fenêtre », « premier jour sous un
+# seuil » se posent pour tous les jeux à la fois, sans reparcourir les historiques.
+# Mêmes règles que days_until_first_discount_batch : relevés avant la sortie et
+# prix sous min_price ignorés, jeux sans date de sortie entièrement à NaN.
+
+PRICE_PANEL_FILE_NAME = "games_price_panel.npy"
+
+# Jeux traités par bloc (construction et requêtes) : mémoire bornée par
+# GAMES_PER_CHUNK x n_days, quelle que soit la taille du panel
+GAMES_PER_CHUNK = 2048
+
+
+def get_panel_days(offsets, dates, release_days) -> int:
+    """Nombre de jours du panel : du jour de sortie au dernier relevé, tous jeux."""
+    n_games = len(offsets) - 1
+    if n_games == 0 or len(dates) == 0:
+        return 1
+    game_ids = np.repeat(np.arange(n_games), np.diff(offsets))
+    days_since_release = dates - release_days[game_ids]
+    days_since_release = days_since_release[np.isfinite(days_since_release)]
+    if len(days_since_release) == 0:
+        return 1
+    return max(1, int(days_since_release.max()) + 1)
+
+
+def fill_panel_chunk(offsets, dates, prices, release_days, n_days, min_price):
+    """Lignes du panel pour un bloc de jeux (offsets relatifs au bloc)."""
+    n_games = len(offsets) - 1
+    chunk = np.full((n_games, n_days), np.inf, dtype=np.float32)
+
+    game_ids = np.repeat(np.arange(n_games), np.diff(offsets))
+    days_since_release = dates - release_days[game_ids]
+    # Une date de sortie NaN rend toutes les entrées du jeu inéligibles
+    eligible = (
+        (prices >= min_price)
+        & (days_since_release >= 0)
+        & (days_since_release < n_days)
+    )
+    # Plusieurs relevés le même jour : le plus bas compte
+    np.minimum.at(
+        chunk,
+        (game_ids[eligible], days_since_release[eligible].astype(np.int64)),
+        prices[eligible].astype(np.float32),
+    )
+
+    # Forward fill : chaque jour prend la colonne du dernier relevé connu
+    has_price = np.isfinite(chunk)
+    last_columns = np.where(has_price, np.arange(n_days), 0)
+    np.maximum.accumulate(last_columns, axis=1, out=last_columns)
+    chunk = np.take_along_axis(chunk, last_columns, axis=1)
+    # Jours avant le premier relevé (colonne 0 sans prix)
+    chunk[np.isinf(chunk)] = np.nan
+    return chunk
+
+
+def build_price_panel(
+    offsets,
+    dates,
+    prices,
+    release_days,
+    output_path,
+    n_days=None,
+    min_price=0.1,
+    games_per_chunk=GAMES_PER_CHUNK,
+):
+    """
+    Écrit le panel (n_jeux x n_days, float32) dans output_path (.npy) depuis les
+    tableaux plats de price_history_store, bloc de jeux par bloc de jeux.
+    n_days : None pour couvrir jusqu'au dernier relevé. Retourne le panel en mmap.
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    dates = np.asarray(dates, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    release_days = np.asarray(release_days, dtype=np.float64)
+
+    if n_days is None:
+        n_days = get_panel_days(offsets, dates, release_days)
+    n_games = len(offsets) - 1
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    panel = np.lib.format.open_memmap(
+        output_path, mode="w+", dtype=np.float32, shape=(n_games, n_days)
+    )
+
+    for start in range(0, n_games, games_per_chunk):
+        end = min(start + games_per_chunk, n_games)
+        first, last = offsets[start], offsets[end]
+        panel[start:end] = fill_panel_chunk(
+            offsets[start : end + 1] - first,
+            dates[first:last],
+            prices[first:last],
+            release_days[start:end],
+            n_days,
+            min_price,
+        )
+
+    panel.flush()
+    return np.load(output_path, mmap_mode="r")
+
+
+def write_price_panel(
+    df,
+    output_path,
+    history_col="price_history",
+    release_col="release_date",
+    n_days=None,
+    min_price=0.1,
+):
+    """Panel des historiques du DataFrame nettoyé (même ordre de lignes)."""
+    offsets, dates, prices = encode_price_histories(
+        df[history_col], price_dtype=np.float64
+    )
+    return build_price_panel(
+        offsets,
+        dates,
+        prices,
+        release_dates_to_day_numbers(df[release_col]),
+        output_path,
+        n_days=n_days,
+        min_price=min_price,
+    )
+
+
+def load_price_panel(input_path, mmap: bool = True):
+    return np.load(input_path, mmap_mode="r" if mmap else None)
+
+
+def to_cents(values):
+    # float32 -> float64 au centime : retrouve les prix d'origine, les
+    # comparaisons aux seuils sont les mêmes que sur les historiques
+    return np.round(np.asarray(values, dtype=np.float64), 2)
+
+
+def price_at_day(panel, day: int):
+    """Prix de chaque jeu au jour day depuis la sortie (NaN si pas encore de relevé)."""
+    if day < 0 or day >= panel.shape[1]:
+        return np.full(panel.shape[0], np.nan)
+    return to_cents(panel[:, day])
+
+
+def min_price_over_window(
+    panel, start_day: int, end_day: int, games_per_chunk=GAMES_PER_CHUNK
+):
+    """Prix minimum de chaque jeu entre les jours start_day et end_day inclus."""
+    start_day = max(start_day, 0)
+    end_day = min(end_day, panel.shape[1] - 1)
+    result = np.full(panel.shape[0], np.nan)
+    if start_day > end_day:
+        return result
+
+    for start in range(0, panel.shape[0], games_per_chunk):
+        window = panel[start : start + games_per_chunk, start_day : end_day + 1]
+        # fmin ignore les NaN (jours sans relevé), NaN si toute la fenêtre l'est
+        result[start : start + len(window)] = np.fmin.reduce(window, axis=1)
+
+    return to_cents(result)
+
+
+def cents_threshold_to_float32(threshold_prices):
+    """
+    Seuils float64 -> plus grand prix au centime <= seuil, en float32 : comparer
+    le panel float32 à ce seuil donne le même résultat que comparer les prix
+    d'origine (float64) au seuil, sans convertir le panel.
+    """
+    thresholds = np.asarray(threshold_prices, dtype=np.float64)
+    cents = np.floor(thresholds * 100 + 0.5)
+    cents = np.where(cents / 100 <= thresholds, cents, cents - 1)
+    return (cents / 100).astype(np.float32)
+
+
+def first_day_below(panel, threshold_prices, games_per_chunk=GAMES_PER_CHUNK):
+    """
+    Premier jour depuis la sortie où le prix est <= threshold_prices, NaN si
+    jamais atteint dans le panel. threshold_prices : un seuil commun, un seuil
+    par jeu (n_jeux) ou plusieurs seuils par jeu (n_jeux x n_seuils, même forme
+    en sortie).
+    """
+    n_games, n_days = panel.shape
+    thresholds = cents_threshold_to_float32(threshold_prices)
+    single = thresholds.ndim < 2
+    thresholds = np.broadcast_to(
+        thresholds.reshape(-1, 1) if thresholds.ndim == 1 else thresholds,
+        (n_games, 1 if single else thresholds.shape[1]),
+    )
+    result = np.full(thresholds.shape, np.nan)
+
+    for start in range(0, n_games, games_per_chunk):
+        end = min(start + games_per_chunk, n_games)
+        # Minimum courant : décroissant, le premier jour sous le seuil se déduit
+        # du nombre de jours sous le seuil (un seul parcours par seuil)
+        running_min = np.array(panel[start:end])
+        running_min[np.isnan(running_min)] = np.inf
+        np.minimum.accumulate(running_min, axis=1, out=running_min)
+        for col in range(thresholds.shape[1]):
+            days_below = np.count_nonzero(
+                running_min <= thresholds[start:end, col, None], axis=1
+            )
+            result[start:end, col] = np.where(
+                days_below > 0, n_days - days_below, np.nan
+            )
+
+    return result[:, 0] if single else result
+
+
+def days_to_discount(panel, base_prices, discount_thresholds):
+    """
+    days_to_X_percent_discount pour chaque seuil (%), tableau n_jeux x n_seuils :
+    premier jour où le prix atteint base_price * (1 - X / 100).
+    """
+    base_prices = np.asarray(base_prices, dtype=np.float64)
+    threshold_prices = np.column_stack(
+        [
+            base_prices * (1 - discount_threshold / 100)
+            for discount_threshold in discount_thresholds
+        ]
+    )
+    return first_day_below(panel, threshold_prices)
+
+
+def discount_percentage_at_day(panel, base_prices, days_after_release: int):
+    """
+    Réduction maximum (%) atteinte entre la sortie et sortie + days_after_release
+    inclus, comme discount_percentage_at_days_batch. NaN si pas de prix.
+    """
+    base_prices = np.asarray(base_prices, dtype=np.float64)
+    best_prices = min_price_over_window(panel, 0, days_after_release)
+
+    result = np.full(panel.shape[0], np.nan)
+    found = np.isfinite(best_prices) & (base_prices > 0)
+    result[found] = np.round(
+        (base_prices[found] - best_prices[found]) / base_prices[found] * 100, 2
+    )
+    return result
@@ -0,0 +1,79 @@
+import json
+
+# Taille des blocs lus dans le fichier (caractères)
+READ_CHUNK_SIZE = 1 << 20
+
+_DECODER = json.JSONDecoder()
+_WHITESPACES = " \t\n\r"
+
+
+def _skip_whitespaces(buffer: str, pos: int) -> int:
+    while pos < len(buffer) and buffer[pos] in _WHITESPACES:
+        pos += 1
+    return pos
+
+
+def iter_raw_json_array(fp, chunk_size: int = READ_CHUNK_SIZE):
+    """
+    Parcourt un tableau JSON de premier niveau élément par élément.
+    Seul l'élément en cours de décodage est gardé en mémoire,
+    le pic mémoire ne dépend donc pas de la taille du fichier.
+    """
+    buffer = ""
+    pos = 0
+    eof = False
+    started = False
+    # Doublée tant qu'un même élément ne tient pas dans le tampon
+    read_size = chunk_size
+
+    while True:
+        pos = _skip_whitespaces(buffer, pos)
+
+        # Besoin de plus de données
+        if pos >= len(buffer):
+            if eof:
+                raise json.JSONDecodeError("Tableau JSON non terminé", buffer, pos)
+            buffer = fp.read(chunk_size)
+            pos = 0
+            eof = buffer == ""
+            continue
+
+        if not started:
+            if buffer[pos] != "[":
+                raise json.JSONDecodeError("Tableau JSON attendu", buffer, pos)
+            started = True
+            pos += 1
+            continue
+
+        if buffer[pos] == "]":
+            return
+
+        if buffer[pos] == ",":
+            pos += 1
+            continue
+
+        try:
+            item, end = _DECODER.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # Élément coupé en fin de bloc : on garde le reste et on relit
+            chunk = fp.read(read_size)
+            read_size *= 2
+            eof = chunk == ""
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+
+        # Un nombre ou un littéral peut être tronqué en fin de bloc
+        if end == len(buffer) and not eof and not isinstance(item, (dict, list)):
+            chunk = fp.read(read_size)
+            read_size *= 2
+            eof = chunk == ""
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+
+        pos = end
+        read_size = chunk_size
+        yield item
@@ -35,3 +35,47 @@ PRICE_SEGMENTS = [
 ]
 
 EXTRACT_DATE = datetime(2025, 11, 1, 17, 2, 28)
+
+# Seuils de réduction (%) des targets days_to_X_percent_discount
+PROMOS = [10, 25, 33, 50, 75]
+
+WAIT_DISCOUNT_SEGMENTS = [
+    {
+        "label": "0-3_mois",
+        "value_min": 0,
+        "value_max": 90,
+    },
+    {
+        "label": "3-6_mois",
+        "value_min": 91,
+        "value_max": 180,
+    },
+    {
+        "label": "6-12_mois",
+        "value_min": 181,
+        "value_max": 365,
+    },
+    {
+        "label": "1-2_ans",
+        "value_min": 366,
+        "value_max": 730,
+    },
+    {
+        "label": "jamais_ou_plus",
+        "value_min": 731,
+        "value_max": float("inf"),
+    },
+]
+
+# Observations de réduction précoce (has_Xpct_discount_at_Yd)
+DISCOUNT_HELPER = [
+    {"days_from_release": 30, "percent_discount": 5},
+    {"days_from_release": 60, "percent_discount": 10},
+]
+
+# Targets binaires has_X_percent_discount_before_Y_year
+BINARY_DISCOUNT_TARGETS = [
+    {"percent_discount": 33, "year_delay": 0.6},
+    {"percent_discount": 50, "year_delay": 1},
+    {"percent_discount": 75, "year_delay": 3},
+]
@@ -1,7 +1,22 @@
 from pathlib import Path
 import os
+import pickle
 import pandas as pd
 
+from src.games_schema import (
+    GAMES_SCHEMA_VERSION,
+    PARTITION_COLUMN,
+    apply_games_schema,
+    csv_read_dtypes,
+    games_partitioning,
+)
+from src.clean.multi_hot_store import MULTI_HOT_DIR_NAME, load_multi_hot_store
+from src.clean.price_history_store import (
+    PRICE_HISTORY_DIR_NAME,
+    load_price_history_store,
+)
+from src.clean.price_panel import PRICE_PANEL_FILE_NAME, load_price_panel
+
 # import numpy as np
 # import matplotlib.pyplot as plt
 # import seaborn as sns
@@ -9,35 +24,206 @@ import pandas as pd
 # Fichier stocké temporairement sur un de mes S3
 # url = "https://d3aok2axxchxf9.cloudfront.net/ia/games_data.csv"
 
+# DataFrame parsé de games_data.csv, relu tant que le CSV n'a pas changé
+PROCESSED_CACHE_FILE = "data/processed/games_data.cache.pkl"
+
+
+def load_processed_file(
+    file_format="csv",
+    columns=None,
+    release_years=None,
+    release_date_range=None,
+    row_filter=None,
+    use_cache=True,
+):
+    """
+    Charge le dataset nettoyé typé selon src/games_schema.py.
+    columns : colonnes à garder, release_years / release_date_range=(début, fin) :
+    filtre sur la date de sortie, row_filter : fonction df -> masque booléen.
+    CSV : le DataFrame parsé est mis en cache binaire (clé taille + mtime du CSV).
+    file_format="parquet" : lit data/processed/games_data_parquet en ne chargeant
+    que les colonnes demandées et les partitions des années release_years.
+    """
+    df = None
+    try:
+        # Colonnes à lire : projection + colonnes utiles au filtrage des lignes
+        read_columns = None
+        if columns is not None and row_filter is None:
+            read_columns = list(columns)
+            needs_date = release_years is not None or release_date_range is not None
+            if needs_date and "release_date" not in read_columns:
+                read_columns.append("release_date")
+
+        if file_format == "parquet":
+            df = load_processed_parquet(
+                columns=read_columns, release_years=release_years
+            )
+        else:
+            df = load_processed_csv(usecols=read_columns, use_cache=use_cache)
+            if df is not None and release_years is not None:
+                df = df[df["release_date"].dt.year.isin(release_years)]
+
+        if df is None:
+            return None
+
+        df = filter_processed_rows(df, release_date_range, row_filter)
+
+        if columns is not None:
+            df = df[list(columns)]
+        df = df.reset_index(drop=True)
+    except Exception as e:
+        print(f"Error when loading processed data {e}")
+
+    return df
+
+
+def filter_processed_rows(df: pd.DataFrame, release_date_range=None, row_filter=None):
+    if release_date_range is not None:
+        start, end = release_date_range
+        mask = pd.Series(True, index=df.index)
+        if start is not None:
+            mask &= df["release_date"] >= pd.Timestamp(start)
+        if end is not None:
+            mask &= df["release_date"] <= pd.Timestamp(end)
+        df = df[mask]
+
+    if row_filter is not None:
+        df = df[row_filter(df)]
+
+    return df
+
+
+def get_csv_cache_key(csv_path) -> str:
+    # Le cache est invalide dès que le CSV ou le schéma change
+    stat = os.stat(csv_path)
+    return f"{GAMES_SCHEMA_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def read_processed_csv(csv_path, usecols=None):
+    dtypes = csv_read_dtypes(usecols)
+    parse_dates = None
+    if usecols is None or "release_date" in usecols:
+        parse_dates = ["release_date"]
+
+    df = pd.read_csv(csv_path, usecols=usecols, dtype=dtypes, parse_dates=parse_dates)
+
+    return apply_games_schema(df)
+
+
+def load_processed_csv(usecols=None, use_cache=True):
+    """Sans cache, seules les colonnes usecols sont parsées."""
+    df = None
+    try:
+        csv_path = os.path.join(Path.cwd(), "data/processed/games_data.csv")
+
+        if not use_cache:
+            return read_processed_csv(csv_path, usecols=usecols)
 
-def load_processed_file():
+        cache_path = os.path.join(Path.cwd(), PROCESSED_CACHE_FILE)
+        cache_key = get_csv_cache_key(csv_path)
+
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, "rb") as fp:
+                    cached = pickle.load(fp)
+                if cached.get("key") == cache_key:
+                    return cached["df"]
+            except Exception as e:
+                print(f"Cache de chargement illisible, relecture du CSV: {e}")
+
+        df = read_processed_csv(csv_path)
+
+        # Écriture atomique : un cache interrompu n'est jamais relu
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "wb") as fp:
+            pickle.dump(
+                {"key": cache_key, "df": df}, fp, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Error when loading processed csv {e}")
+
+    return df
+
+
+def load_processed_parquet(columns=None, release_years=None):
     df = None
     try:
-        url = os.path.join(Path.cwd(), "data/processed/games_data.csv")
+        url = os.path.join(Path.cwd(), "data/processed/games_data_parquet")
 
-        # Charger les données CSV, Les colonnes Boolean sont au format Int64 (0,1,NaN)
-        df = pd.read_csv(
+        # Filtre sur la colonne de partition : seuls les dossiers utiles sont lus
+        filters = None
+        if release_years is not None:
+            filters = [(PARTITION_COLUMN, "in", [int(y) for y in release_years])]
+
+        read_columns = None
+        if columns is not None:
+            read_columns = list(columns)
+
+        df = pd.read_parquet(
             url,
-            dtype={
-                "trophies_count": "Int64",
-                "local_multiplayer_max_players": "Int64",
-                "online_multiplayer_max_players": "Int64",
-                "difficulty": "Int64",
-                "download_size_ps4": "Int64",
-                "download_size_ps5": "Int64",
-                "hours_main_story": "Int64",
-                "hours_completionist": "Int64",
-                "metacritic_critic_score": "Int64",
-                "metacritic_critic_userscore": "Int64",
-                "pegi_rating": "Int64",
-                "days_to_first_price_record": "Int64",
-                "days_to_10_percent_discount": "Int64",
-                "days_to_25_percent_discount": "Int64",
-                "days_to_50_percent_discount": "Int64",
-                "days_to_75_percent_discount": "Int64",
-            },
+            engine="pyarrow",
+            columns=read_columns,
+            filters=filters,
+            partitioning=games_partitioning(),
         )
+
+        # release_year n'existe pas dans le CSV : retirée sauf si demandée
+        if PARTITION_COLUMN in df.columns and (
+            columns is None or PARTITION_COLUMN not in columns
+        ):
+            df = df.drop(columns=[PARTITION_COLUMN])
+
+        # Le dictionnaire parquet est relu en catégories, les entiers en Int64
+        df = apply_games_schema(df)
     except Exception as e:
-        print(f"Error when loading processed data {e}")
+        print(f"Error when loading processed parquet data {e}")
 
     return df
+
+
+def load_price_history():
+    """
+    Historiques de prix colonnaires (générés par create_csv), mappés en mémoire.
+    store.get(i) / store.get_by_key(short_url_name) -> (dates en jours, prix)
+    """
+    store = None
+    try:
+        input_dir = os.path.join(Path.cwd(), "data/processed", PRICE_HISTORY_DIR_NAME)
+        store = load_price_history_store(input_dir)
+    except Exception as e:
+        print(f"Error when loading price history store {e}")
+
+    return store
+
+
+def load_daily_price_panel():
+    """
+    Panel des prix journaliers (jeux x jours depuis la sortie), généré par
+    create_csv(df, write_daily_price_panel=True), mappé en mémoire.
+    Requêtes : src/clean/price_panel.py (price_at_day, first_day_below...).
+    """
+    panel = None
+    try:
+        panel = load_price_panel(
+            os.path.join(Path.cwd(), "data/processed", PRICE_PANEL_FILE_NAME)
+        )
+    except Exception as e:
+        print(f"Error when loading price panel {e}")
+
+    return panel
+
+
+def load_multi_hot():
+    """
+    Colonnes multi-valuées en multi-hot CSR (générées par create_csv).
+    store["genres"].top_k_counts(10), .group_means(valeurs), .to_csr()
+    """
+    store = None
+    try:
+        input_dir = os.path.join(Path.cwd(), "data/processed", MULTI_HOT_DIR_NAME)
+        store = load_multi_hot_store(input_dir)
+    except Exception as e:
+        print(f"Error when loading multi-hot store {e}")
+
+    return store
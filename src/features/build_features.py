@@ -0,0 +1,334 @@
+from pathlib import Path
+import argparse
+import os
+import time
+import pandas as pd
+
+from src.constants.constants import (
+    BINARY_DISCOUNT_TARGETS,
+    DISCOUNT_HELPER,
+    EXTRACT_DATE,
+    PRICE_SEGMENTS,
+    PROMOS,
+    WAIT_DISCOUNT_SEGMENTS,
+)
+from src.data_loader import load_processed_file
+from src.features.feature_transforms import (
+    ESRB_TO_PEGI,
+    GENRE_GROUPS,
+    PUBLISHERS_BY_CATEGORY,
+    compute_content_score,
+    compute_discount_before_delay,
+    compute_discount_categories,
+    compute_discount_targets,
+    compute_download_size_features,
+    compute_exclusive_content,
+    compute_genre_groups,
+    compute_localization_features,
+    compute_log_rating_count,
+    compute_pegi_unified,
+    compute_popularity_score,
+    compute_price_category,
+    compute_publisher_features,
+    compute_release_calendar,
+    compute_release_date_features,
+    compute_visibility_score,
+)
+from src.features.stage_cache import (
+    fingerprint_columns,
+    get_stage_key,
+    load_stage_output,
+    save_stage_output,
+)
+
+# Pipeline de features du notebook 2_features_engeniering.ipynb
+# Lancer : python -m src.features.build_features
+
+FEATURES_CACHE_DIR = "data/processed/features_cache"
+FEATURED_DATASET_FILE = "data/processed/featured_games_dataset_final.csv"
+
+DAYS_TO_DISCOUNT_COLUMNS = [f"days_to_{promo}_percent_discount" for promo in PROMOS]
+
+# Étapes dans l'ordre d'exécution : "inputs" sont les colonnes lues, leur
+# empreinte (avec le code et les paramètres de l'étape) est la clé du cache
+FEATURE_STAGES = [
+    {
+        "name": "release_dates",
+        "func": compute_release_date_features,
+        "inputs": ["release_date"],
+        "params": {"today": EXTRACT_DATE},
+    },
+    {
+        "name": "discount_targets",
+        "func": compute_discount_targets,
+        "inputs": ["price_history", "base_price", "release_date"],
+        "params": {
+            "promos": PROMOS,
+            "early_discounts": DISCOUNT_HELPER,
+            "min_price": 0.1,
+        },
+    },
+    {
+        "name": "discount_categories",
+        "func": compute_discount_categories,
+        "inputs": DAYS_TO_DISCOUNT_COLUMNS + ["days_since_release"],
+        "params": {"promos": PROMOS, "segments": WAIT_DISCOUNT_SEGMENTS},
+    },
+    {
+        "name": "discount_before_delay",
+        "func": compute_discount_before_delay,
+        "inputs": DAYS_TO_DISCOUNT_COLUMNS + ["days_since_release"],
+        "params": {"targets": BINARY_DISCOUNT_TARGETS},
+    },
+    {
+        "name": "publishers",
+        "func": compute_publisher_features,
+        "inputs": ["publisher"],
+        "params": {"publishers_by_category": PUBLISHERS_BY_CATEGORY},
+    },
+    {
+        "name": "genre_groups",
+        "func": compute_genre_groups,
+        "inputs": ["genres", "genres_mask"],
+        "params": {"genre_groups": GENRE_GROUPS},
+    },
+    {
+        "name": "popularity",
+        "func": compute_popularity_score,
+        "inputs": ["days_since_release", "pssstore_stars_rating_count"],
+    },
+    {
+        "name": "localization",
+        "func": compute_localization_features,
+        "inputs": ["voice_languages_bitset", "subtitle_languages_bitset"],
+    },
+    {
+        "name": "download_size",
+        "func": compute_download_size_features,
+        "inputs": ["download_size"],
+    },
+    {
+        "name": "content_score",
+        "func": compute_content_score,
+        "inputs": [
+            "base_price",
+            "trophies_count",
+            "hours_main_story",
+            "hours_completionist",
+            "localization_category",
+            "download_size_gb",
+            "download_size_category",
+            "is_vr",
+            "has_local_multiplayer",
+            "has_online_multiplayer",
+            "dlcs_count",
+            "packs_deluxe_count",
+            "metacritic_critic_score",
+            "days_since_release",
+            "pssstore_stars_rating_count",
+        ],
+    },
+    {
+        "name": "exclusive_content",
+        "func": compute_exclusive_content,
+        "inputs": ["is_ps_exclusive", "is_opti_ps5_pro", "is_vr"],
+    },
+    {
+        "name": "visibility",
+        "func": compute_visibility_score,
+        "inputs": [
+            "base_price",
+            "trophies_count",
+            "pssstore_stars_rating_count",
+            "metacritic_critic_score",
+            "publisher_category",
+            "publisher_game_count",
+            "popularity_score",
+            "dlcs_count",
+            "packs_deluxe_count",
+            "hours_main_story",
+            "hours_completionist",
+            "difficulty",
+            "voice_languages_count",
+            "sub_languages_count",
+            "is_vr",
+            "is_opti_ps5_pro",
+            "is_ps_exclusive",
+            "has_online_multiplayer",
+            "has_local_multiplayer",
+        ],
+    },
+    {
+        "name": "pegi",
+        "func": compute_pegi_unified,
+        "inputs": ["pegi_rating", "esrb_rating"],
+        "params": {"esrb_to_pegi": ESRB_TO_PEGI},
+    },
+    {
+        "name": "price_category",
+        "func": compute_price_category,
+        "inputs": ["base_price"],
+        "params": {"segments": PRICE_SEGMENTS},
+    },
+    {
+        "name": "release_calendar",
+        "func": compute_release_calendar,
+        "inputs": ["release_year", "release_month"],
+        "params": {"current_year": EXTRACT_DATE.year},
+    },
+    {
+        "name": "log_rating_count",
+        "func": compute_log_rating_count,
+        "inputs": ["pssstore_stars_rating_count"],
+    },
+]
+
+# Colonnes du dataset nettoyé inutiles pour les modèles
+COLUMNS_TO_DELETE = [
+    "short_url_name",
+    "game_name",
+    "publisher",
+    "developer",
+    "release_date",
+    "metacritic_critic_userscore",
+    "genres",
+    "genres_mask",
+    "download_size",
+    "pegi_rating",
+    "esrb_rating",
+    "rating_descriptions",
+    "voice_languages",
+    "subtitle_languages",
+    "voice_languages_bitset",
+    "subtitle_languages_bitset",
+    "lowest_price",
+    "price_history",
+]
+
+# Features exportées, dans l'ordre du fichier du notebook
+FEATURE_COLUMNS = (
+    ["release_year", "release_month"]
+    + [
+        col
+        for promo in PROMOS
+        for col in [
+            f"days_to_{promo}_percent_discount",
+            f"days_to_{promo}_percent_discount_category",
+        ]
+    ]
+    + [
+        f"has_{discount['percent_discount']}pct_discount_at_{discount['days_from_release']}d"
+        for discount in DISCOUNT_HELPER
+    ]
+    + [
+        f"has_{target['percent_discount']}_percent_discount_before_{target['year_delay']}_year"
+        for target in BINARY_DISCOUNT_TARGETS
+    ]
+    + ["publisher_category", "publisher_game_count_cat", "publisher_game_count"]
+    + [f"genre_{group_name}" for group_name in GENRE_GROUPS]
+    + [
+        "popularity_score",
+        "popularity_category",
+        "download_size_gb",
+        "download_size_category",
+        "voice_languages_count",
+        "localization_category",
+        "sub_languages_count",
+        "content_score",
+        "content_category",
+        "exclusif_playstation_content",
+        "visibility_score",
+        "visibility_category",
+        "pegi_unified",
+        "price_category",
+        "game_age_years",
+        "release_season",
+        "log_pssstore_stars_rating_count",
+    ]
+)
+
+
+def run_feature_pipeline(
+    df: pd.DataFrame, cache_dir=None, stages=FEATURE_STAGES
+) -> pd.DataFrame:
+    """
+    Applique les étapes dans l'ordre, chaque étape voit les colonnes des précédentes.
+    Avec cache_dir, la sortie d'une étape est relue tant que ses entrées
+    n'ont pas changé : seules les étapes en aval d'une modification sont recalculées.
+    """
+    df_featured = df.copy()
+
+    for stage in stages:
+        start = time.perf_counter()
+        stage_name = stage["name"]
+        output = None
+        stage_key = None
+
+        if cache_dir is not None:
+            input_fingerprint = fingerprint_columns(df_featured, stage["inputs"])
+            stage_key = get_stage_key(stage, input_fingerprint)
+            output = load_stage_output(cache_dir, stage_name, stage_key)
+
+        status = "cache"
+        if output is None:
+            status = "calculé"
+            output = stage["func"](df_featured, **stage.get("params", {}))
+            if cache_dir is not None:
+                save_stage_output(cache_dir, stage_name, stage_key, output)
+
+        for col in output.columns:
+            df_featured[col] = output[col]
+
+        print(f"{stage_name:22s} {status:8s} {time.perf_counter() - start:7.3f}s")
+
+    return df_featured
+
+
+def build_featured_dataset(df: pd.DataFrame, cache_dir=None) -> pd.DataFrame:
+    """Dataset d'entrainement : colonnes utiles du dataset nettoyé + features."""
+    df_featured = run_feature_pipeline(df, cache_dir=cache_dir)
+
+    col_to_delete = [col for col in COLUMNS_TO_DELETE if col in df.columns]
+    # Si uniquement ps5 supprimer is_ps5
+    if "is_ps5" in df.columns and int((df["is_ps5"] == 0).sum()) == 0:
+        col_to_delete.append("is_ps5")
+
+    base_columns = [col for col in df.columns if col not in col_to_delete]
+    base_columns = [col for col in base_columns if col not in FEATURE_COLUMNS]
+    return df_featured[base_columns + FEATURE_COLUMNS]
+
+
+def build_features(file_format="csv", output_path=None, use_cache=True):
+    df_to_export = None
+    try:
+        df = load_processed_file(file_format=file_format)
+        if df is None:
+            print("Erreur lors du chargement du dataset nettoyé.")
+            return None
+
+        cache_dir = None
+        if use_cache:
+            cache_dir = os.path.join(Path.cwd(), FEATURES_CACHE_DIR)
+
+        df_to_export = build_featured_dataset(df, cache_dir=cache_dir)
+
+        if output_path is None:
+            output_path = os.path.join(Path.cwd(), FEATURED_DATASET_FILE)
+        df_to_export.to_csv(output_path, index=False, encoding="utf-8")
+        print(
+            f"Features exportées dans {output_path}: "
+            f"{len(df_to_export)} lignes, {len(df_to_export.columns)} colonnes"
+        )
+    except Exception as e:
+        print(f"Error when building features {e}")
+
+    return df_to_export
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+    build_features(args.format, args.output, use_cache=not args.no_cache)
@@ -0,0 +1,694 @@
+import numpy as np
+import pandas as pd
+
+from src.clean.clean_raw_data_helper import (
+    days_until_first_discount_batch,
+    release_dates_to_day_numbers,
+)
+from src.clean.genre_bitmask import genre_names_to_mask
+from src.clean.languages import languages_count
+from src.clean.multi_hot_store import split_labels
+from src.clean.price_history_store import encode_price_histories
+from src.clean.price_panel import days_to_discount, discount_percentage_at_day
+
+# Transformations du notebook 2_features_engeniering.ipynb, en version vectorisée.
+# Chaque fonction reçoit le DataFrame et retourne uniquement les colonnes créées
+# (même index), voir src/features/build_features.py pour l'enchaînement.
+
+# Classement basé sur profil éditeur, volume de sorties multi-plateformes,
+# présence sur consoles, spécialisation grands publics ou indépendant,
+# et réputation dans divers catalogues digitaux.
+PUBLISHERS_BY_CATEGORY = {
+    "aaa": [
+        "sony interactive entertainment",
+        "electronic arts",
+        "ubisoft",
+        "activision",
+        "take-two interactive",
+        "bethesda",
+        "sega",
+        "square enix",
+        "bandai namco entertainment",
+        "capcom",
+        "konami",
+        "koei tecmo",
+        "warner bros",
+        "disney interactive",
+        "microsoft",
+        "epic games",
+        "rockstar games",
+        "blizzard entertainment",
+        "thq nordic",
+        "amazon games",
+    ],
+    "aa": [
+        "polyphony digital",
+        "cd projekt",
+        "crytek",
+        "505 games",
+        "focus entertainment",
+        "deep silver",
+        "devolver digital",
+        "annapurna interactive",
+        "team 17 digital",
+        "team17",
+        "tinybuild",
+        "humble games",
+        "nacon",
+        "microids",
+        "nis",
+        "pqube",
+        "xseed games",
+        "aksys games",
+        "frontier developments",
+        "paradox interactive",
+        "rebellion",
+        "gameloft se",
+        "lego system",
+        "3d realms entertainment",
+        "quantic dream",
+        "eidos interactive",
+    ],
+    "indie_quality": [
+        "auto slavic",
+        "disco elysium uk ltd t/a za/um",
+        "super powerup games",
+        "top hat studios",
+        "feardemic",
+        "dolores entertainment",
+        "silesia games",
+        "happy player",
+        "webnetic",
+        "raw fury",
+        "akupara games",
+        "thunderful publishing",
+        "playism",
+        "daedalic entertainment",
+        "dear villagers",
+        "wales interactive",
+        "untold tales",
+        "headup games",
+        "handy games",
+        "cgi lab",
+        "joindots",
+        "y-zo studio",
+        "aerosoft",
+        "jandusoft",
+        "afil games",
+        "penguin pop games",
+        "markt+technik verlag",
+        "armin unold",
+        "zakym",
+        "volkov konstantin sergeevich",
+        "ggmuks",
+        "nostra games",
+        "gametry",
+        "thigames",
+        "smobile",
+        "ocean media",
+        "playstige interactive information and trade limited liability company",
+        "oddworld inhabitants.",
+    ],
+    "specialized": [
+        "kemco",
+        "atari",
+        "hamster",
+        "wayforward technologies",
+        "arc system works",
+        "milestone",
+        "soedesco publishing",
+        "benoit varasse trading as pix arts",
+        "ratalaika games",
+        "eastasiasoft",
+        "qubyte interactive",
+        "pix arts",
+        "red art games",
+    ],
+}
+
+# Regroupement en genres principaux :
+# https://cnlj.bnf.fr/sites/default/files/cnlj-genres-jeux-video.pdf
+GENRE_GROUPS = {
+    "action_aventure": ["Action", "FPS", "TPS", "Platformer", "Adventure", "Horror"],
+    "roles": ["MMO", "RPG"],
+    "sports": ["Sports", "Racing", "Fighting"],
+    "reflexion": ["Puzzle", "Simulation", "Strategy"],
+    "rapide": ["Music", "Casual", "Arcade"],
+}
+
+# Mapping ESRB -> PEGI
+ESRB_TO_PEGI = {
+    "Everyone": 3,
+    "Everyone 10+": 7,
+    "Teen": 12,
+    "Mature 17+": 16,
+    "Adults Only 18+": 18,
+}
+
+
+def numeric_column(df: pd.DataFrame, col: str) -> pd.Series:
+    # Entiers nullable / objets -> float64 (NaN), pour les calculs numpy
+    return pd.to_numeric(df[col], errors="coerce").astype("float64")
+
+
+def compute_release_date_features(df: pd.DataFrame, today) -> pd.DataFrame:
+    release_dt = pd.to_datetime(df["release_date"], errors="coerce")
+    result = pd.DataFrame(index=df.index)
+    result["release_year"] = release_dt.dt.year
+    result["release_month"] = release_dt.dt.month
+    result["days_since_release"] = (today - release_dt).dt.days
+    return result
+
+
+def discount_percentage_at_days_batch(
+    offsets,
+    dates,
+    prices,
+    base_prices,
+    release_days,
+    days_after_release,
+    min_price=0.1,
+):
+    """
+    Version vectorisée de discount_percentage_at_days (notebook 2) : réduction
+    maximum (%) atteinte entre la sortie et sortie + days_after_release inclus.
+    Mêmes tableaux plats que days_until_first_discount_batch, NaN si pas de prix.
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    prices = np.asarray(prices, dtype=np.float64)
+    base_prices = np.asarray(base_prices, dtype=np.float64)
+    release_days = np.asarray(release_days, dtype=np.float64)
+
+    n_games = len(offsets) - 1
+    result = np.full(n_games, np.nan)
+    if n_games == 0 or len(dates) == 0:
+        return result
+
+    lengths = np.diff(offsets)
+    game_ids = np.repeat(np.arange(n_games), lengths)
+    non_empty = lengths > 0
+
+    # Prix valides dans la fenêtre [sortie, sortie + X jours]
+    entry_release_days = release_days[game_ids]
+    eligible = (
+        (prices >= min_price)
+        & (dates >= entry_release_days)
+        & (dates <= entry_release_days + days_after_release)
+    )
+    best_prices = np.full(n_games, np.inf)
+    best_prices[non_empty] = np.minimum.reduceat(
+        np.where(eligible, prices, np.inf), offsets[:-1][non_empty]
+    )
+
+    found = np.isfinite(best_prices) & (base_prices > 0)
+    result[found] = np.round(
+        (base_prices[found] - best_prices[found]) / base_prices[found] * 100, 2
+    )
+    return result
+
+
+def compute_discount_targets(
+    df: pd.DataFrame, promos, early_discounts, min_price=0.1
+) -> pd.DataFrame:
+    """
+    days_to_X_percent_discount pour chaque seuil et has_Xpct_discount_at_Yd,
+    depuis un seul encodage à plat des historiques de prix.
+    """
+    offsets, dates, prices = encode_price_histories(
+        df["price_history"], price_dtype=np.float64
+    )
+    base_prices = numeric_column(df, "base_price").to_numpy()
+    release_days = release_dates_to_day_numbers(df["release_date"])
+
+    days = days_until_first_discount_batch(
+        offsets,
+        dates,
+        prices,
+        base_prices,
+        release_days,
+        promos,
+        min_price=min_price,
+    )
+
+    result = pd.DataFrame(index=df.index)
+    for col, promo in enumerate(promos):
+        result[f"days_to_{promo}_percent_discount"] = days[:, col]
+
+    for discount in early_discounts:
+        days_from_release = discount["days_from_release"]
+        percent_discount = discount["percent_discount"]
+        percentages = discount_percentage_at_days_batch(
+            offsets,
+            dates,
+            prices,
+            base_prices,
+            release_days,
+            days_from_release,
+            min_price=min_price,
+        )
+        result[f"has_{percent_discount}pct_discount_at_{days_from_release}d"] = (
+            np.nan_to_num(percentages, nan=0) >= percent_discount
+        ).astype(int)
+
+    return result
+
+
+def compute_discount_targets_from_panel(
+    df: pd.DataFrame, panel, promos, early_discounts
+) -> pd.DataFrame:
+    """
+    Mêmes colonnes que compute_discount_targets, lues dans le panel de prix
+    journaliers (src/clean/price_panel.py, lignes dans l'ordre de df).
+    """
+    base_prices = numeric_column(df, "base_price").to_numpy()
+
+    result = pd.DataFrame(index=df.index)
+    days = days_to_discount(panel, base_prices, promos)
+    for col, promo in enumerate(promos):
+        result[f"days_to_{promo}_percent_discount"] = days[:, col]
+
+    for discount in early_discounts:
+        days_from_release = discount["days_from_release"]
+        percent_discount = discount["percent_discount"]
+        percentages = discount_percentage_at_day(panel, base_prices, days_from_release)
+        result[f"has_{percent_discount}pct_discount_at_{days_from_release}d"] = (
+            np.nan_to_num(percentages, nan=0) >= percent_discount
+        ).astype(int)
+
+    return result
+
+
+def compute_discount_categories(
+    df: pd.DataFrame, promos, segments, never_delay=730
+) -> pd.DataFrame:
+    bins = [segment["value_min"] for segment in segments] + [float("inf")]
+    labels = [segment["label"] for segment in segments]
+    days_since_release = numeric_column(df, "days_since_release")
+
+    result = pd.DataFrame(index=df.index)
+    for promo in promos:
+        days = numeric_column(df, f"days_to_{promo}_percent_discount")
+        category = pd.cut(
+            days, bins=bins, labels=labels, include_lowest=True, right=True
+        ).astype(str)
+
+        # Jamais atteint : jeu récent (ou date inconnue) vs jeu de plus de 2 ans
+        no_discount = days.isna()
+        not_yet = no_discount & ~(days_since_release >= never_delay)
+        never = no_discount & (days_since_release >= never_delay)
+        result[f"days_to_{promo}_percent_discount_category"] = np.select(
+            [not_yet, never],
+            ["moins_de_2_ans_sans_baisse", "jamais_ou_plus"],
+            default=category,
+        )
+
+    return result
+
+
+def compute_discount_before_delay(df: pd.DataFrame, targets) -> pd.DataFrame:
+    """
+    has_X_percent_discount_before_Y_year :
+    1 réduction avant Y ans, 0 jamais ou après Y ans (jeu assez ancien), NA sinon.
+    """
+    days_since_release = numeric_column(df, "days_since_release")
+
+    result = pd.DataFrame(index=df.index)
+    for target in targets:
+        promo = target["percent_discount"]
+        year_delay = target["year_delay"]
+        delay_days = year_delay * 365
+        days = numeric_column(df, f"days_to_{promo}_percent_discount")
+
+        discount_before = days < delay_days
+        no_discount = (days_since_release >= delay_days) & ~discount_before
+        values = np.select([discount_before, no_discount], [1.0, 0.0], default=np.nan)
+        result[f"has_{promo}_percent_discount_before_{year_delay}_year"] = pd.Series(
+            values, index=df.index
+        ).astype("Int64")
+
+    return result
+
+
+def get_publisher_importance_category(
+    publisher, publishers_by_category=PUBLISHERS_BY_CATEGORY
+) -> str:
+    if pd.isna(publisher):
+        return "unknown"
+
+    pub_lower = str(publisher).lower()
+    for category, publishers in publishers_by_category.items():
+        if any(major in pub_lower for major in publishers):
+            return category
+
+    return "other"
+
+
+def compute_publisher_features(
+    df: pd.DataFrame, publishers_by_category=PUBLISHERS_BY_CATEGORY
+) -> pd.DataFrame:
+    publishers = df["publisher"].astype(object)
+
+    # Catégorie calculée une seule fois par publisher distinct
+    categories = {
+        publisher: get_publisher_importance_category(publisher, publishers_by_category)
+        for publisher in publishers.dropna().unique()
+    }
+    publisher_counts = publishers.value_counts()
+
+    result = pd.DataFrame(index=df.index)
+    result["publisher_category"] = publishers.map(categories).fillna("unknown")
+    result["publisher_game_count"] = (
+        publishers.map(publisher_counts).fillna(0).astype(int)
+    )
+    result["publisher_game_count_cat"] = pd.cut(
+        result["publisher_game_count"],
+        bins=[0, 1, 5, 20, 50, float("inf")],
+        labels=["unique", "small", "medium", "large", "major"],
+    )
+    return result
+
+
+def get_genres_masks(df: pd.DataFrame) -> np.ndarray:
+    # genres_mask du dataset si présente, sinon depuis la colonne genres
+    if "genres_mask" in df.columns:
+        return df["genres_mask"].fillna(0).to_numpy(dtype=np.int64)
+
+    genres = df["genres"]
+    masks = {
+        value: genre_names_to_mask(split_labels(value))
+        for value in genres.dropna().unique()
+    }
+    return genres.map(masks).fillna(0).to_numpy(dtype=np.int64)
+
+
+def compute_genre_groups(df: pd.DataFrame, genre_groups=GENRE_GROUPS) -> pd.DataFrame:
+    """Un jeu peut appartenir à plusieurs groupes : un test de bits par groupe."""
+    masks = get_genres_masks(df)
+
+    result = pd.DataFrame(index=df.index)
+    for group_name, group_genres in genre_groups.items():
+        group_mask = genre_names_to_mask(group_genres)
+        result[f"genre_{group_name}"] = ((masks & group_mask) != 0).astype(int)
+    return result
+
+
+def get_reviews_per_day(df: pd.DataFrame):
+    days = numeric_column(df, "days_since_release").fillna(1).clip(lower=1)
+    reviews = numeric_column(df, "pssstore_stars_rating_count").fillna(0)
+    return reviews, reviews / days
+
+
+def compute_popularity_score(df: pd.DataFrame) -> pd.DataFrame:
+    reviews, reviews_per_day = get_reviews_per_day(df)
+
+    # Rang percentile (0-100) : 60% volume + 40% momentum
+    reviews_rank = reviews.rank(pct=True) * 100
+    rpd_rank = reviews_per_day.rank(pct=True) * 100
+
+    result = pd.DataFrame(index=df.index)
+    result["popularity_score"] = (reviews_rank * 0.6 + rpd_rank * 0.4).round(1)
+    result["popularity_category"] = pd.cut(
+        result["popularity_score"],
+        bins=[0, 20, 40, 60, 80, 100],
+        labels=["very_low", "low", "medium", "high", "very_high"],
+        include_lowest=True,
+    )
+    return result
+
+
+def count_languages(bitsets: pd.Series) -> pd.Series:
+    # Popcount des bitsets, NaN sans langue (comme la chaîne vide relue du CSV).
+    # Le bit LANGUAGE_OTHER_ID compte pour une langue : il peut regrouper
+    # plusieurs langues hors table, leur nombre exact n'est pas connu
+    counts = languages_count(bitsets.to_numpy()).astype("float64")
+    counts[counts == 0] = np.nan
+    return pd.Series(counts, index=bitsets.index)
+
+
+def compute_localization_features(df: pd.DataFrame) -> pd.DataFrame:
+    result = pd.DataFrame(index=df.index)
+    result["voice_languages_count"] = count_languages(df["voice_languages_bitset"])
+    result["sub_languages_count"] = count_languages(df["subtitle_languages_bitset"])
+
+    raw_score = result["voice_languages_count"].fillna(0) * 3 + result[
+        "sub_languages_count"
+    ].fillna(0)
+    result["localization_category"] = np.select(
+        [
+            raw_score == 0,
+            raw_score <= 5,
+            raw_score <= 15,
+            raw_score <= 30,
+            raw_score <= 50,
+        ],
+        ["none", "minimal", "basic", "standard", "good"],
+        default="excellent",
+    )
+    return result
+
+
+def compute_download_size_features(df: pd.DataFrame) -> pd.DataFrame:
+    result = pd.DataFrame(index=df.index)
+    result["download_size_gb"] = (
+        numeric_column(df, "download_size") / (1024**3)
+    ).round(2)
+    result["download_size_category"] = pd.cut(
+        result["download_size_gb"],
+        bins=[0, 1, 5, 20, 50, float("inf")],
+        labels=["tiny", "small", "medium", "large", "huge"],
+    )
+    return result
+
+
+def points(values, thresholds) -> np.ndarray:
+    """
+    Points par palier : thresholds = [(seuil, points), ...] par seuil décroissant,
+    le premier seuil atteint donne ses points (0 si aucun).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    return np.select(
+        [values >= threshold for threshold, _ in thresholds],
+        [score for _, score in thresholds],
+        default=0,
+    )
+
+
+def flag(values) -> np.ndarray:
+    return np.asarray(values, dtype=bool).astype(int)
+
+
+def binary_column(df: pd.DataFrame, col: str) -> np.ndarray:
+    # Colonne 0/1 (NaN -> 0) en tableau d'entiers
+    return numeric_column(df, col).fillna(0).to_numpy().astype(int)
+
+
+def compute_content_score(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Score composite de contenu/richesse du jeu (0-100)
+    Score élevé = jeu avec beaucoup de fonctionnalités et contenus
+    """
+    base_price = numeric_column(df, "base_price")
+    trophies = numeric_column(df, "trophies_count")
+    main_story = numeric_column(df, "hours_main_story")
+    completionist = numeric_column(df, "hours_completionist")
+    localization = df["localization_category"]
+    size_category = df["download_size_category"].astype(object)
+    reviews, reviews_per_day = get_reviews_per_day(df)
+
+    # Pénalités : jeu très simple ou peu documenté
+    score = -flag(base_price < 4.9) * 3.0
+    score -= flag(trophies.isna()) * 2
+    score -= flag(localization == "none") * 3
+    score -= flag(main_story.isna() & completionist.isna()) * 2
+    score -= flag(df["download_size_gb"].isna()) * 1
+
+    score += points(main_story.fillna(0), [(20, 5), (10, 3), (5, 1)])
+    score += points(completionist.fillna(0), [(50, 5), (20, 3), (10, 2)])
+
+    score += flag(size_category == "huge") * 5
+    score += flag(size_category == "large") * 4
+    score += flag(size_category == "medium") * 2
+    score += flag(size_category == "small") * 1
+
+    score += flag(localization == "excellent") * 5
+    score += flag(localization == "good") * 4
+    score += flag(localization == "standard") * 3
+    score += flag(localization == "basic") * 1
+
+    trophy_count = trophies.fillna(0)
+    score += points(trophy_count, [(50, 3), (20, 2)])
+    score += flag((trophy_count > 0) & (trophy_count < 20)) * 1
+
+    score += binary_column(df, "is_vr") * 3
+    score += binary_column(df, "has_local_multiplayer") * 2
+    score += binary_column(df, "has_online_multiplayer") * 3
+
+    score += points(
+        numeric_column(df, "dlcs_count").fillna(0), [(10, 4), (5, 3), (1, 1)]
+    )
+    deluxe_count = numeric_column(df, "packs_deluxe_count").fillna(0)
+    score += points(deluxe_count, [(3, 3)])
+    score += flag((deluxe_count > 0) & (deluxe_count < 3)) * 1
+
+    score += flag(df["metacritic_critic_score"].notna()) * 3
+
+    # Popularité ajustée à l'âge du jeu, seuils par percentiles (outliers)
+    quantiles = reviews_per_day.quantile([0.90, 0.75, 0.50, 0.25]).tolist()
+    score += points(reviews_per_day, list(zip(quantiles, [6, 4, 2, 1])))
+
+    # Volume absolu d'avis (même pour vieux jeux), pénalité sans avis
+    score += points(reviews, [(1000, 3), (100, 2), (10, 1)])
+    score -= flag(reviews < 10) * 2
+
+    score = pd.Series(score, index=df.index, dtype=float)
+
+    # Normalisation 0-100 sur les percentiles 5 / 95
+    p_min = score.quantile(0.05)
+    p_max = score.quantile(0.95)
+
+    result = pd.DataFrame(index=df.index)
+    result["content_score"] = (
+        ((score - p_min) / (p_max - p_min) * 100).clip(0, 100).round(0)
+    )
+    result["content_category"] = pd.cut(
+        result["content_score"],
+        bins=[0, 20, 40, 60, 80, 100],
+        labels=["minimal", "light", "standard", "rich", "extensive"],
+        include_lowest=True,
+    )
+    return result
+
+
+def compute_exclusive_content(df: pd.DataFrame) -> pd.DataFrame:
+    # Contenu exclusif playstation : exclusivité, optimisé PS5 Pro ou VR
+    result = pd.DataFrame(index=df.index)
+    result["exclusif_playstation_content"] = flag(
+        (numeric_column(df, "is_ps_exclusive") == 1)
+        | (numeric_column(df, "is_opti_ps5_pro") == 1)
+        | (numeric_column(df, "is_vr") == 1)
+    )
+    return result
+
+
+def compute_visibility_score(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Score de visibilité/médiatisation du jeu (0-100)
+    Score élevé = jeu très connu, médiatisé, visible
+    """
+    publisher_category = df["publisher_category"]
+    reviews = numeric_column(df, "pssstore_stars_rating_count").fillna(0)
+    metacritic_known = df["metacritic_critic_score"].notna()
+    voice_count = numeric_column(df, "voice_languages_count").fillna(0)
+    sub_count = numeric_column(df, "sub_languages_count").fillna(0)
+
+    # Indicateurs négatifs : jeu inconnu / peu médiatisé
+    score = -flag(numeric_column(df, "base_price") < 4.9) * 3.0
+    score -= flag(df["trophies_count"].isna()) * 2
+    score -= flag(reviews < 10) * 3
+    score -= flag(~metacritic_known) * 2
+    score -= flag(publisher_category == "other") * 2
+
+    # Éditeurs majeurs = grande visibilité
+    score += flag(publisher_category == "aaa") * 10
+    score += flag(publisher_category == "aa") * 6
+    score += flag(publisher_category == "indie_quality") * 4
+    score += flag(publisher_category == "specialized") * 3
+
+    publisher_count = numeric_column(df, "publisher_game_count").fillna(0)
+    score += points(publisher_count, [(50, 4), (20, 3), (10, 2), (5, 1)])
+
+    score += numeric_column(df, "popularity_score").fillna(0).to_numpy() / 100 * 12
+
+    score += flag(metacritic_known) * 4
+    metacritic = numeric_column(df, "metacritic_critic_score").fillna(0)
+    score += points(metacritic, [(80, 4), (70, 2)])
+
+    score += points(reviews, [(1000, 5), (500, 4), (100, 3), (50, 2), (10, 1)])
+
+    # DLCs et éditions deluxe (jeu supporté, marketing)
+    score += points(
+        numeric_column(df, "dlcs_count").fillna(0), [(10, 4), (5, 3), (1, 2)]
+    )
+    deluxe_count = numeric_column(df, "packs_deluxe_count").fillna(0)
+    score += points(deluxe_count, [(2, 3)])
+    score += flag(deluxe_count == 1) * 1
+
+    # Informations de durée, difficulté et localisation
+    score += flag(df["hours_main_story"].notna()) * 2
+    score += flag(df["hours_completionist"].notna()) * 1
+    score += flag(df["difficulty"].notna()) * 1
+    score += flag(voice_count > 0) * 2
+    score += flag(sub_count >= 5) * 2
+    score += flag(voice_count >= 3) * 2
+
+    # VR, PS5 Pro, exclusivité et multijoueur
+    score += binary_column(df, "is_vr") * 3
+    score += binary_column(df, "is_opti_ps5_pro") * 2
+    score += binary_column(df, "is_ps_exclusive") * 4
+    score += binary_column(df, "has_online_multiplayer") * 3
+    score += binary_column(df, "has_local_multiplayer") * 2
+
+    score = pd.Series(score, index=df.index, dtype=float)
+
+    result = pd.DataFrame(index=df.index)
+    result["visibility_score"] = (score.rank(pct=True) * 100).round(0)
+    result["visibility_category"] = pd.cut(
+        result["visibility_score"],
+        bins=[0, 20, 40, 60, 80, 100],
+        labels=["obscure", "low", "moderate", "high", "very_high"],
+        include_lowest=True,
+    )
+    return result
+
+
+def compute_pegi_unified(df: pd.DataFrame, esrb_to_pegi=ESRB_TO_PEGI) -> pd.DataFrame:
+    # PEGI, complété par l'ESRB converti en PEGI
+    esrb_as_pegi = df["esrb_rating"].astype(object).map(esrb_to_pegi)
+    result = pd.DataFrame(index=df.index)
+    result["pegi_unified"] = (
+        numeric_column(df, "pegi_rating").fillna(esrb_as_pegi).astype("Int64")
+    )
+    return result
+
+
+def compute_price_category(df: pd.DataFrame, segments) -> pd.DataFrame:
+    base_price = numeric_column(df, "base_price")
+
+    # Premier segment contenant le prix, "40+" au-delà du dernier segment
+    conditions = [
+        (base_price >= segment["value_min"]) & (base_price <= segment["value_max"])
+        for segment in segments
+    ]
+    conditions.append(base_price > segments[-1]["value_max"])
+    labels = [segment["label"] for segment in segments] + [segments[-1]["label"]]
+
+    result = pd.DataFrame(index=df.index)
+    result["price_category"] = pd.Series(
+        np.select(conditions, labels, default=""), index=df.index
+    ).replace("", None)
+    return result
+
+
+def compute_release_calendar(df: pd.DataFrame, current_year: int) -> pd.DataFrame:
+    release_month = df["release_month"]
+    result = pd.DataFrame(index=df.index)
+    result["game_age_years"] = current_year - df["release_year"]
+    # Mois absent -> "fall", comme la fonction get_season du notebook
+    result["release_season"] = np.select(
+        [
+            release_month.isin([12, 1, 2]),
+            release_month.isin([3, 4, 5]),
+            release_month.isin([6, 7, 8]),
+        ],
+        ["winter", "spring", "summer"],
+        default="fall",
+    )
+    return result
+
+
+def compute_log_rating_count(df: pd.DataFrame) -> pd.DataFrame:
+    result = pd.DataFrame(index=df.index)
+    result["log_pssstore_stars_rating_count"] = np.log1p(
+        numeric_column(df, "pssstore_stars_rating_count")
+    )
+    return result
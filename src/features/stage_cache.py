@@ -0,0 +1,106 @@
+from functools import lru_cache
+from pathlib import Path
+import ast
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import pandas as pd
+
+# Cache des étapes du pipeline de features : une entrée par étape,
+# {"key": empreinte des entrées + code de l'étape, "df": colonnes produites}.
+# Une étape n'est recalculée que si ses colonnes d'entrée ou son code changent
+# (module de l'étape et modules src.* dont il dépend, helpers compris).
+
+# A incrémenter si le format des sorties change sans modifier le code des étapes
+FEATURES_CACHE_VERSION = 1
+
+
+def fingerprint_columns(df: pd.DataFrame, columns) -> str:
+    """Empreinte des colonnes (noms, types, valeurs et index) lues par une étape."""
+    digest = hashlib.blake2b(digest_size=16)
+    columns = [col for col in columns if col in df.columns]
+    digest.update(repr([(col, str(df[col].dtype)) for col in columns]).encode("utf-8"))
+    digest.update(str(len(df)).encode("utf-8"))
+    if columns:
+        row_hashes = pd.util.hash_pandas_object(df[columns], index=True)
+    else:
+        row_hashes = pd.util.hash_pandas_object(df.index)
+    digest.update(row_hashes.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_imported_modules(module_name: str) -> tuple:
+    """Modules src.* importés par module_name (analyse du source, une fois par run)."""
+    module = importlib.import_module(module_name)
+    tree = ast.parse(Path(inspect.getfile(module)).read_bytes())
+    imported = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.level == 0:
+            imported.append(node.module)
+        elif isinstance(node, ast.Import):
+            imported.extend(alias.name for alias in node.names)
+    return tuple(name for name in imported if name and name.startswith("src."))
+
+
+def get_source_modules(func) -> list:
+    """
+    Module de func et modules src.* qu'il importe, récursivement
+    (feature_transforms, puis clean_raw_data_helper, constants...).
+    """
+    names = set()
+    pending = [inspect.getmodule(func).__name__]
+    while pending:
+        name = pending.pop()
+        if name not in names:
+            names.add(name)
+            pending.extend(get_imported_modules(name))
+
+    return [importlib.import_module(name) for name in sorted(names)]
+
+
+def get_stage_key(stage: dict, input_fingerprint: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(FEATURES_CACHE_VERSION).encode("utf-8"))
+    digest.update(stage["name"].encode("utf-8"))
+    # Code source des modules : un helper modifié invalide aussi l'étape
+    for module in get_source_modules(stage["func"]):
+        digest.update(module.__name__.encode("utf-8"))
+        digest.update(Path(inspect.getfile(module)).read_bytes())
+    digest.update(repr(sorted(stage.get("params", {}).items())).encode("utf-8"))
+    digest.update(input_fingerprint.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_stage_cache_path(cache_dir, stage_name: str):
+    return os.path.join(cache_dir, f"{stage_name}.pkl")
+
+
+def load_stage_output(cache_dir, stage_name: str, stage_key: str):
+    cache_path = get_stage_cache_path(cache_dir, stage_name)
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        with open(cache_path, "rb") as fp:
+            cached = pickle.load(fp)
+    except Exception as e:
+        print(f"Cache de l'étape {stage_name} illisible, recalcul: {e}")
+        return None
+
+    if cached.get("key") != stage_key:
+        return None
+    return cached["df"]
+
+
+def save_stage_output(cache_dir, stage_name: str, stage_key: str, df: pd.DataFrame):
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_path = get_stage_cache_path(cache_dir, stage_name)
+
+    # Écriture atomique : un cache interrompu n'est jamais relu
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, "wb") as fp:
+        pickle.dump({"key": stage_key, "df": df}, fp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
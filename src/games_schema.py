@@ -0,0 +1,164 @@
+import pandas as pd
+
+# Schéma canonique du dataset nettoyé data/processed/games_data.*
+
+# Entiers et booléens (0/1) : Int64 nullable, pandas passerait en float avec des NaN
+INT_COLUMNS = [
+    "pssstore_stars_rating_count",
+    "metacritic_critic_score",
+    "metacritic_critic_userscore",
+    "is_ps4",
+    "is_ps5",
+    "is_indie",
+    "is_dlc",
+    "is_vr",
+    "is_opti_ps5_pro",
+    "is_remaster",
+    "is_ps_exclusive",
+    "series_count",
+    "packs_deluxe_count",
+    "has_microtransactions",
+    "dlcs_count",
+    "trophies_count",
+    "has_local_multiplayer",
+    "local_multiplayer_max_players",
+    "has_online_multiplayer",
+    "online_multiplayer_max_players",
+    "is_online_only",
+    "difficulty",
+    "download_size",
+    "hours_main_story",
+    "hours_completionist",
+    "pegi_rating",
+    "genres_mask",
+]
+
+# Bitsets de langues (src/clean/languages.py), toujours renseignés
+UINT64_COLUMNS = [
+    "voice_languages_bitset",
+    "subtitle_languages_bitset",
+]
+
+FLOAT_COLUMNS = [
+    "pssstore_stars_rating",
+    "base_price",
+    "lowest_price",
+]
+
+# Peu de valeurs distinctes : stockées en catégories
+CATEGORY_COLUMNS = [
+    "publisher",
+    "esrb_rating",
+]
+
+DATE_COLUMNS = [
+    "release_date",
+]
+
+STRING_COLUMNS = [
+    "short_url_name",
+    "id_store",
+    "game_name",
+    "developer",
+    "genres",
+    "rating_descriptions",
+    "voice_languages",
+    "subtitle_languages",
+    "price_history",
+]
+
+# Colonne de partitionnement du format parquet (dérivée de release_date)
+PARTITION_COLUMN = "release_year"
+
+# A incrémenter quand le schéma change : invalide les caches de chargement
+GAMES_SCHEMA_VERSION = 3
+
+
+def csv_read_dtypes(columns=None) -> dict:
+    """Types à passer à pd.read_csv (les dates passent par parse_dates)."""
+    dtypes = {}
+    for col in INT_COLUMNS:
+        dtypes[col] = "Int64"
+    for col in UINT64_COLUMNS:
+        dtypes[col] = "uint64"
+    for col in FLOAT_COLUMNS:
+        dtypes[col] = "float64"
+    for col in CATEGORY_COLUMNS:
+        dtypes[col] = "category"
+    for col in STRING_COLUMNS:
+        dtypes[col] = "object"
+
+    if columns is not None:
+        dtypes = {col: dtype for col, dtype in dtypes.items() if col in columns}
+
+    return dtypes
+
+
+def apply_games_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Applique les types du schéma aux colonnes présentes dans df."""
+    df_result = df.copy()
+
+    for col in INT_COLUMNS:
+        if col in df_result.columns:
+            df_result[col] = pd.to_numeric(df_result[col]).astype("Int64")
+
+    for col in UINT64_COLUMNS:
+        if col in df_result.columns:
+            df_result[col] = df_result[col].astype("uint64")
+
+    for col in FLOAT_COLUMNS:
+        if col in df_result.columns:
+            df_result[col] = pd.to_numeric(df_result[col]).astype("float64")
+
+    for col in CATEGORY_COLUMNS:
+        if col in df_result.columns:
+            df_result[col] = df_result[col].astype("category")
+
+    for col in DATE_COLUMNS:
+        if col in df_result.columns:
+            df_result[col] = pd.to_datetime(df_result[col], errors="coerce").astype(
+                "datetime64[ns]"
+            )
+
+    # Chaînes vides -> manquantes : le CSV les relit en NaN, le parquet les
+    # garderait telles quelles (ex. jeux sans genre)
+    for col in STRING_COLUMNS:
+        if col in df_result.columns:
+            values = df_result[col]
+            df_result[col] = values.mask(values == "", None)
+
+    return df_result
+
+
+def games_arrow_schema(df: pd.DataFrame):
+    """Schéma pyarrow explicite des colonnes de df (après apply_games_schema)."""
+    import pyarrow as pa
+
+    fields = []
+    for col in df.columns:
+        if col in INT_COLUMNS or col == PARTITION_COLUMN:
+            fields.append(pa.field(col, pa.int64()))
+        elif col in UINT64_COLUMNS:
+            fields.append(pa.field(col, pa.uint64()))
+        elif col in FLOAT_COLUMNS:
+            fields.append(pa.field(col, pa.float64()))
+        elif col in CATEGORY_COLUMNS:
+            fields.append(pa.field(col, pa.dictionary(pa.int32(), pa.string())))
+        elif col in DATE_COLUMNS:
+            fields.append(pa.field(col, pa.timestamp("ms")))
+        elif col in STRING_COLUMNS:
+            fields.append(pa.field(col, pa.string()))
+        else:
+            # Colonne hors schéma : type déduit par pyarrow
+            inferred = pa.Schema.from_pandas(df[[col]], preserve_index=False)
+            fields.append(inferred.field(col))
+
+    return pa.schema(fields)
+
+
+def games_partitioning():
+    """Partitionnement hive release_year=AAAA, relu en int64 (et non en dictionnaire)."""
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.int64())]), flavor="hive")
@@ -8,6 +8,7 @@ import seaborn as sns
 from matplotlib.axes import Axes
 import numpy as np
 
+from src.clean.multi_hot_store import MultiHotColumn, encode_multi_hot
 from src.constants.constants import COLOR_A, COLOR_B, COLOR_C, PRICE_SEGMENTS
 
 OUTPUT_EXPLO_PLOTS_PATH = os.path.join(Path.cwd(), "outputs/plots/exploration")
@@ -32,14 +33,22 @@ def generate_platform_proportion_data(df: pd.DataFrame):
     return result
 
 
+def get_multi_hot_column(df: pd.DataFrame, col_name: str, multi_hot=None):
+    # Colonne multi-hot fournie (store de create_csv, mêmes lignes que df)
+    # ou encodée une fois depuis les chaînes "a,b,c"
+    if multi_hot is not None:
+        return multi_hot
+    indptr, indices, vocabulary = encode_multi_hot(df[col_name])
+    return MultiHotColumn(indptr, indices, vocabulary)
+
+
 def generate_multi_str_col_top_proportion_data(
-    df: pd.DataFrame, col_name: str, top_count: int
+    df: pd.DataFrame, col_name: str, top_count: int, multi_hot=None
 ):
 
-    # Séparer les genres et exploser
-    genres_exploded = df[col_name].str.split(",").explode()
-    genres_exploded = genres_exploded.str.strip()
-    genre_counts = genres_exploded.value_counts()
+    # Nombre de jeux par label, sans exploser les chaînes
+    column = get_multi_hot_column(df, col_name, multi_hot)
+    genre_counts = column.top_k_counts(len(column.vocabulary))
 
     # Garder le top 6 et regrouper le reste dans "Autres"
     top_val = genre_counts.head(top_count)
@@ -281,16 +290,11 @@ def prices_distribution(df: pd.DataFrame, save_file=False):
 # Distribution des genres de jeux
 
 
-def histogram_genres_count(df: pd.DataFrame, axe: plt.Axes):
-
-    # Séparer les genres et exploser
-    genres_exploded = df["genres"].str.split(",").explode()
-
-    # Nettoyer les espaces éventuels
-    genres_exploded = genres_exploded.str.strip()
+def histogram_genres_count(df: pd.DataFrame, axe: plt.Axes, multi_hot=None):
 
     # Compter les occurrences
-    genre_counts = genres_exploded.value_counts()
+    column = get_multi_hot_column(df, "genres", multi_hot)
+    genre_counts = column.top_k_counts(len(column.vocabulary))
 
     axe.bar(
         range(len(genre_counts)),
@@ -308,21 +312,24 @@ def histogram_genres_count(df: pd.DataFrame, axe: plt.Axes):
     # axe.set_title("Distribution des genres de jeux")
 
 
-def genres_distribution(df: pd.DataFrame, save_file=False):
+def genres_distribution(df: pd.DataFrame, save_file=False, multi_hot=None):
 
     # Créer la figure
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 7))
     ax1: plt.Axes
     ax2: plt.Axes
 
-    data = generate_multi_str_col_top_proportion_data(df, "genres", top_count=11)
+    column = get_multi_hot_column(df, "genres", multi_hot)
+    data = generate_multi_str_col_top_proportion_data(
+        df, "genres", top_count=11, multi_hot=column
+    )
     draw_binary_circular_plots(
         data,
         "",
         ax1,
     )
 
-    histogram_genres_count(df, ax2)
+    histogram_genres_count(df, ax2, multi_hot=column)
 
     fig.suptitle(
         "Analyse des genres (un jeu peut avoir plusieurs genres)",
@@ -340,19 +347,19 @@ def genres_distribution(df: pd.DataFrame, save_file=False):
 # Relation baisse de prix la plus rapide
 
 
-def bar_chart_genres_discount_speed(df: pd.DataFrame, axe: plt.Axes):
+def bar_chart_genres_discount_speed(df: pd.DataFrame, axe: plt.Axes, multi_hot=None):
     # Filtrer les jeux qui ont eu une baisse
-    df_with_discount = df[df["days_to_25_percent_discount"].notna()].copy()
-
-    # Exploser les genres
-    df_with_discount["genres_list"] = df_with_discount["genres"].str.split(",")
-    df_exploded = df_with_discount.explode("genres_list")
-    df_exploded["genres_list"] = df_exploded["genres_list"].str.strip()
+    has_discount = df["days_to_25_percent_discount"].notna().to_numpy()
+    df_with_discount = df[has_discount]
 
     # Calculer le nombre moyen de jours par genre
-    avg_days_by_genre = df_exploded.groupby("genres_list")[
-        "days_to_25_percent_discount"
-    ].mean()
+    if multi_hot is not None:
+        column = multi_hot.take(has_discount)
+    else:
+        column = get_multi_hot_column(df_with_discount, "genres")
+    avg_days_by_genre = column.group_means(
+        df_with_discount["days_to_25_percent_discount"].astype("float64")
+    )
 
     # Top 10 des plus rapides
     fastest_10 = avg_days_by_genre.sort_values().head(10)
@@ -0,0 +1,272 @@
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import (
+    MinMaxScaler,
+    OneHotEncoder,
+    OrdinalEncoder,
+    StandardScaler,
+)
+
+# Preprocessing et jeux de features du notebook 3_models_training.ipynb
+
+# Phase 1 : informations disponibles à J0 (sortie du jeu)
+PHASE_1_FEATURES = {
+    "numeric_continuous": [
+        "base_price",
+        "download_size_gb",
+        "hours_main_story",
+    ],
+    "numeric_discrete_zero": [
+        "voice_languages_count",
+        "dlcs_count",
+        "trophies_count",
+        "series_count",
+        "packs_deluxe_count",
+    ],
+    "boolean_cols": [
+        "has_local_multiplayer",
+        "has_online_multiplayer",
+        "has_microtransactions",
+        "is_indie",
+        "is_vr",
+        "is_ps_exclusive",
+        "is_online_only",
+        "is_remaster",
+        "is_opti_ps5_pro",
+        "is_ps4",
+        "genre_action_aventure",
+        "genre_roles",
+        "genre_sports",
+        "genre_reflexion",
+        "genre_rapide",
+    ],
+    "categorical_cols": [
+        "release_season",
+        "publisher_category",
+        "content_category",
+    ],
+    "ordinal_cols": [
+        "pegi_unified",
+        "difficulty",
+    ],
+}
+
+# Phase 2 : prédiction à J+60 (avec observations précoces)
+PHASE_2_J60_FEATURES = {
+    **PHASE_1_FEATURES,
+    "numeric_discrete_median": [],
+    "numeric_continuous": PHASE_1_FEATURES["numeric_continuous"]
+    + [
+        "pssstore_stars_rating",
+        "metacritic_critic_score",
+    ],
+    "boolean_cols": PHASE_1_FEATURES["boolean_cols"]
+    + [
+        "has_5pct_discount_at_30d",
+        "has_10pct_discount_at_60d",
+    ],
+    "categorical_cols": PHASE_1_FEATURES["categorical_cols"]
+    + [
+        "popularity_category",
+    ],
+}
+
+# Phase 2.1 : ajout des features avancées, meilleur jeu pour random forest
+PHASE_2_1_J60_PLUS_FEATURES = {
+    **PHASE_2_J60_FEATURES,
+    "numeric_discrete_median": PHASE_2_J60_FEATURES["numeric_discrete_median"]
+    + [
+        "sub_languages_count",
+        "publisher_game_count",
+    ],
+    "boolean_cols": PHASE_2_J60_FEATURES["boolean_cols"]
+    + [
+        "exclusif_playstation_content",
+    ],
+    "categorical_cols": PHASE_2_J60_FEATURES["categorical_cols"]
+    + [
+        "price_category",
+        "visibility_category",
+        "localization_category",
+        "release_month",
+    ],
+}
+
+FEATURE_SETS = {
+    "phase_1": PHASE_1_FEATURES,
+    "phase_2_j60": PHASE_2_J60_FEATURES,
+    "phase_2_1_j60_plus": PHASE_2_1_J60_PLUS_FEATURES,
+}
+
+
+class ZeroImputer(BaseEstimator, TransformerMixin):
+    """Impute les valeurs manquantes par 0"""
+
+    def fit(self, X, y=None):
+        # Sans attribut appris, sklearn considère le transformer non entrainé
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def transform(self, X):
+        if isinstance(X, pd.DataFrame):
+            return X.fillna(0)
+        X_copy = np.array(X, dtype=float)
+        X_copy[np.isnan(X_copy)] = 0
+        return X_copy
+
+    def get_feature_names_out(self, input_features=None):
+        return input_features
+
+
+class OutlierClipper(BaseEstimator, TransformerMixin):
+    """Clip les outliers avec la méthode IQR (bornes apprises au fit)"""
+
+    def fit(self, X, y=None):
+        X_values = X.values if isinstance(X, pd.DataFrame) else X
+
+        q1 = np.percentile(X_values, 25, axis=0)
+        q3 = np.percentile(X_values, 75, axis=0)
+        iqr = q3 - q1
+
+        self.lower_bounds_ = q1 - 1.5 * iqr
+        self.upper_bounds_ = q3 + 1.5 * iqr
+        return self
+
+    def transform(self, X):
+        if isinstance(X, pd.DataFrame):
+            X_clipped = np.clip(X.values, self.lower_bounds_, self.upper_bounds_)
+            return pd.DataFrame(X_clipped, columns=X.columns, index=X.index)
+        return np.clip(X, self.lower_bounds_, self.upper_bounds_)
+
+    def get_feature_names_out(self, input_features=None):
+        return input_features
+
+
+def get_all_features_columns(features_dict: dict) -> list:
+    all_columns = []
+    for feature_list in features_dict.values():
+        all_columns.extend(feature_list)
+    return all_columns
+
+
+def select_available_features(features_dict: dict, columns) -> dict:
+    """Garde uniquement les features présentes dans le dataset."""
+    columns = set(columns)
+    return {
+        group: [col for col in feature_list if col in columns]
+        for group, feature_list in features_dict.items()
+    }
+
+
+def get_scaler(scaler_type: str):
+    if scaler_type == "standard":
+        return StandardScaler()
+    if scaler_type == "minmax":
+        return MinMaxScaler()
+    if scaler_type == "none":
+        return None
+    raise ValueError(
+        f"scaler_type doit être 'standard', 'minmax' ou 'none', reçu: {scaler_type}"
+    )
+
+
+def get_categorical_encoder(categorical_type: str):
+    if categorical_type == "onehot":
+        return OneHotEncoder(sparse_output=False, handle_unknown="ignore")
+    if categorical_type == "onehot_drop_first":
+        return OneHotEncoder(drop="first", sparse_output=False, handle_unknown="ignore")
+    return OrdinalEncoder(
+        handle_unknown="use_encoded_value",
+        unknown_value=-1,
+        encoded_missing_value=-1,
+    )
+
+
+def create_preprocessor(
+    available_columns: dict,
+    scaler_type="none",
+    outlier_numeric_continuous=False,
+    categorical_type="ordinal",
+) -> ColumnTransformer:
+    """
+    ColumnTransformer du notebook (create_pipeline_test_transforms).
+    Avec les valeurs par défaut : preprocessing random forest de la phase 1
+    (create_pipeline_random_forest).
+    """
+
+    def with_scaler(steps):
+        scaler = get_scaler(scaler_type)
+        if scaler is not None:
+            steps.append(("scaler", scaler))
+        return steps
+
+    transformers = []
+
+    # NUMÉRIQUES CONTINUES
+    numeric_continuous = available_columns.get("numeric_continuous", [])
+    steps = with_scaler([("imputer", SimpleImputer(strategy="median"))])
+    if outlier_numeric_continuous:
+        steps.append(("outlier_clipper", OutlierClipper()))
+    if numeric_continuous:
+        transformers.append(
+            ("num_continuous", Pipeline(steps=steps), numeric_continuous)
+        )
+
+    # NUMERIQUES DISCRETES zéro
+    numeric_discrete_zero = available_columns.get("numeric_discrete_zero", [])
+    steps = with_scaler([("zero_imputer", ZeroImputer())])
+    if numeric_discrete_zero:
+        transformers.append(
+            ("num_discrete_zero", Pipeline(steps=steps), numeric_discrete_zero)
+        )
+
+    # NUMERIQUES DISCRETES imputation médiane
+    numeric_discrete_median = available_columns.get("numeric_discrete_median", [])
+    steps = with_scaler([("imputer", SimpleImputer(strategy="median"))])
+    if numeric_discrete_median:
+        transformers.append(
+            ("num_discrete_median", Pipeline(steps=steps), numeric_discrete_median)
+        )
+
+    # BOOLÉENNES : NA -> 0
+    boolean_cols = available_columns.get("boolean_cols", [])
+    if boolean_cols:
+        transformers.append(
+            (
+                "boolean",
+                Pipeline(steps=[("zero_imputer", ZeroImputer())]),
+                boolean_cols,
+            )
+        )
+
+    # CATÉGORIELLES
+    categorical_cols = available_columns.get("categorical_cols", [])
+    if categorical_cols:
+        categorical_transformer = Pipeline(
+            steps=[
+                ("imputer", SimpleImputer(strategy="constant", fill_value="unknown")),
+                ("encoder", get_categorical_encoder(categorical_type)),
+            ]
+        )
+        transformers.append(("categorical", categorical_transformer, categorical_cols))
+
+    # ORDINALES
+    ordinal_cols = available_columns.get("ordinal_cols", [])
+    if ordinal_cols:
+        transformers.append(
+            (
+                "ordinal",
+                Pipeline(steps=[("imputer", SimpleImputer(strategy="median"))]),
+                ordinal_cols,
+            )
+        )
+
+    return ColumnTransformer(
+        transformers=transformers,
+        remainder="drop",
+        verbose_feature_names_out=False,
+    )
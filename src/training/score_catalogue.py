@@ -0,0 +1,145 @@
+from datetime import datetime
+from pathlib import Path
+import argparse
+import contextlib
+import io
+import os
+import time
+import numpy as np
+import pandas as pd
+
+from src.clean.clean_raw_data import (
+    build_games_dataframe,
+    iter_extracted_rows,
+    remove_duplicates_keep_min_nan,
+)
+from src.clean.column_builder import GameColumnBuilder
+from src.clean.raw_json_reader import iter_raw_json_array
+from src.features.build_features import run_feature_pipeline
+from src.training.train_models import load_model
+
+# Scoring du catalogue brut avec un modèle sauvegardé par train_models
+# Lancer : python -m src.training.score_catalogue --model models/rf_phase_2_1_j60_plus.joblib
+
+RAW_CATALOGUE_FILE = "data/raw/psstore_all_games.json"
+PREDICTIONS_FILE = "data/processed/discount_predictions.csv"
+
+# Mêmes filtres que clean_and_convert : le modèle est appliqué aux jeux
+# qu'il aurait pu voir à l'entrainement
+SCORING_EXTRACT_PARAMS = {
+    "released_date_filter": datetime(2020, 10, 10),
+    "min_price_ps5": 4.9,
+    "min_price_ps4": 18.9,
+    "min_price_dlc": 14.9,
+}
+
+KEY_COLUMNS = ["short_url_name", "id_store", "game_name"]
+
+
+def extract_catalogue(file_path, batch_size=1024, workers=1) -> pd.DataFrame:
+    """
+    Lecture incrémentale du JSON brut, extraction par lots de batch_size jeux
+    (répartis sur workers processus), puis dédoublonnage comme au nettoyage.
+    """
+    with open(file_path, "r", encoding="utf-8") as fp:
+        rows = GameColumnBuilder().extend(
+            iter_extracted_rows(
+                iter_raw_json_array(fp),
+                workers=workers,
+                games_per_chunk=batch_size,
+                **SCORING_EXTRACT_PARAMS,
+            )
+        )
+
+    # Les statistiques du nettoyage des publishers ne servent pas ici
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = build_games_dataframe(rows)
+    df, _ = remove_duplicates_keep_min_nan(df, ["id_store", "game_name"])
+    return df
+
+
+def predict_proba_batches(model, X: pd.DataFrame, batch_size=1024) -> np.ndarray:
+    """predict_proba par blocs de batch_size lignes (mémoire bornée)."""
+    probas = np.empty((len(X), len(model.classes_)), dtype=np.float64)
+    for start in range(0, len(X), batch_size):
+        stop = start + batch_size
+        probas[start:stop] = model.predict_proba(X.iloc[start:stop])
+    return probas
+
+
+def score_games(df_featured: pd.DataFrame, artifact: dict, batch_size=1024):
+    model = artifact["model"]
+    X = df_featured.reindex(columns=artifact["features"])
+    probas = predict_proba_batches(model, X, batch_size=batch_size)
+
+    key_columns = [col for col in KEY_COLUMNS if col in df_featured.columns]
+    predictions = df_featured[key_columns].reset_index(drop=True)
+    for i, label in enumerate(model.classes_):
+        predictions[f"proba_{label:g}"] = probas[:, i]
+    predictions["prediction"] = model.classes_[probas.argmax(axis=1)]
+    return predictions
+
+
+def score_catalogue(
+    model_path, raw_path=None, output_path=None, batch_size=1024, workers=1
+):
+    """
+    JSON brut -> extraction -> features -> predict_proba -> CSV.
+    Les features relatives au catalogue (rangs de popularité, nombre de jeux
+    par publisher, quantiles) sont calculées sur tout le catalogue extrait,
+    comme pour le dataset d'entrainement.
+    """
+    predictions = None
+    try:
+        if raw_path is None:
+            raw_path = os.path.join(Path.cwd(), RAW_CATALOGUE_FILE)
+        if output_path is None:
+            output_path = os.path.join(Path.cwd(), PREDICTIONS_FILE)
+
+        artifact = load_model(model_path)
+        print(f"Modèle {artifact['name']} ({artifact['target']})")
+
+        start = time.perf_counter()
+        df = extract_catalogue(raw_path, batch_size=batch_size, workers=workers)
+        extract_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            df_featured = run_feature_pipeline(df)
+        features_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        predictions = score_games(df_featured, artifact, batch_size=batch_size)
+        predict_time = time.perf_counter() - start
+
+        predictions.to_csv(output_path, index=False, encoding="utf-8")
+
+        total_time = extract_time + features_time + predict_time
+        print(f"extraction {extract_time:8.2f}s")
+        print(f"features   {features_time:8.2f}s")
+        print(f"prédiction {predict_time:8.2f}s")
+        print(
+            f"{len(predictions)} jeux scorés en {total_time:.2f}s "
+            f"({len(predictions) / max(total_time, 1e-9):.0f} jeux/s): {output_path}"
+        )
+    except Exception as e:
+        print(f"Error when scoring catalogue {e}")
+
+    return predictions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", required=True)
+    parser.add_argument("--raw", default=None)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    score_catalogue(
+        args.model,
+        raw_path=args.raw,
+        output_path=args.output,
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
@@ -0,0 +1,539 @@
+from pathlib import Path
+import argparse
+import os
+import time
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Memory
+from sklearn.ensemble import (
+    GradientBoostingClassifier,
+    RandomForestClassifier,
+    RandomForestRegressor,
+)
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import (
+    accuracy_score,
+    classification_report,
+    confusion_matrix,
+    f1_score,
+    mean_absolute_error,
+    r2_score,
+    root_mean_squared_error,
+)
+from sklearn.model_selection import (
+    GridSearchCV,
+    HalvingGridSearchCV,
+    HalvingRandomSearchCV,
+    RandomizedSearchCV,
+    StratifiedKFold,
+    train_test_split,
+)
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder
+from sklearn.svm import SVC
+
+from src.features.build_features import FEATURED_DATASET_FILE
+from src.training.preprocessing import (
+    FEATURE_SETS,
+    create_preprocessor,
+    get_all_features_columns,
+    select_available_features,
+)
+
+# Expériences du notebook 3_models_training.ipynb
+# Lancer : python -m src.training.train_models --phases 1 2 2.1
+#
+# Le preprocessing est dans le Pipeline du modèle : il est ré-appris sur chaque
+# fold de la validation croisée, et le cache joblib (memory du Pipeline) le
+# réutilise pour tous les candidats qui partagent ce fold.
+# Folds et candidats sont répartis sur les coeurs (n_jobs).
+
+TRAINING_CACHE_DIR = "data/processed/training_cache"
+# Modèles entrainés (Pipeline preprocessing + modèle), relus par score_catalogue
+MODELS_DIR = "models"
+
+TARGET_PROMO_BINARY_COL = "has_50_percent_discount_before_1_year"
+RECENT_GAMES_NO_DISCOUNT_CAT = "moins_de_2_ans_sans_baisse"
+
+RANDOM_STATE = 42
+CV_SPLITS = 5
+TEST_SIZE = 0.2
+
+RANDOM_FOREST_PARAMS = {"random_state": RANDOM_STATE, "class_weight": "balanced"}
+
+# Grille de la phase 1
+RANDOM_FOREST_PHASE_1_GRID = {
+    "n_estimators": [200, 300],
+    "max_depth": [8, 10, 12],
+    "min_samples_split": [10, 20],
+    "min_samples_leaf": [5, 10],
+}
+
+# Grille anti-overfitting (complete_random_forest_train)
+RANDOM_FOREST_GRID = {
+    "n_estimators": [100, 150, 200],
+    "max_depth": [6, 8, 10],
+    "min_samples_split": [20, 30, 40],
+    "min_samples_leaf": [10, 15, 20],
+    "max_features": ["sqrt", "log2", 0.6],
+    "max_samples": [0.7, 0.8, 0.9],
+}
+
+GRADIENT_BOOSTING_PARAMS = {
+    "random_state": RANDOM_STATE,
+    "n_iter_no_change": 10,
+    "validation_fraction": 0.1,
+    "tol": 0.0001,
+}
+
+GRADIENT_BOOSTING_DISTRIBUTIONS = {
+    "n_estimators": [50, 100, 150, 200],
+    "learning_rate": [0.01, 0.05, 0.1],
+    "max_depth": [2, 3, 4, 5],
+    "subsample": [0.6, 0.7, 0.8],
+    "min_samples_split": [20, 30, 40, 50],
+    "min_samples_leaf": [10, 15, 20],
+    "max_features": ["sqrt", "log2", 0.7, 0.8],
+}
+
+SVC_PARAMS = {
+    "kernel": "rbf",
+    "class_weight": "balanced",
+    "random_state": RANDOM_STATE,
+    "probability": True,
+}
+
+SVC_DISTRIBUTIONS = {
+    "C": [0.1, 1.0, 10.0, 100.0],
+    "gamma": ["scale", "auto", 0.001, 0.01, 0.1],
+}
+
+# Meilleur preprocessing random forest trouvé en phase 3
+BEST_RANDOM_FOREST_PREPROCESS = {
+    "scaler_type": "none",
+    "outlier_numeric_continuous": True,
+    "categorical_type": "ordinal",
+}
+
+
+def random_forest_experiment(name, features, preprocess=None, **kwargs) -> dict:
+    experiment = {
+        "name": name,
+        "features": features,
+        "target": TARGET_PROMO_BINARY_COL,
+        "task": "classification",
+        "preprocess": preprocess or {},
+        "model": RandomForestClassifier,
+        "model_params": RANDOM_FOREST_PARAMS,
+        "search": "grid",
+        "param_grid": RANDOM_FOREST_GRID,
+        "scoring": "accuracy",
+    }
+    experiment.update(kwargs)
+    return experiment
+
+
+# Une phase = liste d'expériences indépendantes (features, preprocessing,
+# modèle, recherche d'hyper-paramètres, target)
+TRAINING_PHASES = {
+    "1": [
+        random_forest_experiment(
+            "rf_phase_1", "phase_1", param_grid=RANDOM_FOREST_PHASE_1_GRID
+        ),
+    ],
+    "2": [
+        random_forest_experiment("rf_phase_2_j60", "phase_2_j60"),
+    ],
+    "2.1": [
+        random_forest_experiment("rf_phase_2_1_j60_plus", "phase_2_1_j60_plus"),
+    ],
+    "3": [
+        random_forest_experiment(
+            f"rf_{name}",
+            "phase_2_1_j60_plus",
+            preprocess=preprocess,
+        )
+        for name, preprocess in [
+            ("no_scaler", {"scaler_type": "none"}),
+            ("standard_scaler", {"scaler_type": "standard"}),
+            ("min_max_scaler", {"scaler_type": "minmax"}),
+            ("outlier_ordinal", BEST_RANDOM_FOREST_PREPROCESS),
+            (
+                "outlier_one_hot",
+                {**BEST_RANDOM_FOREST_PREPROCESS, "categorical_type": "onehot"},
+            ),
+            (
+                "outlier_one_hot_drop_first",
+                {
+                    **BEST_RANDOM_FOREST_PREPROCESS,
+                    "categorical_type": "onehot_drop_first",
+                },
+            ),
+        ]
+    ],
+    "4": [
+        random_forest_experiment(
+            "gradient_boosting",
+            "phase_2_1_j60_plus",
+            preprocess=BEST_RANDOM_FOREST_PREPROCESS,
+            model=GradientBoostingClassifier,
+            model_params=GRADIENT_BOOSTING_PARAMS,
+            search="random",
+            param_grid=GRADIENT_BOOSTING_DISTRIBUTIONS,
+            n_iter=50,
+        ),
+        random_forest_experiment(
+            "svc",
+            "phase_2_1_j60_plus",
+            preprocess={
+                "scaler_type": "minmax",
+                "outlier_numeric_continuous": True,
+                "categorical_type": "onehot_drop_first",
+            },
+            model=SVC,
+            model_params=SVC_PARAMS,
+            search="random",
+            param_grid=SVC_DISTRIBUTIONS,
+            n_iter=20,
+        ),
+    ],
+    "5": [
+        random_forest_experiment(
+            "rf_75_percent_before_3_year",
+            "phase_2_1_j60_plus",
+            preprocess=BEST_RANDOM_FOREST_PREPROCESS,
+            target="has_75_percent_discount_before_3_year",
+        ),
+        random_forest_experiment(
+            "rf_33_percent_before_0.6_year",
+            "phase_2_1_j60_plus",
+            preprocess=BEST_RANDOM_FOREST_PREPROCESS,
+            target="has_33_percent_discount_before_0.6_year",
+        ),
+        random_forest_experiment(
+            "rf_days_to_33_category",
+            "phase_2_1_j60_plus",
+            preprocess=BEST_RANDOM_FOREST_PREPROCESS,
+            target="days_to_33_percent_discount_category",
+            exclude_target_values=[RECENT_GAMES_NO_DISCOUNT_CAT],
+            scoring="f1_weighted",
+        ),
+        random_forest_experiment(
+            "rf_days_to_50_category",
+            "phase_2_1_j60_plus",
+            preprocess=BEST_RANDOM_FOREST_PREPROCESS,
+            target="days_to_50_percent_discount_category",
+            exclude_target_values=[RECENT_GAMES_NO_DISCOUNT_CAT],
+            scoring="f1_weighted",
+        ),
+        {
+            "name": "linear_regression_days_to_50",
+            "features": "phase_2_1_j60_plus",
+            "target": "days_to_50_percent_discount",
+            "task": "regression",
+            "preprocess": {
+                "scaler_type": "standard",
+                "outlier_numeric_continuous": True,
+                "categorical_type": "onehot_drop_first",
+            },
+            "model": LinearRegression,
+            "model_params": {},
+        },
+        {
+            "name": "rf_regressor_days_to_50",
+            "features": "phase_2_1_j60_plus",
+            "target": "days_to_50_percent_discount",
+            "task": "regression",
+            "preprocess": BEST_RANDOM_FOREST_PREPROCESS,
+            "model": RandomForestRegressor,
+            "model_params": {
+                "n_estimators": 100,
+                "max_depth": 10,
+                "random_state": RANDOM_STATE,
+            },
+        },
+    ],
+}
+
+
+def get_experiment_data(df: pd.DataFrame, experiment: dict):
+    """X, y et split train/test de l'expérience (mêmes règles que le notebook)."""
+    features = select_available_features(
+        FEATURE_SETS[experiment["features"]], df.columns
+    )
+    target = experiment["target"]
+
+    df_target = df[df[target].notna()]
+    exclude_values = experiment.get("exclude_target_values")
+    if exclude_values:
+        df_target = df_target[~df_target[target].isin(exclude_values)]
+
+    X = df_target[get_all_features_columns(features)]
+    y = df_target[target]
+
+    if experiment["task"] == "regression":
+        stratify = None
+    else:
+        # Catégories texte -> entiers (LabelEncoder du notebook)
+        if y.dtype == object:
+            y = pd.Series(LabelEncoder().fit_transform(y), index=y.index)
+        stratify = y
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=TEST_SIZE, random_state=RANDOM_STATE, stratify=stratify
+    )
+    return features, X_train, X_test, y_train, y_test
+
+
+def create_search(experiment: dict, pipeline: Pipeline, search_type: str, n_jobs):
+    param_grid = {
+        f"model__{param}": values for param, values in experiment["param_grid"].items()
+    }
+    cv_strategy = StratifiedKFold(
+        n_splits=CV_SPLITS, shuffle=True, random_state=RANDOM_STATE
+    )
+    common_params = {
+        "scoring": experiment["scoring"],
+        "cv": cv_strategy,
+        "n_jobs": n_jobs,
+        "verbose": 0,
+    }
+
+    # Successive halving : tous les candidats sur peu de lignes, seuls les
+    # meilleurs (1 / factor) passent au tour suivant avec plus de lignes
+    if search_type == "halving":
+        if experiment["search"] == "random":
+            return HalvingRandomSearchCV(
+                pipeline,
+                param_grid,
+                factor=3,
+                random_state=RANDOM_STATE,
+                **common_params,
+            )
+        return HalvingGridSearchCV(
+            pipeline, param_grid, factor=3, random_state=RANDOM_STATE, **common_params
+        )
+
+    if experiment["search"] == "random":
+        return RandomizedSearchCV(
+            pipeline,
+            param_grid,
+            n_iter=experiment["n_iter"],
+            random_state=RANDOM_STATE,
+            **common_params,
+        )
+    return GridSearchCV(pipeline, param_grid, **common_params)
+
+
+def evaluate_classifier(model, X_train, X_test, y_train, y_test) -> dict:
+    y_pred_train = model.predict(X_train)
+    y_pred_test = model.predict(X_test)
+
+    print("\nRapport de classification (Test):")
+    print(classification_report(y_test, y_pred_test, zero_division=0))
+    print("Matrice de confusion:")
+    print(confusion_matrix(y_test, y_pred_test))
+
+    return {
+        "train_accuracy": accuracy_score(y_train, y_pred_train),
+        "test_accuracy": accuracy_score(y_test, y_pred_test),
+        "test_f1_weighted": f1_score(
+            y_test, y_pred_test, average="weighted", zero_division=0
+        ),
+        "report": classification_report(
+            y_test, y_pred_test, output_dict=True, zero_division=0
+        ),
+    }
+
+
+def evaluate_regressor(model, X_test, y_test) -> dict:
+    predictions = model.predict(X_test)
+    return {
+        "mae": mean_absolute_error(y_test, predictions),
+        "r2": r2_score(y_test, predictions),
+        "rmse": root_mean_squared_error(y_test, predictions),
+    }
+
+
+def run_experiment(
+    df: pd.DataFrame, experiment: dict, search_type="grid", n_jobs=-1, memory=None
+) -> dict:
+    start = time.perf_counter()
+    features, X_train, X_test, y_train, y_test = get_experiment_data(df, experiment)
+
+    print(f"\n--- {experiment['name']} ({experiment['target']}) ---")
+    print(f"Train: {len(X_train)} | Test: {len(X_test)}")
+
+    pipeline = Pipeline(
+        steps=[
+            ("preprocessor", create_preprocessor(features, **experiment["preprocess"])),
+            ("model", experiment["model"](**experiment["model_params"])),
+        ],
+        memory=memory,
+    )
+
+    result = {
+        "name": experiment["name"],
+        "target": experiment["target"],
+        "features": get_all_features_columns(features),
+    }
+
+    if experiment["task"] == "regression":
+        # Pas de recherche d'hyper-paramètres : un seul fit
+        pipeline.fit(X_train, y_train)
+        result["model"] = pipeline
+        result.update(evaluate_regressor(pipeline, X_test, y_test))
+        print(
+            f"MAE : {result['mae']:.2f} jours | R2 : {result['r2']:.4f} | "
+            f"RMSE : {result['rmse']:.2f} jours"
+        )
+    else:
+        search = create_search(experiment, pipeline, search_type, n_jobs)
+        search.fit(X_train, y_train)
+
+        best_params = {
+            param.removeprefix("model__"): value
+            for param, value in search.best_params_.items()
+        }
+        print(f"Candidats testés: {len(search.cv_results_['params'])}")
+        print(f"Meilleurs hyperparamètres: {best_params}")
+        print(f"Meilleur score CV ({experiment['scoring']}): {search.best_score_:.4f}")
+
+        result["model"] = search.best_estimator_
+        result["best_params"] = best_params
+        result["cv_score"] = search.best_score_
+        result.update(
+            evaluate_classifier(
+                search.best_estimator_, X_train, X_test, y_train, y_test
+            )
+        )
+        print(
+            f"Train accuracy: {result['train_accuracy']:.4f} | "
+            f"Test accuracy: {result['test_accuracy']:.4f}"
+        )
+
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def save_model(result: dict, models_dir) -> str:
+    """Sauvegarde le Pipeline entrainé et les colonnes qu'il attend."""
+    os.makedirs(models_dir, exist_ok=True)
+    # Le cache joblib ne sert qu'à l'entrainement
+    result["model"].set_params(memory=None)
+    model_path = os.path.join(models_dir, f"{result['name']}.joblib")
+    joblib.dump(
+        {
+            "name": result["name"],
+            "target": result["target"],
+            "features": result["features"],
+            "model": result["model"],
+        },
+        model_path,
+    )
+    return model_path
+
+
+def load_model(model_path) -> dict:
+    return joblib.load(model_path)
+
+
+def run_training_phases(
+    df: pd.DataFrame,
+    phases=None,
+    search_type="grid",
+    n_jobs=-1,
+    cache_dir=None,
+    models_dir=None,
+    phases_config=TRAINING_PHASES,
+) -> dict:
+    """
+    Lance les phases demandées dans l'ordre, retourne {phase: résultats}.
+    Avec models_dir, le meilleur Pipeline de chaque expérience y est sauvegardé.
+    """
+    memory = Memory(location=cache_dir, verbose=0) if cache_dir else None
+    phases = phases or list(phases_config)
+
+    results = {}
+    timings = []
+    for phase in phases:
+        start = time.perf_counter()
+        print(f"\n===== Phase {phase} =====")
+        results[phase] = [
+            run_experiment(df, experiment, search_type, n_jobs, memory)
+            for experiment in phases_config[phase]
+        ]
+        timings.append((phase, time.perf_counter() - start))
+
+        if models_dir is not None:
+            for result in results[phase]:
+                print(f"Modèle sauvegardé: {save_model(result, models_dir)}")
+
+    print("\n===== Temps par phase =====")
+    for phase, seconds in timings:
+        print(f"Phase {phase:5s} {seconds:9.1f}s")
+        for result in results[phase]:
+            score = result.get("test_accuracy", result.get("r2"))
+            metric = "test_accuracy" if "test_accuracy" in result else "r2"
+            print(
+                f"  {result['name']:32s} {metric} {score:.4f} "
+                f"{result['seconds']:8.1f}s"
+            )
+    print(f"Total {np.sum([seconds for _, seconds in timings]):.1f}s")
+
+    return results
+
+
+def train_models(
+    data_path=None,
+    phases=None,
+    search_type="grid",
+    n_jobs=-1,
+    use_cache=True,
+    save_models=False,
+):
+    results = None
+    try:
+        if data_path is None:
+            data_path = os.path.join(Path.cwd(), FEATURED_DATASET_FILE)
+        df = pd.read_csv(data_path)
+
+        cache_dir = None
+        if use_cache:
+            cache_dir = os.path.join(Path.cwd(), TRAINING_CACHE_DIR)
+
+        results = run_training_phases(
+            df,
+            phases=phases,
+            search_type=search_type,
+            n_jobs=n_jobs,
+            cache_dir=cache_dir,
+            models_dir=os.path.join(Path.cwd(), MODELS_DIR) if save_models else None,
+        )
+    except Exception as e:
+        print(f"Error when training models {e}")
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data", default=None)
+    parser.add_argument(
+        "--phases", nargs="+", choices=list(TRAINING_PHASES), default=None
+    )
+    parser.add_argument("--search", choices=["grid", "halving"], default="grid")
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--save-models", action="store_true")
+    args = parser.parse_args()
+    train_models(
+        args.data,
+        phases=args.phases,
+        search_type=args.search,
+        n_jobs=args.n_jobs,
+        use_cache=not args.no_cache,
+        save_models=args.save_models,
+    )